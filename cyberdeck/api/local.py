@@ -1,5 +1,6 @@
 ﻿import asyncio
 import ipaddress
+import json
 import os
 import re
 import time
@@ -9,6 +10,7 @@ from typing import Any, Dict, Optional
 
 import psutil
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from .. import config
@@ -274,6 +276,40 @@ def local_events_feed(request: Request, since_id: int = 0, limit: int = 100):
     }
 
 
+_EVENT_STREAM_KEEPALIVE_S = 10.0
+
+
+@router.get("/api/local/events/stream")
+def local_events_stream(request: Request, since_id: int = -1):
+    """Push local events as Server-Sent Events; negative `since_id` starts at the newest event."""
+    _require_localhost(request)
+    cursor = int(since_id) if int(since_id) >= 0 else local_events.latest_id()
+
+    async def _gen() -> Any:
+        """Yield SSE frames as events arrive until the client leaves or the server stops streams."""
+        last = cursor
+        yield b": connected\n\n"
+        while local_events.streams_open() and not await request.is_disconnected():
+            out = await asyncio.to_thread(local_events.wait_after, last, timeout=_EVENT_STREAM_KEEPALIVE_S)
+            if not local_events.streams_open():
+                break
+            events = out.get("events", [])
+            if not events:
+                yield b": keepalive\n\n"
+                continue
+            chunk = []
+            for evt in events:
+                last = max(last, int(evt.get("id") or 0))
+                chunk.append(f"id: {last}\ndata: {json.dumps(evt, separators=(',', ':'))}\n\n")
+            yield "".join(chunk).encode("utf-8")
+
+    return StreamingResponse(
+        _gen(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/api/local/pending_devices")
 def local_pending_devices(request: Request):
     """Return device sessions waiting for local approval."""
@@ -681,7 +717,17 @@ def local_panic_mode(req: LocalPanicRequest, request: Request):
         message=f"Panic mode executed: revoked={revoked}",
         payload={"revoked": int(revoked), "kept": keep or None, "security": security},
     )
-    return {"ok": True, "revoked": int(revoked), "kept": keep or None, "security": security}
+    # Ship the post-revoke device lists so the launcher can redraw without a follow-up /info.
+    return {
+        "ok": True,
+        "revoked": int(revoked),
+        "kept": keep or None,
+        "security": security,
+        "devices": device_manager.get_all_devices(),
+        "pending_devices": (
+            device_manager.get_pending_devices() if hasattr(device_manager, "get_pending_devices") else []
+        ),
+    }
 
 
 @router.get("/api/local/diag_bundle")
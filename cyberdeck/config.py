@@ -202,6 +202,16 @@ def _default_log_file(data_dir: str) -> str:
         return os.path.join(os.path.expanduser("~"), "Library", "Logs", "CyberDeck", "cyberdeck.log")
     return os.path.join(str(data_dir or "").strip(), "cyberdeck.log")
 
+
+def _default_local_socket(data_dir: str) -> str:
+    """Return default Unix socket path for launcher-to-server traffic ("" where unsupported)."""
+    if os.name == "nt" or not hasattr(socket, "AF_UNIX"):
+        return ""
+    path = os.path.join(str(data_dir or "").strip(), "local-api.sock")
+    # sun_path is limited to ~104-108 bytes depending on the OS.
+    return path if len(path.encode("utf-8")) < 100 else ""
+
+
 _MODULE_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _RESOURCE_DIR_ENV = str(os.environ.get("CYBERDECK_RESOURCE_DIR", "") or "").strip()
 RESOURCE_DIR = _RESOURCE_DIR_ENV or _MODULE_BASE_DIR
@@ -216,6 +226,7 @@ FILES_DIR = _resolve_path(_FILES_DIR_ENV, _DEFAULT_FILES_DIR)
 _LOG_FILE_ENV = str(os.environ.get("CYBERDECK_LOG_FILE", "") or "").strip()
 LOG_FILE = _resolve_path(_LOG_FILE_ENV, _default_log_file(DATA_DIR))
 SESSION_FILE = os.path.join(DATA_DIR, "cyberdeck_sessions.json")
+LOCAL_SOCKET = str(os.environ.get("CYBERDECK_LOCAL_SOCKET", _default_local_socket(DATA_DIR)) or "").strip()
 STATIC_DIR = os.path.join(RESOURCE_DIR, "static")
 
 if not os.path.exists(DATA_DIR):
@@ -253,7 +264,7 @@ def reload_from_env() -> None:
     global TLS_CERT, TLS_KEY, TLS_ENABLED, SCHEME
     global PIN_STATE_STALE_S, PIN_STATE_MAX_IPS
     global QR_TOKEN_TTL_S, UPLOAD_MAX_BYTES, UPLOAD_ALLOWED_EXT, TRANSFER_SCHEME
-    global DATA_DIR, FILES_DIR, SESSION_FILE, LOG_FILE
+    global DATA_DIR, FILES_DIR, SESSION_FILE, LOG_FILE, LOCAL_SOCKET
 
     PORT = _env_int("CYBERDECK_PORT", PORT)
     PORT_AUTO = _env_bool("CYBERDECK_PORT_AUTO", PORT_AUTO)
@@ -335,6 +346,7 @@ def reload_from_env() -> None:
     FILES_DIR = _resolve_path(os.environ.get("CYBERDECK_FILES_DIR", FILES_DIR), FILES_DIR)
     LOG_FILE = _resolve_path(os.environ.get("CYBERDECK_LOG_FILE", ""), _default_log_file(DATA_DIR))
     SESSION_FILE = os.path.join(DATA_DIR, "cyberdeck_sessions.json")
+    LOCAL_SOCKET = str(os.environ.get("CYBERDECK_LOCAL_SOCKET", _default_local_socket(DATA_DIR)) or "").strip()
     if not os.path.exists(DATA_DIR):
         os.makedirs(DATA_DIR, exist_ok=True)
     if not os.path.exists(FILES_DIR):
@@ -19,9 +19,11 @@ class LocalEventStore:
 
     def __init__(self) -> None:
         self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
         self._events: list[dict] = []
         self._next_id = 1
         self._max_events = 512
+        self._streams_open = True
 
     def emit(self, event_type: str, *, title: str = "", message: str = "", payload: Optional[dict] = None) -> int:
         """Append a local event and return assigned event id."""
@@ -41,6 +43,7 @@ class LocalEventStore:
                 cut = len(self._events) - self._max_events
                 if cut > 0:
                     self._events = self._events[cut:]
+            self._changed.notify_all()
             return int(evt["id"])
 
     def list_after(self, last_id: int, *, limit: int = 100) -> dict:
@@ -56,6 +59,37 @@ class LocalEventStore:
             latest = int(self._events[-1]["id"]) if self._events else cursor
         return {"events": rows, "latest_id": latest}
 
+    def latest_id(self) -> int:
+        """Return id of the newest retained event (0 when empty)."""
+        with self._lock:
+            return int(self._events[-1]["id"]) if self._events else 0
+
+    def wait_after(self, last_id: int, *, timeout: float, limit: int = 100) -> dict:
+        """Block up to `timeout` seconds for events newer than `last_id`, then list them."""
+        cursor = int(last_id or 0)
+        with self._changed:
+            self._changed.wait_for(
+                lambda: not self._streams_open or (bool(self._events) and int(self._events[-1]["id"]) > cursor),
+                timeout=max(0.0, float(timeout)),
+            )
+            return self.list_after(cursor, limit=limit)
+
+    def streams_open(self) -> bool:
+        """Return False once `close_streams` asked live event streams to end."""
+        with self._lock:
+            return bool(self._streams_open)
+
+    def close_streams(self) -> None:
+        """End live event streams so a stopping server can drain its connections."""
+        with self._lock:
+            self._streams_open = False
+            self._changed.notify_all()
+
+    def open_streams(self) -> None:
+        """Allow event streams again; called when a server starts serving."""
+        with self._lock:
+            self._streams_open = True
+
 
 local_events = LocalEventStore()
 
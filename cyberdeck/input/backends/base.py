@@ -1,11 +1,13 @@
 """Shared base contracts and helpers for platform-specific input backends."""
 
+import functools
 import os
 from typing import Optional, Tuple
 
 
+@functools.lru_cache(maxsize=1)
 def _session_kind() -> str:
-    """Detect the active desktop session kind."""
+    """Detect the active desktop session kind (cached for the process lifetime)."""
     if os.name == "nt":
         return "windows"
     xdg_type = (os.environ.get("XDG_SESSION_TYPE") or "").strip().lower()
@@ -26,6 +28,13 @@ class _BaseInputBackend:
     can_keyboard = False
     can_position = False
     can_screen_size = False
+    # Public methods that have an unguarded `_<name>_loaded` twin.
+    _FAST_PATHS: Tuple[str, ...] = ()
+
+    def _bind_loaded_fast_paths(self) -> None:
+        """Shadow guarded public methods with their loaded-state variants."""
+        for name in self._FAST_PATHS:
+            setattr(self, name, getattr(self, f"_{name}_loaded"))
 
     def configure(self) -> None:
         """Configure the target operation."""
@@ -43,6 +52,10 @@ class _BaseInputBackend:
         """Move the pointer by relative delta."""
         return False
 
+    def flush(self) -> None:
+        """Emit any input the backend is still batching."""
+        pass
+
     def click(self, button: str = "left", double: bool = False) -> bool:
         """Dispatch a mouse click through the active backend."""
         return False
@@ -1,12 +1,19 @@
 """Linux-focused input backend implementations (X11 and Wayland)."""
 
+import os
 import shutil
+import struct
 import subprocess
+import threading
+import time
 from typing import Optional, Tuple
 
 from .base import _BaseInputBackend
 from ...logging_config import log
 
+# Kernel `struct input_event`: timeval (ignored by uinput), type, code, value.
+_EVENT_STRUCT = struct.Struct("llHHi")
+
 
 class _X11Backend(_BaseInputBackend):
     """Implement input through pynput for X11 sessions."""
@@ -16,6 +23,37 @@ class _X11Backend(_BaseInputBackend):
     can_keyboard = True
     can_position = True
     can_screen_size = True
+    _FAST_PATHS = ("move_rel", "click", "scroll", "mouse_down", "mouse_up")
+    # Cursor streaming polls screen size every frame; resolution changes are rare.
+    _SCREEN_SIZE_TTL_S = 2.0
+    _KEY_ALIASES = {
+        "enter": "enter",
+        "backspace": "backspace",
+        "space": "space",
+        "winleft": "cmd",
+        "win": "cmd",
+        "playpause": "media_play_pause",
+        "nexttrack": "media_next",
+        "prevtrack": "media_previous",
+        "stop": "media_stop",
+        "volumemute": "media_volume_mute",
+        "volumeup": "media_volume_up",
+        "volumedown": "media_volume_down",
+        "ctrl": "ctrl",
+        "alt": "alt",
+        "shift": "shift",
+        "tab": "tab",
+        "esc": "esc",
+        "delete": "delete",
+        "home": "home",
+        "end": "end",
+        "pageup": "page_up",
+        "pagedown": "page_down",
+        "up": "up",
+        "down": "down",
+        "left": "left",
+        "right": "right",
+    }
 
     def __init__(self) -> None:
         """Initialize backend state and lazy import sentinels."""
@@ -24,6 +62,8 @@ class _X11Backend(_BaseInputBackend):
         self._button = None
         self._key = None
         self._loaded = False
+        self._resolved_keys: dict = {}
+        self._screen_cache: tuple[float, Optional[Tuple[int, int]]] = (0.0, None)
 
     def _ensure(self) -> bool:
         """Lazy-load `pynput` once and report backend readiness."""
@@ -37,6 +77,12 @@ class _X11Backend(_BaseInputBackend):
             self._keyboard = keyboard.Controller()
             self._button = mouse.Button
             self._key = keyboard.Key
+            self._resolved_keys = {
+                alias: getattr(self._key, target)
+                for alias, target in self._KEY_ALIASES.items()
+                if hasattr(self._key, target)
+            }
+            self._bind_loaded_fast_paths()
             return True
         except Exception as error:
             log.warning("X11 backend init failed (pynput): %s", error)
@@ -47,42 +93,7 @@ class _X11Backend(_BaseInputBackend):
     def _key_obj(self, key: str):
         """Resolve a pynput key object from a key descriptor."""
         key = str(key or "").strip().lower()
-        key_map = {
-            "enter": "enter",
-            "backspace": "backspace",
-            "space": "space",
-            "winleft": "cmd",
-            "win": "cmd",
-            "playpause": "media_play_pause",
-            "nexttrack": "media_next",
-            "prevtrack": "media_previous",
-            "stop": "media_stop",
-            "volumemute": "media_volume_mute",
-            "volumeup": "media_volume_up",
-            "volumedown": "media_volume_down",
-            "ctrl": "ctrl",
-            "alt": "alt",
-            "shift": "shift",
-            "tab": "tab",
-            "esc": "esc",
-            "delete": "delete",
-            "home": "home",
-            "end": "end",
-            "pageup": "page_up",
-            "pagedown": "page_down",
-            "up": "up",
-            "down": "down",
-            "left": "left",
-            "right": "right",
-        }
-        if not self._key:
-            return key
-        named = key_map.get(key)
-        if named and hasattr(self._key, named):
-            return getattr(self._key, named)
-        if len(key) == 1:
-            return key
-        return key
+        return self._resolved_keys.get(key, key)
 
     def position(self) -> Optional[Tuple[int, int]]:
         """Return the current pointer position."""
@@ -93,6 +104,35 @@ class _X11Backend(_BaseInputBackend):
 
     def screen_size(self) -> Optional[Tuple[int, int]]:
         """Return the active screen size in pixels."""
+        now = time.monotonic()
+        cached_ts, cached = self._screen_cache
+        if cached is not None and (now - cached_ts) < self._SCREEN_SIZE_TTL_S:
+            return cached
+        size = self._screen_size_xlib() or self._screen_size_xrandr()
+        self._screen_cache = (now, size)
+        return size
+
+    @staticmethod
+    def _screen_size_xlib() -> Optional[Tuple[int, int]]:
+        """Read root screen size over the X connection (python-xlib ships with pynput)."""
+        try:
+            from Xlib import display as xdisplay
+
+            dpy = xdisplay.Display()
+            try:
+                screen = dpy.screen()
+                width, height = int(screen.width_in_pixels), int(screen.height_in_pixels)
+            finally:
+                dpy.close()
+            if width > 0 and height > 0:
+                return width, height
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _screen_size_xrandr() -> Optional[Tuple[int, int]]:
+        """Parse current screen size from `xrandr` output."""
         try:
             out = subprocess.run(
                 ["xrandr", "--current"],
@@ -115,6 +155,10 @@ class _X11Backend(_BaseInputBackend):
         """Move the pointer by relative delta."""
         if not self._ensure():
             return False
+        return self._move_rel_loaded(dx, dy)
+
+    def _move_rel_loaded(self, dx: int, dy: int) -> bool:
+        """Move the pointer assuming `pynput` controllers are ready."""
         x, y = self._mouse.position
         self._mouse.position = (int(x) + int(dx), int(y) + int(dy))
         return True
@@ -123,6 +167,10 @@ class _X11Backend(_BaseInputBackend):
         """Dispatch a mouse click through the active backend."""
         if not self._ensure():
             return False
+        return self._click_loaded(button, double)
+
+    def _click_loaded(self, button: str = "left", double: bool = False) -> bool:
+        """Dispatch a mouse click assuming `pynput` controllers are ready."""
         btn = self._button.left if button != "right" else self._button.right
         cnt = 2 if double else 1
         self._mouse.click(btn, cnt)
@@ -132,6 +180,10 @@ class _X11Backend(_BaseInputBackend):
         """Dispatch a mouse scroll event through the active backend."""
         if not self._ensure():
             return False
+        return self._scroll_loaded(dy)
+
+    def _scroll_loaded(self, dy: int) -> bool:
+        """Dispatch a mouse scroll assuming `pynput` controllers are ready."""
         self._mouse.scroll(0, int(dy))
         return True
 
@@ -139,6 +191,10 @@ class _X11Backend(_BaseInputBackend):
         """Press and hold the requested mouse button."""
         if not self._ensure():
             return False
+        return self._mouse_down_loaded(button)
+
+    def _mouse_down_loaded(self, button: str = "left") -> bool:
+        """Press a mouse button assuming `pynput` controllers are ready."""
         btn = self._button.left if button != "right" else self._button.right
         self._mouse.press(btn)
         return True
@@ -147,6 +203,10 @@ class _X11Backend(_BaseInputBackend):
         """Release the requested mouse button."""
         if not self._ensure():
             return False
+        return self._mouse_up_loaded(button)
+
+    def _mouse_up_loaded(self, button: str = "left") -> bool:
+        """Release a mouse button assuming `pynput` controllers are ready."""
         btn = self._button.left if button != "right" else self._button.right
         self._mouse.release(btn)
         return True
@@ -194,6 +254,9 @@ class _WaylandBackend(_BaseInputBackend):
     can_keyboard = True
     can_position = False
     can_screen_size = False
+    # Pointer deltas arriving within this window are merged into one REL burst.
+    _MOVE_COALESCE_S = 0.005
+    _FAST_PATHS = ("move_rel", "click", "scroll", "mouse_down", "mouse_up")
 
     def __init__(self) -> None:
         """Initialize backend state and lazy import sentinels."""
@@ -201,6 +264,11 @@ class _WaylandBackend(_BaseInputBackend):
         self._ui_mouse = None
         self._ui_keyboard = None
         self._e = None
+        self._move_lock = threading.Lock()
+        self._move_wakeup = threading.Event()
+        self._pending_dx = 0
+        self._pending_dy = 0
+        self._move_thread: Optional[threading.Thread] = None
 
     def _ensure(self) -> bool:
         """Lazy-load `evdev` and virtual input devices once."""
@@ -306,6 +374,8 @@ class _WaylandBackend(_BaseInputBackend):
 
             self._ui_keyboard = UInput(events={e.EV_KEY: key_codes}, name="CyberDeck Virtual Keyboard")
             self._e = e
+            self._start_move_worker()
+            self._bind_loaded_fast_paths()
             return True
         except Exception as error:
             log.warning("Wayland backend init failed (evdev): %s", error)
@@ -314,16 +384,79 @@ class _WaylandBackend(_BaseInputBackend):
             self._e = None
             return False
 
+    def _start_move_worker(self) -> None:
+        """Start the timer thread that flushes pending pointer deltas."""
+        if self._move_thread is not None:
+            return
+        try:
+            worker = threading.Thread(target=self._move_worker, name="cyberdeck-wayland-move", daemon=True)
+            worker.start()
+            self._move_thread = worker
+        except Exception as error:
+            log.warning("Wayland move coalescer unavailable, using direct writes: %s", error)
+            self._move_thread = None
+
+    def _move_worker(self) -> None:
+        """Flush accumulated motion once per coalescing window after the first delta."""
+        while True:
+            self._move_wakeup.wait()
+            time.sleep(self._MOVE_COALESCE_S)
+            self._move_wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                log.debug("Wayland coalesced move write failed", exc_info=True)
+
+    def _submit(self, ui, events: list[tuple[int, int, int]]) -> None:
+        """Write a burst of events ending with SYN_REPORT using one `write(2)`."""
+        e = self._e
+        events.append((e.EV_SYN, e.SYN_REPORT, 0))
+        fd = getattr(ui, "fd", None)
+        if isinstance(fd, int) and fd >= 0:
+            pack = _EVENT_STRUCT.pack
+            try:
+                os.write(fd, b"".join([pack(0, 0, etype, code, value) for etype, code, value in events]))
+                return
+            except OSError:
+                pass
+        for etype, code, value in events:
+            if etype == e.EV_SYN:
+                ui.syn()
+            else:
+                ui.write(etype, code, value)
+
+    def _emit_rel(self, dx: int, dy: int) -> None:
+        """Write one relative pointer motion followed by a single sync report."""
+        ui = self._ui_mouse
+        if ui is None or not (dx or dy):
+            return
+        events = []
+        if dx:
+            events.append((self._e.EV_REL, self._e.REL_X, dx))
+        if dy:
+            events.append((self._e.EV_REL, self._e.REL_Y, dy))
+        self._submit(ui, events)
+
+    def flush(self) -> None:
+        """Write pending coalesced motion now, from the calling thread."""
+        with self._move_lock:
+            dx = self._pending_dx
+            dy = self._pending_dy
+            if not (dx or dy):
+                return
+            self._pending_dx = 0
+            self._pending_dy = 0
+            self._emit_rel(dx, dy)
+
     def _tap(self, code: int, *, mouse: bool = False) -> bool:
         """Send a single tap event for the given key code."""
         if not self._ensure():
             return False
+        self.flush()
         ui = self._ui_mouse if mouse else self._ui_keyboard
         if ui is None:
             return False
-        ui.write(self._e.EV_KEY, code, 1)
-        ui.write(self._e.EV_KEY, code, 0)
-        ui.syn()
+        self._submit(ui, [(self._e.EV_KEY, code, 1), (self._e.EV_KEY, code, 0)])
         return True
 
     def _key_code(self, key: str) -> Optional[int]:
@@ -412,22 +545,33 @@ class _WaylandBackend(_BaseInputBackend):
         """Move the pointer by relative delta."""
         if not self._ensure():
             return False
-        ui = self._ui_mouse
-        if ui is None:
-            return False
+        return self._move_rel_loaded(dx, dy)
+
+    def _move_rel_loaded(self, dx: int, dy: int) -> bool:
+        """Queue or write relative motion assuming virtual devices are ready."""
         mx = int(dx)
         my = int(dy)
         if not (mx or my):
             return True
-        ui.write(self._e.EV_REL, self._e.REL_X, mx)
-        ui.write(self._e.EV_REL, self._e.REL_Y, my)
-        ui.syn()
+        if self._move_thread is None:
+            self._emit_rel(mx, my)
+            return True
+        with self._move_lock:
+            idle = not (self._pending_dx or self._pending_dy)
+            self._pending_dx += mx
+            self._pending_dy += my
+        if idle:
+            self._move_wakeup.set()
         return True
 
     def click(self, button: str = "left", double: bool = False) -> bool:
         """Dispatch a mouse click through the active backend."""
         if not self._ensure():
             return False
+        return self._click_loaded(button, double)
+
+    def _click_loaded(self, button: str = "left", double: bool = False) -> bool:
+        """Dispatch a mouse click assuming virtual devices are ready."""
         code = self._e.BTN_LEFT if button != "right" else self._e.BTN_RIGHT
         count = 2 if double else 1
         for _ in range(count):
@@ -438,38 +582,44 @@ class _WaylandBackend(_BaseInputBackend):
         """Dispatch a mouse scroll event through the active backend."""
         if not self._ensure():
             return False
-        ui = self._ui_mouse
-        if ui is None:
-            return False
+        return self._scroll_loaded(dy)
+
+    def _scroll_loaded(self, dy: int) -> bool:
+        """Dispatch a mouse scroll assuming virtual devices are ready."""
         val = int(dy)
         if val == 0:
             return True
-        ui.write(self._e.EV_REL, self._e.REL_WHEEL, val)
-        ui.syn()
+        ui = self._ui_mouse
+        self.flush()
+        self._submit(ui, [(self._e.EV_REL, self._e.REL_WHEEL, val)])
         return True
 
     def mouse_down(self, button: str = "left") -> bool:
         """Press and hold the requested mouse button."""
         if not self._ensure():
             return False
+        return self._mouse_down_loaded(button)
+
+    def _mouse_down_loaded(self, button: str = "left") -> bool:
+        """Press a mouse button assuming virtual devices are ready."""
         ui = self._ui_mouse
-        if ui is None:
-            return False
         code = self._e.BTN_LEFT if button != "right" else self._e.BTN_RIGHT
-        ui.write(self._e.EV_KEY, code, 1)
-        ui.syn()
+        self.flush()
+        self._submit(ui, [(self._e.EV_KEY, code, 1)])
         return True
 
     def mouse_up(self, button: str = "left") -> bool:
         """Release the requested mouse button."""
         if not self._ensure():
             return False
+        return self._mouse_up_loaded(button)
+
+    def _mouse_up_loaded(self, button: str = "left") -> bool:
+        """Release a mouse button assuming virtual devices are ready."""
         ui = self._ui_mouse
-        if ui is None:
-            return False
         code = self._e.BTN_LEFT if button != "right" else self._e.BTN_RIGHT
-        ui.write(self._e.EV_KEY, code, 0)
-        ui.syn()
+        self.flush()
+        self._submit(ui, [(self._e.EV_KEY, code, 0)])
         return True
 
     def write_text(self, text: str) -> bool:
@@ -495,14 +645,21 @@ class _WaylandBackend(_BaseInputBackend):
                 return False
             seq.append((code, need_shift))
 
+        ev_key = self._e.EV_KEY
+        shift = self._e.KEY_LEFTSHIFT
+        syn = (self._e.EV_SYN, self._e.SYN_REPORT, 0)
+        events = []
         for code, need_shift in seq:
             if need_shift:
-                ui.write(self._e.EV_KEY, self._e.KEY_LEFTSHIFT, 1)
-            ui.write(self._e.EV_KEY, code, 1)
-            ui.write(self._e.EV_KEY, code, 0)
+                events.append((ev_key, shift, 1))
+            events.append((ev_key, code, 1))
+            events.append((ev_key, code, 0))
             if need_shift:
-                ui.write(self._e.EV_KEY, self._e.KEY_LEFTSHIFT, 0)
-            ui.syn()
+                events.append((ev_key, shift, 0))
+            events.append(syn)
+        # Each character keeps its own sync report; the final one is added by _submit.
+        events.pop()
+        self._submit(ui, events)
         return True
 
     def press(self, key: str) -> bool:
@@ -523,10 +680,10 @@ class _WaylandBackend(_BaseInputBackend):
         seq = [x for x in seq if x is not None]
         if not seq:
             return False
-        for code in seq:
-            ui.write(self._e.EV_KEY, code, 1)
-        ui.syn()
-        for code in reversed(seq):
-            ui.write(self._e.EV_KEY, code, 0)
-        ui.syn()
+        self.flush()
+        ev_key = self._e.EV_KEY
+        events = [(ev_key, code, 1) for code in seq]
+        events.append((self._e.EV_SYN, self._e.SYN_REPORT, 0))
+        events.extend((ev_key, code, 0) for code in reversed(seq))
+        self._submit(ui, events)
         return True
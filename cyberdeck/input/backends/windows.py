@@ -18,6 +18,34 @@ _MOUSEEVENTF_WHEEL = 0x0800
 _SM_CXSCREEN = 0
 _SM_CYSCREEN = 1
 _WHEEL_DELTA = 120
+_INPUT_MOUSE = 0
+
+
+class _Point(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
+
+
+class _MouseInput(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_long),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _InputUnion(ctypes.Union):
+    # MOUSEINPUT is the largest member, so the union keeps the native INPUT size.
+    _fields_ = [("mi", _MouseInput)]
+
+
+class _Input(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("u", _InputUnion)]
+
+
+_INPUT_SIZE = ctypes.sizeof(_Input)
 
 
 class _PyAutoGuiBackend(_BaseInputBackend):
@@ -28,10 +56,12 @@ class _PyAutoGuiBackend(_BaseInputBackend):
     can_keyboard = True
     can_position = True
     can_screen_size = True
+    _FAST_PATHS = ("move_rel", "click", "scroll", "mouse_down", "mouse_up")
 
     def __init__(self) -> None:
         """Initialize backend state and lazy import sentinels."""
         self._pg = None
+        self._pg_impl = None
         self._loaded = False
         self._user32 = None
         self._win_loaded = False
@@ -45,6 +75,9 @@ class _PyAutoGuiBackend(_BaseInputBackend):
             import pyautogui  # noqa: PLC0415
 
             self._pg = pyautogui
+            # Platform primitives skip the public pause/failsafe decorators.
+            self._pg_impl = getattr(pyautogui, "platformModule", None)
+            self._bind_loaded_fast_paths()
             return True
         except Exception as error:
             log.warning("PyAutoGUI backend init failed: %s", error)
@@ -76,16 +109,43 @@ class _PyAutoGuiBackend(_BaseInputBackend):
             return (_MOUSEEVENTF_MIDDLEDOWN, _MOUSEEVENTF_MIDDLEUP)
         return (_MOUSEEVENTF_LEFTDOWN, _MOUSEEVENTF_LEFTUP)
 
+    def _send_mouse_input(self, events: Tuple[Tuple[int, int], ...]) -> bool:
+        """Submit `(flags, data)` mouse events with one `SendInput` call."""
+        count = len(events)
+        batch = (_Input * count)()
+        for item, (flags, data) in zip(batch, events):
+            item.type = _INPUT_MOUSE
+            item.u.mi.dwFlags = int(flags)
+            item.u.mi.mouseData = int(data)
+        try:
+            return int(self._user32.SendInput(count, batch, _INPUT_SIZE)) == count
+        except Exception:
+            return False
+
     def _mouse_event(self, flags: int, data: int = 0) -> bool:
         """Dispatch a low-level mouse event through WinAPI."""
         if not self._ensure_winapi():
             return False
+        if self._send_mouse_input(((flags, data),)):
+            return True
         try:
             self._user32.mouse_event(int(flags), 0, 0, int(data), 0)
             return True
         except Exception:
             return False
 
+    def _pg_primitive_button(self, name: str, button: str) -> bool:
+        """Press or release a button via the pyautogui platform module at the current position."""
+        impl = self._pg_impl
+        if impl is None:
+            return False
+        try:
+            x, y = impl._position()
+            getattr(impl, name)(x, y, button)
+            return True
+        except Exception:
+            return False
+
     def configure(self) -> None:
         """Disable failsafe/pause to keep remote input responsive."""
         if self._ensure():
@@ -93,20 +153,11 @@ class _PyAutoGuiBackend(_BaseInputBackend):
             self._pg.PAUSE = 0
         self._ensure_winapi()
 
-    def position(self) -> Optional[Tuple[int, int]]:
-        """Return the current pointer position."""
-        if self._ensure():
-            try:
-                x, y = self._pg.position()
-                return int(x), int(y)
-            except Exception:
-                pass
+    def _cursor_pos_winapi(self) -> Optional[Tuple[int, int]]:
+        """Read pointer position directly through `GetCursorPos`."""
         if not self._ensure_winapi():
             return None
         try:
-            class _Point(ctypes.Structure):
-                _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
-
             pt = _Point()
             ok = self._user32.GetCursorPos(ctypes.byref(pt))
             if not ok:
@@ -115,6 +166,19 @@ class _PyAutoGuiBackend(_BaseInputBackend):
         except Exception:
             return None
 
+    def position(self) -> Optional[Tuple[int, int]]:
+        """Return the current pointer position."""
+        pos = self._cursor_pos_winapi()
+        if pos is not None:
+            return pos
+        if self._ensure():
+            try:
+                x, y = self._pg.position()
+                return int(x), int(y)
+            except Exception:
+                pass
+        return None
+
     def screen_size(self) -> Optional[Tuple[int, int]]:
         """Return the active screen size in pixels."""
         if self._ensure():
@@ -137,11 +201,29 @@ class _PyAutoGuiBackend(_BaseInputBackend):
     def move_rel(self, dx: int, dy: int) -> bool:
         """Move the pointer by relative delta."""
         if self._ensure():
+            return self._move_rel_loaded(dx, dy)
+        return self._move_rel_winapi(dx, dy)
+
+    def _move_rel_loaded(self, dx: int, dy: int) -> bool:
+        """Move the pointer through WinAPI, falling back to `pyautogui`."""
+        if self._user32 is not None and self._move_rel_winapi(dx, dy):
+            return True
+        impl = self._pg_impl
+        if impl is not None:
             try:
-                self._pg.moveRel(int(dx), int(dy), _pause=False)
+                x, y = impl._position()
+                impl._moveTo(int(x) + int(dx), int(y) + int(dy))
                 return True
             except Exception:
                 pass
+        try:
+            self._pg.moveRel(int(dx), int(dy), _pause=False)
+            return True
+        except Exception:
+            return False
+
+    def _move_rel_winapi(self, dx: int, dy: int) -> bool:
+        """Move the pointer with WinAPI `SetCursorPos`."""
         if not self._ensure_winapi():
             return False
         pos = self.position()
@@ -155,20 +237,44 @@ class _PyAutoGuiBackend(_BaseInputBackend):
     def click(self, button: str = "left", double: bool = False) -> bool:
         """Dispatch a mouse click through the active backend."""
         if self._ensure():
+            return self._click_loaded(button, double)
+        return self._click_winapi(button, double)
+
+    def _click_loaded(self, button: str = "left", double: bool = False) -> bool:
+        """Dispatch a mouse click through WinAPI, falling back to `pyautogui`."""
+        if self._user32 is not None and self._click_winapi(button, double):
+            return True
+        impl = self._pg_impl
+        if impl is not None:
             try:
-                if double:
-                    if button == "left":
-                        self._pg.doubleClick(_pause=False)
-                    else:
-                        self._pg.click(button=button, clicks=2, _pause=False)
-                    return True
-                self._pg.click(button=button, _pause=False)
+                x, y = impl._position()
+                for _ in range(2 if double else 1):
+                    impl._mouseDown(x, y, button)
+                    impl._mouseUp(x, y, button)
                 return True
             except Exception:
                 pass
+        try:
+            if double:
+                if button == "left":
+                    self._pg.doubleClick(_pause=False)
+                else:
+                    self._pg.click(button=button, clicks=2, _pause=False)
+                return True
+            self._pg.click(button=button, _pause=False)
+            return True
+        except Exception:
+            return False
 
+    def _click_winapi(self, button: str = "left", double: bool = False) -> bool:
+        """Dispatch a mouse click with WinAPI down/up events."""
+        if not self._ensure_winapi():
+            return False
         down_flag, up_flag = self._mouse_button_flags(button)
         count = 2 if bool(double) else 1
+        # Down/up pairs go out in a single SendInput call when available.
+        if self._send_mouse_input(((down_flag, 0), (up_flag, 0)) * count):
+            return True
         ok = True
         for _ in range(count):
             ok = self._mouse_event(down_flag) and self._mouse_event(up_flag) and ok
@@ -177,11 +283,28 @@ class _PyAutoGuiBackend(_BaseInputBackend):
     def scroll(self, dy: int) -> bool:
         """Dispatch a mouse scroll event through the active backend."""
         if self._ensure():
+            return self._scroll_loaded(dy)
+        return self._scroll_winapi(dy)
+
+    def _scroll_loaded(self, dy: int) -> bool:
+        """Dispatch a mouse scroll through WinAPI, falling back to `pyautogui`."""
+        if self._user32 is not None and self._scroll_winapi(dy):
+            return True
+        impl = self._pg_impl
+        if impl is not None:
             try:
-                self._pg.scroll(int(dy), _pause=False)
+                impl._scroll(int(dy))
                 return True
             except Exception:
                 pass
+        try:
+            self._pg.scroll(int(dy), _pause=False)
+            return True
+        except Exception:
+            return False
+
+    def _scroll_winapi(self, dy: int) -> bool:
+        """Dispatch a mouse wheel event with WinAPI."""
         steps = int(dy)
         if steps == 0:
             return True
@@ -190,24 +313,38 @@ class _PyAutoGuiBackend(_BaseInputBackend):
     def mouse_down(self, button: str = "left") -> bool:
         """Press and hold the requested mouse button."""
         if self._ensure():
-            try:
-                self._pg.mouseDown(button=button, _pause=False)
-                return True
-            except Exception:
-                pass
-        down_flag, _ = self._mouse_button_flags(button)
-        return self._mouse_event(down_flag)
+            return self._mouse_down_loaded(button)
+        return self._mouse_event(self._mouse_button_flags(button)[0])
+
+    def _mouse_down_loaded(self, button: str = "left") -> bool:
+        """Press a mouse button through WinAPI, falling back to `pyautogui`."""
+        if self._user32 is not None and self._mouse_event(self._mouse_button_flags(button)[0]):
+            return True
+        if self._pg_primitive_button("_mouseDown", button):
+            return True
+        try:
+            self._pg.mouseDown(button=button, _pause=False)
+            return True
+        except Exception:
+            return False
 
     def mouse_up(self, button: str = "left") -> bool:
         """Release the requested mouse button."""
         if self._ensure():
-            try:
-                self._pg.mouseUp(button=button, _pause=False)
-                return True
-            except Exception:
-                pass
-        _, up_flag = self._mouse_button_flags(button)
-        return self._mouse_event(up_flag)
+            return self._mouse_up_loaded(button)
+        return self._mouse_event(self._mouse_button_flags(button)[1])
+
+    def _mouse_up_loaded(self, button: str = "left") -> bool:
+        """Release a mouse button through WinAPI, falling back to `pyautogui`."""
+        if self._user32 is not None and self._mouse_event(self._mouse_button_flags(button)[1]):
+            return True
+        if self._pg_primitive_button("_mouseUp", button):
+            return True
+        try:
+            self._pg.mouseUp(button=button, _pause=False)
+            return True
+        except Exception:
+            return False
 
     def write_text(self, text: str) -> bool:
         """Type text using the active input backend."""
@@ -1,39 +1,428 @@
 """Small HTTP client used by launcher UI to talk to local API."""
 
-from typing import Any, Optional
+import functools
+import heapq
+import itertools
+import json
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
+class _Endpoint(NamedTuple):
+    """Static description of one local API call: verb, relative path and defaults."""
+
+    method: str
+    path: str
+    timeout: float
+
+
+# Single source of truth for launcher API calls; public helpers below only shape payloads.
+_ENDPOINTS: dict[str, _Endpoint] = {
+    "get_info": _Endpoint("get", "info", 1.0),
+    "get_updates": _Endpoint("get", "updates", 2.5),
+    "get_qr_payload": _Endpoint("get", "qr_payload", 1.0),
+    "get_events": _Endpoint("get", "events", 1.5),
+    "get_pending_devices": _Endpoint("get", "pending_devices", 1.5),
+    "get_trusted_devices": _Endpoint("get", "trusted_devices", 1.5),
+    "get_security_state": _Endpoint("get", "security_state", 1.5),
+    "device_approve": _Endpoint("post", "device_approve", 2.0),
+    "device_rename": _Endpoint("post", "device_rename", 2.0),
+    "device_disconnect": _Endpoint("post", "device_disconnect", 2.0),
+    "device_delete": _Endpoint("post", "device_delete", 3.0),
+    "device_settings": _Endpoint("post", "device_settings", 2.0),
+    "trigger_file": _Endpoint("post", "trigger_file", 4.0),
+    "regenerate_code": _Endpoint("post", "regenerate_code", 2.0),
+    "set_input_lock": _Endpoint("post", "input_lock", 2.0),
+    "panic_mode": _Endpoint("post", "panic_mode", 3.0),
+}
+_PREBUILT_PATHS = tuple(dict.fromkeys([ep.path for ep in _ENDPOINTS.values()] + ["updates?force_refresh=1"]))
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Decode JSON with orjson when available, stdlib json otherwise."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(payload: Any) -> bytes:
+    """Encode compact JSON bytes with orjson when available, stdlib json otherwise."""
+    if _orjson is not None:
+        return _orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=8)
+def _input_lock_body(locked: bool, reason: str, actor: str) -> bytes:
+    """Serialize input-lock payloads once; hotkeys resend the same few combinations."""
+    return _json_dumps({"locked": locked, "reason": reason, "actor": actor})
+
+
+def _build_adapter() -> HTTPAdapter:
+    """Create pooled transport adapter for the local API."""
+    # No retries: failures surface immediately so the launcher notices a stopped server fast.
+    return HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+
+
+# Synthetic origin routed to the Unix-socket adapter; never resolved via DNS.
+_SOCKET_ORIGIN = "http://cyberdeck-local-socket"
+_SOCKET_RETRY_S = 5.0
+
+
+class _UnixSocketConnection(HTTPConnection):
+    """HTTP connection that dials a Unix domain socket instead of host:port."""
+
+    def __init__(self, *args: Any, socket_path: str = "", **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._socket_path = socket_path
+
+    def _new_conn(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._socket_path)
+        except OSError as e:
+            sock.close()
+            raise NewConnectionError(self, f"Failed to connect to {self._socket_path}: {e}") from e
+        return sock
+
+
+class _UnixSocketPool(HTTPConnectionPool):
+    ConnectionCls = _UnixSocketConnection
+
+
+class _UnixSocketAdapter(HTTPAdapter):
+    """Transport adapter sending every request to one Unix-socket connection pool."""
+
+    def __init__(self, socket_path: str, **kwargs: Any) -> None:
+        self._socket_path = socket_path
+        self._socket_pool: Optional[_UnixSocketPool] = None
+        super().__init__(**kwargs)
+
+    def _pool(self) -> _UnixSocketPool:
+        if self._socket_pool is None:
+            self._socket_pool = _UnixSocketPool(
+                "localhost",
+                maxsize=self._pool_maxsize,
+                block=self._pool_block,
+                socket_path=self._socket_path,
+            )
+        return self._socket_pool
+
+    def get_connection_with_tls_context(self, request: Any, verify: Any, proxies: Any = None, cert: Any = None):
+        return self._pool()
+
+    def get_connection(self, url: str, proxies: Any = None):
+        return self._pool()
+
+    def close(self) -> None:
+        super().close()
+        pool = self._socket_pool
+        self._socket_pool = None
+        if pool is not None:
+            pool.close()
+
+
+def _connect_failed(exc: BaseException) -> bool:
+    """Return True when `exc` shows the connection never opened, so the request was not sent."""
+    pending: list[Any] = [exc]
+    seen: set[int] = set()
+    while pending:
+        err = pending.pop()
+        if not isinstance(err, BaseException) or id(err) in seen:
+            continue
+        seen.add(id(err))
+        if isinstance(err, (NewConnectionError, FileNotFoundError, ConnectionRefusedError)):
+            return True
+        # requests wraps MaxRetryError in args; urllib3 keeps the cause in `reason`.
+        pending.extend(err.args)
+        pending.append(getattr(err, "reason", None))
+        pending.append(err.__cause__)
+    return False
+
+
+class _ApiWorker(threading.Thread):
+    """Daemon thread running one lane of launcher API jobs in priority order off the Tk thread."""
+
+    def __init__(self, maxsize: int = 64, evict_at: int = 20, name: str = "cyberdeck-api-worker") -> None:
+        super().__init__(name=name, daemon=True)
+        self._queue: queue.PriorityQueue = queue.PriorityQueue(maxsize=maxsize)
+        self._seq = itertools.count()
+        self._evict_at = int(evict_at)
+
+    def submit(self, priority: int, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Future:
+        """Queue `fn(*args, **kwargs)`; when full, make room by evicting the oldest background job."""
+        future: Future = Future()
+        item = (int(priority), next(self._seq), fn, args, kwargs, future)
+        try:
+            self._queue.put_nowait(item)
+            return future
+        except queue.Full:
+            pass
+        if not self._evict():
+            future.set_exception(queue.Full("launcher API queue is full"))
+            return future
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            future.set_exception(queue.Full("launcher API queue is full"))
+        return future
+
+    def _evict(self) -> bool:
+        """Cancel the oldest queued job at or below background urgency; False if there is none."""
+        q = self._queue
+        with q.mutex:
+            candidates = [it for it in q.queue if it[0] >= self._evict_at and it[2] is not None]
+            if not candidates:
+                return False
+            victim = min(candidates, key=lambda it: it[1])
+            q.queue.remove(victim)
+            heapq.heapify(q.queue)
+            q.not_full.notify()
+        victim[5].cancel()
+        return True
+
+    def stop(self) -> None:
+        """Ask the worker to exit after draining jobs already queued."""
+        try:
+            self._queue.put_nowait((1 << 30, next(self._seq), None, (), {}, None))
+        except queue.Full:
+            pass
+
+    def run(self) -> None:
+        while True:
+            _priority, _seq, fn, args, kwargs, future = self._queue.get()
+            if fn is None:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
 
 
 class LauncherApiClient:
     """Thin wrapper around `requests` with stable local API endpoints."""
 
-    def __init__(self, base_url: str, verify: bool | str = True) -> None:
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+    PRIORITY_URGENT = 0
+    PRIORITY_NORMAL = 10
+    PRIORITY_BACKGROUND = 20
+
+    def __init__(self, base_url: str, verify: bool | str = True, socket_path: str = "") -> None:
         """Initialize LauncherApiClient state and collaborator references."""
-        self.base_url = str(base_url or "").rstrip("/")
-        self.verify = verify
+        # One pooled session keeps the local API connection alive between polls.
+        self._session = requests.Session()
+        adapter = _build_adapter()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self.base_url = ""
+        self._urls: dict[str, str] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._inflight_lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self._workers: dict[int, _ApiWorker] = {}
+        self._worker_lock = threading.Lock()
+        self.stream_connected = False
+        self._stream_resp: Optional[requests.Response] = None
+        self.socket_path = ""
+        self._socket_base = ""
+        self._tcp_base = ""
+        self._on_socket = False
+        self._socket_retry_at = 0.0
+        self.configure(base_url, verify, socket_path=socket_path)
 
-    def configure(self, base_url: str, verify: bool | str = True) -> None:
-        """Update target API base URL and TLS verification mode."""
-        self.base_url = str(base_url or "").rstrip("/")
+    def configure(self, base_url: str, verify: bool | str = True, socket_path: Optional[str] = None) -> None:
+        """Update target API base URL, TLS verification mode and optional Unix socket path."""
+        new_base = str(base_url or "").rstrip("/")
+        if self.base_url and new_base != self.base_url:
+            # Target moved (port/scheme change): drop sockets pooled for the old origin.
+            self._session.close()
+        self.base_url = new_base
+        self._tcp_base = f"{new_base}/"
         self.verify = verify
+        self._session.verify = verify
+        if socket_path is not None:
+            path = str(socket_path or "").strip() if hasattr(socket, "AF_UNIX") else ""
+            if path != self.socket_path:
+                self.socket_path = path
+                if path:
+                    self._session.mount(f"{_SOCKET_ORIGIN}/", _UnixSocketAdapter(path, max_retries=0))
+        # Same API path on either transport; only the origin differs.
+        self._socket_base = f"{_SOCKET_ORIGIN}{urlsplit(new_base).path}/" if self.socket_path else ""
+        self._use_transport(bool(self.socket_path))
+
+    def _use_transport(self, on_socket: bool) -> None:
+        """Point prebuilt endpoint URLs at the Unix socket or the TCP base URL."""
+        self._on_socket = bool(on_socket and self._socket_base)
+        self._base = self._socket_base if self._on_socket else self._tcp_base
+        self._urls = {path: self._base + path for path in _PREBUILT_PATHS}
+
+    def _send(self, method: str, path: str, **kwargs: Any):
+        """Issue one request, retrying over TCP when the Unix socket could not be dialed."""
+        if self.socket_path and not self._on_socket and time.monotonic() >= self._socket_retry_at:
+            self._use_transport(True)
+        try:
+            return getattr(self._session, method)(self._url(path), **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            # A drop after the request went out must not replay panic/delete/trigger actions.
+            if not self._on_socket or not _connect_failed(e):
+                raise
+        # Server without a socket listener (or not up yet): stay on TCP for a while.
+        self._socket_retry_at = time.monotonic() + _SOCKET_RETRY_S
+        self._use_transport(False)
+        return getattr(self._session, method)(self._url(path), **kwargs)
+
+    def _url(self, path: str) -> str:
+        """Resolve normalized relative API path (no leading slash) to an absolute URL."""
+        url = self._urls.get(path)
+        if url is None:
+            url = self._base + path
+        return url
+
+    def submit(self, fn: Callable[..., Any], *args: Any, priority: int = PRIORITY_NORMAL, **kwargs: Any) -> Future:
+        """Run a blocking API job on the worker lane for its priority; returns its Future.
+
+        Urgent, normal and background jobs each get their own thread, so a panic
+        never waits behind a running file trigger or QR render.
+        """
+        if priority <= self.PRIORITY_URGENT:
+            lane, label = self.PRIORITY_URGENT, "urgent"
+        elif priority >= self.PRIORITY_BACKGROUND:
+            lane, label = self.PRIORITY_BACKGROUND, "background"
+        else:
+            lane, label = self.PRIORITY_NORMAL, "normal"
+        with self._worker_lock:
+            worker = self._workers.get(lane)
+            if worker is None:
+                worker = _ApiWorker(evict_at=self.PRIORITY_BACKGROUND, name=f"cyberdeck-api-{label}")
+                self._workers[lane] = worker
+                worker.start()
+        return worker.submit(priority, fn, args, kwargs)
+
+    def close(self) -> None:
+        """Release pooled connections and fan-out workers."""
+        pool = self._pool
+        self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        with self._worker_lock:
+            workers = list(self._workers.values())
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+        try:
+            self._session.close()
+        except Exception:
+            pass
 
     def _get(self, path: str, timeout: float):
         """Execute GET request to a relative API path."""
-        return requests.get(
-            f"{self.base_url}/{path.lstrip('/')}",
-            timeout=timeout,
-            verify=self.verify,
-        )
-
-    def _post(self, path: str, payload: Optional[dict[str, Any]] = None, timeout: float = 2.0):
-        """Execute POST request with JSON payload to a relative API path."""
-        return requests.post(
-            f"{self.base_url}/{path.lstrip('/')}",
-            json=payload,
-            timeout=timeout,
-            verify=self.verify,
-        )
+        # Single-flight: concurrent identical GETs share the leader's response.
+        with self._inflight_lock:
+            flight = self._inflight.get(path)
+            leader = flight is None
+            if leader:
+                flight = Future()
+                self._inflight[path] = flight
+        if not leader:
+            try:
+                return flight.result(timeout=timeout)
+            except FutureTimeoutError:
+                # Surface the same error type a direct GET would, so callers and describe_exception handle it.
+                raise requests.exceptions.Timeout(f"timed out waiting for in-flight GET {path}") from None
+        try:
+            resp = self._send("get", path, timeout=timeout)
+        except BaseException as exc:
+            self._land_flight(path, flight, error=exc)
+            raise
+        self._land_flight(path, flight, result=resp)
+        return resp
+
+    def _land_flight(self, path: str, flight: Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Unregister an in-flight GET and hand its outcome to waiting followers."""
+        with self._inflight_lock:
+            if self._inflight.get(path) is flight:
+                del self._inflight[path]
+        if error is not None:
+            flight.set_exception(error)
+        else:
+            flight.set_result(result)
+
+    def _post(
+        self,
+        path: str,
+        payload: Optional[dict[str, Any]] = None,
+        timeout: float = 2.0,
+        body: Optional[bytes] = None,
+    ):
+        """Execute POST request with JSON payload (or pre-serialized `body`) to a relative API path."""
+        if body is None and payload is not None:
+            body = _json_dumps(payload)
+        if body is None:
+            return self._send("post", path, timeout=timeout)
+        return self._send("post", path, data=body, headers=self._JSON_HEADERS, timeout=timeout)
+
+    def _call(
+        self,
+        name: str,
+        payload: Optional[dict[str, Any]] = None,
+        *,
+        timeout: Optional[float] = None,
+        path: Optional[str] = None,
+        body: Optional[bytes] = None,
+    ):
+        """Dispatch a named `_ENDPOINTS` entry, filling unset options from its defaults."""
+        ep = _ENDPOINTS[name]
+        timeout = ep.timeout if timeout is None else timeout
+        if ep.method == "post":
+            return self._post(path or ep.path, payload, timeout=timeout, body=body)
+        return self._get(path or ep.path, timeout=timeout)
+
+    def get_many(
+        self,
+        paths: Iterable[str],
+        timeout: float = 1.5,
+        timeouts: Optional[dict[str, float]] = None,
+    ) -> dict[str, Any]:
+        """Issue independent GETs concurrently; map each path to its response or raised exception."""
+        unique = list(dict.fromkeys(paths))
+        per_path = timeouts or {}
+        if len(unique) <= 1:
+            out: dict[str, Any] = {}
+            for path in unique:
+                try:
+                    out[path] = self._get(path, timeout=per_path.get(path, timeout))
+                except Exception as exc:
+                    out[path] = exc
+            return out
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cyberdeck-api")
+        futures = {path: self._pool.submit(self._get, path, per_path.get(path, timeout)) for path in unique}
+        out = {}
+        for path, future in futures.items():
+            try:
+                out[path] = future.result()
+            except Exception as exc:
+                out[path] = exc
+        return out
 
     @staticmethod
     def describe_exception(exc: BaseException) -> str:
@@ -51,8 +440,12 @@ class LauncherApiClient:
     def json_dict(response: Any, *, default: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """Decode response JSON as dict with predictable fallback."""
         fallback = {} if default is None else dict(default)
+        content = getattr(response, "content", None)
         try:
-            payload = response.json()
+            if isinstance(content, (bytes, bytearray)) and content:
+                payload = _json_loads(content)
+            else:
+                payload = response.json()
         except Exception:
             return fallback
         if isinstance(payload, dict):
@@ -86,72 +479,163 @@ class LauncherApiClient:
             return f"HTTP {status_code}"
         return str(default or "API error")
 
-    def get_info(self, timeout: float = 1.0):
+    def get_info(self, timeout: Optional[float] = None):
         """Retrieve data required to get info."""
         # Read-path helpers should avoid mutating shared state where possible.
-        return self._get("info", timeout=timeout)
+        return self._call("get_info", timeout=timeout)
 
-    def get_updates(self, timeout: float = 2.5, force_refresh: bool = False):
+    def get_updates(self, timeout: Optional[float] = None, force_refresh: bool = False):
         """Retrieve release update status from local API."""
-        path = "updates?force_refresh=1" if force_refresh else "updates"
-        return self._get(path, timeout=timeout)
+        path = "updates?force_refresh=1" if force_refresh else None
+        return self._call("get_updates", timeout=timeout, path=path)
 
-    def get_qr_payload(self, timeout: float = 1.0):
+    def get_qr_payload(self, timeout: Optional[float] = None):
         """Retrieve data required to get qr payload."""
         # Read-path helpers should avoid mutating shared state where possible.
-        return self._get("qr_payload", timeout=timeout)
+        return self._call("get_qr_payload", timeout=timeout)
+
+    @staticmethod
+    def events_path(since_id: int = 0, limit: int = 100) -> str:
+        """Build relative `/events` path for the given cursor and page size."""
+        return f"events?since_id={int(since_id)}&limit={int(limit)}"
 
-    def get_events(self, since_id: int = 0, limit: int = 100, timeout: float = 1.5):
+    def get_events(self, since_id: int = 0, limit: int = 100, timeout: Optional[float] = None):
         """Retrieve local server events for launcher notifications."""
-        return self._get(f"events?since_id={int(since_id)}&limit={int(limit)}", timeout=timeout)
+        return self._call("get_events", timeout=timeout, path=self.events_path(since_id, limit))
+
+    def stream_events(
+        self,
+        on_event: Callable[[dict[str, Any]], Any],
+        since_id: int = -1,
+        stop: Optional[threading.Event] = None,
+        read_timeout: float = 30.0,
+    ) -> bool:
+        """Follow `/events/stream` (SSE) and hand each event to `on_event`, reconnecting with backoff.
+
+        Blocks until `stop` is set (returns True) or the server lacks the stream
+        endpoint (returns False, so callers keep polling `get_events`).
+        """
+        stop = stop or threading.Event()
+        cursor = int(since_id)
+        delay = 0.2
+        while not stop.is_set():
+            try:
+                resp = self._send("get", f"events/stream?since_id={cursor}", stream=True, timeout=(5.0, read_timeout))
+            except Exception:
+                resp = None
+            if resp is not None and resp.status_code == 404:
+                resp.close()
+                return False
+            if resp is not None and resp.status_code == 200:
+                delay = 0.2
+                self._stream_resp = resp
+                self.stream_connected = True
+                try:
+                    data: list[str] = []
+                    for line in resp.iter_lines(decode_unicode=True):
+                        if stop.is_set():
+                            break
+                        if line:
+                            if line.startswith("data:"):
+                                data.append(line[5:].lstrip())
+                            continue
+                        if not data:
+                            continue
+                        try:
+                            evt = _json_loads("\n".join(data))
+                        except ValueError:
+                            evt = None
+                        data = []
+                        if isinstance(evt, dict):
+                            cursor = max(cursor, int(evt.get("id") or 0))
+                            on_event(evt)
+                except Exception:
+                    pass
+                finally:
+                    self.stream_connected = False
+                    self._stream_resp = None
+                    resp.close()
+            elif resp is not None:
+                resp.close()
+            if stop.wait(delay):
+                break
+            delay = min(5.0, delay * 2)
+        return True
+
+    def close_event_stream(self) -> None:
+        """Cut the live `/events/stream` response so `stream_events` reconnects to the next server."""
+        resp = self._stream_resp
+        if resp is None:
+            return
+        sock = getattr(getattr(getattr(resp, "raw", None), "connection", None), "sock", None)
+        try:
+            if sock is not None:
+                # shutdown() wakes the reader blocked in recv; it closes the response itself.
+                sock.shutdown(socket.SHUT_RDWR)
+            else:
+                resp.close()
+        except Exception:
+            pass
 
-    def get_pending_devices(self, timeout: float = 1.5):
+    def get_pending_devices(self, timeout: Optional[float] = None):
         """Retrieve pending device approval queue."""
-        return self._get("pending_devices", timeout=timeout)
+        return self._call("get_pending_devices", timeout=timeout)
 
-    def get_trusted_devices(self, timeout: float = 1.5):
+    def get_trusted_devices(self, timeout: Optional[float] = None):
         """Retrieve approved devices list with activity metadata."""
-        return self._get("trusted_devices", timeout=timeout)
+        return self._call("get_trusted_devices", timeout=timeout)
 
-    def get_security_state(self, timeout: float = 1.5):
+    def get_security_state(self, timeout: Optional[float] = None):
         """Retrieve current remote-input lock state."""
-        return self._get("security_state", timeout=timeout)
+        return self._call("get_security_state", timeout=timeout)
 
-    def device_approve(self, token: str, allow: bool, timeout: float = 2.0):
+    def device_approve(self, token: str, allow: bool, timeout: Optional[float] = None):
         """Approve or deny a pending device session."""
-        return self._post("device_approve", {"token": token, "allow": bool(allow)}, timeout=timeout)
+        return self._call("device_approve", {"token": token, "allow": bool(allow)}, timeout=timeout)
 
-    def device_rename(self, token: str, alias: str = "", note: str = "", timeout: float = 2.0):
+    def device_rename(self, token: str, alias: str = "", note: str = "", timeout: Optional[float] = None):
         """Update alias/note for a trusted device."""
         payload = {"token": str(token or ""), "alias": str(alias or ""), "note": str(note or "")}
-        return self._post("device_rename", payload, timeout=timeout)
+        return self._call("device_rename", payload, timeout=timeout)
 
-    def device_disconnect(self, token: str, timeout: float = 2.0):
+    def device_disconnect(self, token: str, timeout: Optional[float] = None):
         """Call local API endpoint to disconnect a device session."""
-        return self._post("device_disconnect", {"token": token}, timeout=timeout)
+        return self._call("device_disconnect", {"token": token}, timeout=timeout)
 
-    def device_delete(self, token: str, timeout: float = 3.0):
+    def device_delete(self, token: str, timeout: Optional[float] = None):
         """Call local API endpoint to delete a device session."""
-        return self._post("device_delete", {"token": token}, timeout=timeout)
+        return self._call("device_delete", {"token": token}, timeout=timeout)
 
-    def device_settings(self, payload: dict[str, Any], timeout: float = 2.0):
+    def device_settings(self, payload: dict[str, Any], timeout: Optional[float] = None):
         """Call local API endpoint to update per-device settings."""
-        return self._post("device_settings", payload, timeout=timeout)
+        return self._call("device_settings", payload, timeout=timeout)
 
-    def trigger_file(self, payload: dict[str, Any], timeout: float = 4.0):
+    def trigger_file(self, payload: dict[str, Any], timeout: Optional[float] = None):
         """Trigger file."""
-        return self._post("trigger_file", payload, timeout=timeout)
+        return self._call("trigger_file", payload, timeout=timeout)
 
-    def regenerate_code(self, timeout: float = 2.0):
+    def regenerate_code(self, timeout: Optional[float] = None):
         """Regenerate code."""
-        return self._post("regenerate_code", payload=None, timeout=timeout)
+        return self._call("regenerate_code", timeout=timeout)
 
-    def set_input_lock(self, locked: bool, reason: str = "", actor: str = "launcher", timeout: float = 2.0):
+    def set_input_lock(
+        self,
+        locked: bool,
+        reason: str = "",
+        actor: str = "launcher",
+        timeout: Optional[float] = None,
+    ):
         """Enable or disable remote-input lock."""
-        payload = {"locked": bool(locked), "reason": str(reason or ""), "actor": str(actor or "launcher")}
-        return self._post("input_lock", payload=payload, timeout=timeout)
+        body = _input_lock_body(bool(locked), str(reason or ""), str(actor or "launcher"))
+        return self._call("set_input_lock", timeout=timeout, body=body)
 
-    def panic_mode(self, keep_token: str = "", lock_input: bool = True, reason: str = "", timeout: float = 3.0):
+    def panic_mode(
+        self,
+        keep_token: str = "",
+        lock_input: bool = True,
+        reason: str = "",
+        timeout: Optional[float] = None,
+    ):
         """Disconnect/revoke sessions and optionally lock remote input."""
         payload = {"keep_token": str(keep_token or ""), "lock_input": bool(lock_input), "reason": str(reason or "")}
-        return self._post("panic_mode", payload=payload, timeout=timeout)
+        return self._call("panic_mode", payload, timeout=timeout)
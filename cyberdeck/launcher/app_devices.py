@@ -1,10 +1,183 @@
 ﻿from __future__ import annotations
 
-from typing import Any
+import bisect
+import functools
+import stat
+from typing import Any, Optional
 
+from .qr_render import hex_to_rgb, render_qr
 from .shared import *
 from .shared import _tr_any
 
+_QR_PALETTE = (hex_to_rgb(COLOR_ACCENT, (60, 255, 145)), hex_to_rgb(COLOR_PANEL, (8, 18, 14)))
+_OPEN_APP_PARAM = ("open", "app")
+_DEEP_LINK_PREFIX = "cyberdeck://"
+_INTENT_TAIL = "Intent;scheme=cyberdeck;action=android.intent.action.VIEW;"
+_dumps_compact = functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+# Payload length breakpoints -> QR bitmap size (longer payloads need more pixels per module).
+_QR_SIZE_BREAKS = (180, 260, 380)
+_QR_SIZE_STEPS = (max(QR_IMAGE_SIZE, 280), max(QR_IMAGE_SIZE, 320), max(QR_IMAGE_SIZE, 360))
+_QR_BASE_SIZE = int(QR_IMAGE_SIZE)
+
+
+def _resolve_qr_logo_path(owner: Any) -> str:
+    """Resolve QR logo overlay path once per launcher session ("" when no logo)."""
+    logo_path = getattr(owner, "_qr_logo_path", None)
+    if logo_path is None:
+        try:
+            logo_path = owner.icon_path_qr_png if os.path.exists(owner.icon_path_qr_png) else owner.icon_path_png
+            logo_path = logo_path if os.path.exists(logo_path) else ""
+        except Exception:
+            logo_path = ""
+        owner._qr_logo_path = logo_path
+    return logo_path
+
+
+@functools.lru_cache(maxsize=16)
+def _split_base_url(base: str) -> tuple[str, str]:
+    """Return `(scheme, netloc)` of QR base URL; the server URL rarely changes."""
+    parsed = urllib.parse.urlsplit(base)
+    return parsed.scheme, parsed.netloc
+
+
+@functools.lru_cache(maxsize=16)
+def _quote_all(value: str) -> str:
+    """Percent-encode every reserved character (for URLs nested in intent URIs)."""
+    return urllib.parse.quote(value, safe="")
+
+
+@functools.lru_cache(maxsize=64)
+def _append_open_mode_app_cached(raw: str) -> str:
+    """Rewrite URL query so it carries exactly one `open=app` parameter."""
+    try:
+        parsed = urllib.parse.urlsplit(raw)
+        query = urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+        out = []
+        has_open = False
+        for k, v in query:
+            if str(k) == "open":
+                has_open = True
+                out.append(_OPEN_APP_PARAM)
+            else:
+                out.append((k, v))
+        if not has_open:
+            out.append(_OPEN_APP_PARAM)
+        return urllib.parse.urlunsplit(
+            (
+                parsed.scheme,
+                parsed.netloc,
+                parsed.path,
+                urllib.parse.urlencode(out, doseq=True),
+                parsed.fragment,
+            )
+        )
+    except Exception:
+        return raw
+
+
+def _configure_changed(widget: Any, **options: Any) -> None:
+    """Configure widget only when options differ from what this helper applied last.
+
+    Use only for widgets whose options are not changed elsewhere after creation.
+    """
+    applied = getattr(widget, "_cd_applied_options", None)
+    if applied is not None and all(k in applied and applied[k] == v for k, v in options.items()):
+        return
+    widget.configure(**options)
+    if applied is None:
+        applied = {}
+        try:
+            widget._cd_applied_options = applied
+        except Exception:
+            return
+    applied.update(options)
+
+
+def _claim_inflight(owner: Any, attr: str) -> Optional[threading.Event]:
+    """Mark a one-at-a-time action as running; None when it is already in flight."""
+    flag = getattr(owner, attr, None)
+    if flag is None:
+        flag = threading.Event()
+        setattr(owner, attr, flag)
+    if flag.is_set():
+        return None
+    flag.set()
+    return flag
+
+
+def _recent_sends(owner: Any) -> OrderedDict:
+    """Return the owner's small LRU of recently triggered sends (key -> monotonic time)."""
+    recent = getattr(owner, "_recent_sends", None)
+    if recent is None:
+        recent = owner._recent_sends = OrderedDict()
+    return recent
+
+
+def _queue_send_outcome(owner: Any, error: Optional[str] = None) -> None:
+    """Queue the status line and toast for a finished send as one UI batch."""
+    tr = owner.tr
+    if error is None:
+        owner.ui_batch(
+            functools.partial(owner._apply_status, tr("transfer_started"), COLOR_ACCENT),
+            functools.partial(owner.show_toast, tr("toast_transfer_started"), level="success"),
+        )
+        return
+    owner.ui_batch(
+        functools.partial(owner._apply_status, tr("error_prefix", msg=error), COLOR_FAIL),
+        functools.partial(owner.show_toast, tr("toast_transfer_error", msg=error), level="error"),
+    )
+
+
+def _parse_security_response(
+    api_client: Any, resp: Any, *, locked: bool, reason: str, actor: str
+) -> tuple[dict, Optional[dict]]:
+    """Check a security-changing API response; return its body and normalized security state.
+
+    Raises RuntimeError on non-200. State is None when the body carries no security snapshot.
+    """
+    if int(getattr(resp, "status_code", 0) or 0) != 200:
+        raise RuntimeError(api_client.describe_api_error(resp))
+    body = api_client.json_dict(resp)
+    sec = body.get("security")
+    if not isinstance(sec, dict):
+        return body, None
+    return body, {
+        "locked": bool(sec.get("locked", locked)),
+        "reason": str(sec.get("reason", reason) or reason),
+        "actor": str(sec.get("actor", actor) or actor),
+        "updated_ts": float(sec.get("updated_ts", 0.0) or 0.0),
+    }
+
+
+def _qr_refresh_interval_s(stable_cycles: int) -> float:
+    """Return QR heartbeat interval, doubling while pairing state stays unchanged.
+
+    Each fetch issues a fresh one-time qr_token, so the interval is also kept
+    under half the token TTL to never leave an expired code on screen.
+    """
+    try:
+        ttl_s = float(getattr(server_config, "QR_TOKEN_TTL_S", 120) or 120)
+    except Exception:
+        ttl_s = 120.0
+    cap = min(QR_REFRESH_MAX_S, max(QR_REFRESH_BASE_S, ttl_s / 2.0))
+    return min(QR_REFRESH_BASE_S * (2 ** min(max(0, int(stable_cycles)), 8)), cap)
+
+
+def _load_qr_logo_bytes(owner: Any) -> bytes:
+    """Read QR logo file once per launcher session (b"" when no logo)."""
+    data = getattr(owner, "_qr_logo_bytes", None)
+    if data is None:
+        data = b""
+        logo_path = _resolve_qr_logo_path(owner)
+        if logo_path:
+            try:
+                with open(logo_path, "rb") as f:
+                    data = f.read()
+            except Exception:
+                data = b""
+        owner._qr_logo_bytes = data
+    return data
+
 
 class AppDevicesMixin:
     """Device detail/actions/settings and QR handling methods."""
@@ -26,23 +199,24 @@ class AppDevicesMixin:
             return ""
 
         # Keep the deep link compact for better QR readability.
-        params: dict[str, str] = {
-            "type": str(payload.get("type") or "cyberdeck_qr_v1").strip(),
-            "ip": ip,
-            "port": port,
-            "code": code,
-            "scheme": str(payload.get("scheme") or "").strip(),
-            "qr_token": qr_token,
-        }
+        pairs: list[tuple[str, str]] = [
+            ("type", str(payload.get("type") or "cyberdeck_qr_v1").strip()),
+            ("ip", ip),
+            ("port", port),
+            ("code", code),
+            ("scheme", str(payload.get("scheme") or "").strip()),
+            ("qr_token", qr_token),
+        ]
 
         try:
             expires_at = payload.get("pairing_expires_at")
             if expires_at not in (None, ""):
-                params["exp"] = str(int(float(expires_at)))
+                pairs.append(("exp", str(int(float(expires_at)))))
         except Exception:
             pass
 
-        encoded = urllib.parse.urlencode({k: v for k, v in params.items() if str(v).strip()}, doseq=False)
+        # Values are stripped above, so empty strings are the only ones to drop.
+        encoded = urllib.parse.urlencode([(k, v) for k, v in pairs if v], doseq=False)
         if not encoded:
             return ""
         return f"cyberdeck://pair?{encoded}"
@@ -61,32 +235,32 @@ class AppDevicesMixin:
             return ""
 
         base = str(base_url or "").strip()
-        parsed = urllib.parse.urlsplit(base) if base else None
-        if parsed and parsed.scheme and parsed.netloc:
-            out_scheme = parsed.scheme
-            out_netloc = parsed.netloc
+        base_scheme, base_netloc = _split_base_url(base) if base else ("", "")
+        if base_scheme and base_netloc:
+            out_scheme = base_scheme
+            out_netloc = base_netloc
         else:
             out_scheme = scheme
             out_netloc = f"{ip}:{port}"
 
-        params: dict[str, str] = {
-            "type": str(payload.get("type") or "cyberdeck_qr_v1").strip(),
-            "app_pkg": str(payload.get("app_pkg") or "").strip(),
-            "ip": ip,
-            "port": port,
-            "code": code,
-            "scheme": scheme,
-            "qr_token": qr_token,
-            "open": "app",
-        }
+        pairs: list[tuple[str, str]] = [
+            ("type", str(payload.get("type") or "cyberdeck_qr_v1").strip()),
+            ("app_pkg", str(payload.get("app_pkg") or "").strip()),
+            ("ip", ip),
+            ("port", port),
+            ("code", code),
+            ("scheme", scheme),
+            ("qr_token", qr_token),
+            _OPEN_APP_PARAM,
+        ]
         try:
             expires_at = payload.get("pairing_expires_at")
             if expires_at not in (None, ""):
-                params["exp"] = str(int(float(expires_at)))
+                pairs.append(("exp", str(int(float(expires_at)))))
         except Exception:
             pass
 
-        query = urllib.parse.urlencode({k: v for k, v in params.items() if str(v).strip()}, doseq=False)
+        query = urllib.parse.urlencode([(k, v) for k, v in pairs if v], doseq=False)
         return urllib.parse.urlunsplit((out_scheme, out_netloc, "/", query, ""))
 
     @staticmethod
@@ -95,30 +269,7 @@ class AppDevicesMixin:
         raw = str(url or "").strip()
         if not raw:
             return ""
-        try:
-            parsed = urllib.parse.urlsplit(raw)
-            query = urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
-            out = []
-            has_open = False
-            for k, v in query:
-                if str(k) == "open":
-                    has_open = True
-                    out.append(("open", "app"))
-                else:
-                    out.append((k, v))
-            if not has_open:
-                out.append(("open", "app"))
-            return urllib.parse.urlunsplit(
-                (
-                    parsed.scheme,
-                    parsed.netloc,
-                    parsed.path,
-                    urllib.parse.urlencode(out, doseq=True),
-                    parsed.fragment,
-                )
-            )
-        except Exception:
-            return raw
+        return _append_open_mode_app_cached(raw)
 
     @staticmethod
     def _build_android_intent_qr_link(deep_link: str, fallback_url: str = "") -> str:
@@ -127,20 +278,24 @@ class AppDevicesMixin:
         if not deep:
             return ""
         try:
-            parsed = urllib.parse.urlsplit(deep)
-            if parsed.scheme.lower() != "cyberdeck":
+            # Deep links come from _build_app_qr_deep_link, so a plain
+            # prefix/partition parse is enough here.
+            if deep[: len(_DEEP_LINK_PREFIX)].lower() != _DEEP_LINK_PREFIX:
                 return deep
-            authority = str(parsed.netloc or "pair").strip().strip("/")
-            path = str(parsed.path or "").lstrip("/")
+            rest = deep[len(_DEEP_LINK_PREFIX):].partition("#")[0]
+            path_part, _, query = rest.partition("?")
+            authority, _, path = path_part.partition("/")
+            authority = authority.strip() or "pair"
+            path = path.lstrip("/")
             target = authority if (not path) else f"{authority}/{path}"
             intent = f"intent://{target}"
-            if parsed.query:
-                intent += f"?{parsed.query}"
+            if query:
+                intent += f"?{query}"
 
             fallback = AppDevicesMixin._append_open_mode_app(fallback_url)
-            tail = "Intent;scheme=cyberdeck;action=android.intent.action.VIEW;"
+            tail = _INTENT_TAIL
             if fallback:
-                tail += f"S.browser_fallback_url={urllib.parse.quote(fallback, safe='')};"
+                tail += f"S.browser_fallback_url={_quote_all(fallback)};"
             tail += "end"
             return f"{intent}#{tail}"
         except Exception:
@@ -149,130 +304,61 @@ class AppDevicesMixin:
     @staticmethod
     def _qr_render_size_for_payload(text: str) -> int:
         """Pick QR render size based on payload length."""
-        n = len(str(text or ""))
-        if n >= 380:
-            return max(QR_IMAGE_SIZE, 360)
-        if n >= 260:
-            return max(QR_IMAGE_SIZE, 320)
-        if n >= 180:
-            return max(QR_IMAGE_SIZE, 280)
-        return int(QR_IMAGE_SIZE)
+        n = len(text) if isinstance(text, str) else len(str(text or ""))
+        idx = bisect.bisect_right(_QR_SIZE_BREAKS, n)
+        return _QR_SIZE_STEPS[idx - 1] if idx else _QR_BASE_SIZE
+
+    @staticmethod
+    def _qr_error_level_for_payload(text: str, with_logo: bool) -> str:
+        """Pick QR error correction level for payload and overlay."""
+        if with_logo:
+            # The centre logo hides roughly a fifth of the modules.
+            return "h"
+        value = str(text or "").lstrip().lower()
+        if value.startswith(("http://", "https://", "cyberdeck://", "intent://")):
+            return "m"
+        return "l"
 
     def _set_qr_placeholder(self, text: str) -> Any:
         """Set QR placeholder."""
         try:
             if hasattr(self, "lbl_qr") and self.lbl_qr:
-                self._qr_ctk_img = None
                 self._qr_tk_img = None
+                self._qr_last_text = None
                 self.lbl_qr.configure(text=text, image=None)
         except Exception:
             pass
 
-    def _build_qr_image(self, qr_text: str, size: int = QR_IMAGE_SIZE) -> Any:
-        """Build QR image."""
-        def _hex_to_rgb(value: str, fallback: tuple[int, int, int]) -> tuple[int, int, int]:
-            """Parse #RRGGBB color to RGB tuple with fallback."""
-            text = str(value or "").strip()
-            if len(text) == 7 and text.startswith("#"):
-                try:
-                    return (int(text[1:3], 16), int(text[3:5], 16), int(text[5:7], 16))
-                except Exception:
-                    pass
-            return fallback
-
-        qr = qrcode.QRCode(
-            version=None,
-            error_correction=qrcode.constants.ERROR_CORRECT_H,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(qr_text)
-        qr.make(fit=True)
-        accent_rgb = _hex_to_rgb(COLOR_ACCENT, (60, 255, 145))
-        panel_rgb = _hex_to_rgb(COLOR_PANEL, (8, 18, 14))
-        module_rgb = (8, 26, 18)
-        qr_bg_rgb = (246, 255, 250)
-
-        qr_img = qr.make_image(fill_color=module_rgb, back_color=qr_bg_rgb).convert("RGBA")
-
-        out = Image.new("RGBA", (size, size), panel_rgb + (255,))
-        draw = ImageDraw.Draw(out)
-        frame_pad = max(1, int(size * 0.005))
-        frame_radius = max(6, int(size * 0.04))
-        draw.rounded_rectangle(
-            [frame_pad, frame_pad, size - frame_pad - 1, size - frame_pad - 1],
-            radius=frame_radius,
-            fill=panel_rgb + (255,),
-            outline=accent_rgb + (105,),
-            width=max(1, int(size * 0.004)),
-        )
-
-        qr_pad = max(8, int(size * 0.036))
-        qr_side = max(1, size - qr_pad * 2)
-
-        shadow = Image.new("RGBA", (qr_side, qr_side), (0, 0, 0, 0))
-        shadow_draw = ImageDraw.Draw(shadow)
-        shadow_draw.rounded_rectangle(
-            [0, 0, qr_side - 1, qr_side - 1],
-            radius=max(6, int(qr_side * 0.04)),
-            fill=(0, 0, 0, 58),
-        )
-        shadow_off = max(1, int(size * 0.006))
-        out.alpha_composite(shadow, (qr_pad + shadow_off, qr_pad + shadow_off))
-
-        panel = Image.new("RGBA", (qr_side, qr_side), (0, 0, 0, 0))
-        panel_draw = ImageDraw.Draw(panel)
-        panel_draw.rounded_rectangle(
-            [0, 0, qr_side - 1, qr_side - 1],
-            radius=max(6, int(qr_side * 0.04)),
-            fill=qr_bg_rgb + (255,),
-            outline=(205, 225, 214, 255),
-            width=1,
-        )
-        qr_inner_pad = max(4, int(qr_side * 0.015))
-        qr_inner_side = qr_side - qr_inner_pad * 2
-        qr_img = qr_img.resize((qr_inner_side, qr_inner_side), Image.NEAREST)
-        panel.alpha_composite(qr_img, (qr_inner_pad, qr_inner_pad))
-        out.alpha_composite(panel, (qr_pad, qr_pad))
-
-        try:
-            logo_path = self.icon_path_qr_png if os.path.exists(self.icon_path_qr_png) else self.icon_path_png
-            if os.path.exists(logo_path):
-                logo_size = max(42, int(size * 0.18))
-                logo = Image.open(logo_path).convert("RGBA")
-                bbox = logo.getbbox()
-                if bbox:
-                    logo = logo.crop(bbox)
-                logo = logo.resize((logo_size, logo_size), Image.LANCZOS)
-                quiet_size = int(max(logo_size + 12, logo_size * 1.34))
-                quiet_x = (size - quiet_size) // 2
-                quiet_y = (size - quiet_size) // 2
-
-                quiet = Image.new("RGBA", (quiet_size, quiet_size), qr_bg_rgb + (255,))
-                qmask = Image.new("L", (quiet_size, quiet_size), 0)
-                qdraw = ImageDraw.Draw(qmask)
-                qdraw.rounded_rectangle(
-                    [0, 0, quiet_size - 1, quiet_size - 1],
-                    radius=max(5, int(quiet_size * 0.16)),
-                    fill=255,
-                )
-                quiet.putalpha(qmask)
-                qdraw = ImageDraw.Draw(quiet)
-                qdraw.rounded_rectangle(
-                    [0, 0, quiet_size - 1, quiet_size - 1],
-                    radius=max(5, int(quiet_size * 0.16)),
-                    outline=accent_rgb + (150,),
-                    width=1,
-                )
-                out.alpha_composite(quiet, (quiet_x, quiet_y))
-
-                logo_x = (size - logo_size) // 2
-                logo_y = (size - logo_size) // 2
-                out.alpha_composite(logo, (logo_x, logo_y))
-        except Exception:
-            pass
-
-        return out.convert("RGB")
+    def _build_qr_image(
+        self,
+        qr_text: str,
+        size: int = QR_IMAGE_SIZE,
+        ecc: str | None = None,
+    ) -> Any:
+        """Build QR image.
+
+        `ecc` defaults to H when the logo overlay is drawn and to a lower level
+        otherwise.
+        """
+        logo_bytes = _load_qr_logo_bytes(self)
+        if ecc is None:
+            ecc = AppDevicesMixin._qr_error_level_for_payload(qr_text, with_logo=bool(logo_bytes))
+        ecc = str(ecc).lower()
+        cache = getattr(self, "_qr_render_cache", None)
+        if cache is None:
+            cache = self._qr_render_cache = {}
+        cache_key = (str(qr_text), int(size), ecc)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        img = render_qr(str(qr_text), int(size), ecc, logo_bytes, _QR_PALETTE)
+        # Renders depend only on (text, size, ecc); keep a few so a repeated payload
+        # or a quick toggle between QR modes skips encoding and composition.
+        while len(cache) >= QR_RENDER_CACHE_SIZE:
+            cache.pop(next(iter(cache)), None)
+        cache[cache_key] = img
+        return img
 
     def refresh_qr_code(self, force: bool = False) -> Any:
         """Refresh QR code."""
@@ -289,11 +375,22 @@ class AppDevicesMixin:
         if current_sig != last_sig:
             force = True
             self._qr_last_state_signature = current_sig
+        if force:
+            self._qr_stable_cycles = 0
 
         if not self.server_online:
             self._set_qr_placeholder(self.tr("qr_unavailable"))
             return
 
+        tk_img = getattr(self, "_qr_tk_img", None)
+        if tk_img is not None and getattr(self, "_qr_shown_label", None) is not self.lbl_qr:
+            # The QR label was recreated (language switch); reattach the current image.
+            try:
+                self.lbl_qr.configure(image=tk_img, text="")
+                self._qr_shown_label = self.lbl_qr
+            except Exception:
+                pass
+
         now = time.time()
         if (not force) and (now < float(getattr(self, "_qr_next_fetch_ts", 0.0) or 0.0)):
             return
@@ -316,43 +413,57 @@ class AppDevicesMixin:
                 if mode not in ("site", "app"):
                     mode = DEFAULT_SETTINGS["qr_mode"]
 
+                url = str(data.get("url") or "").strip()
+                qr_text = ""
                 if mode == "app":
                     # For better scanner compatibility, emit a regular http(s) URL
                     # with open=app so the landing page can auto-open cyberdeck://.
                     try:
-                        url = str(data.get("url") or "").strip()
-                        fallback = self._build_app_fallback_url(payload, base_url=url)
-                        if fallback:
-                            qr_text = fallback
-                        else:
-                            deep_link = self._build_app_qr_deep_link(payload)
-                            if deep_link:
-                                qr_text = deep_link
-                            else:
-                                qr_text = self._append_open_mode_app(url) if url else json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+                        qr_text = self._build_app_fallback_url(payload, base_url=url) or self._build_app_qr_deep_link(payload)
                     except Exception:
-                        url = str(data.get("url") or "").strip()
-                        qr_text = self._append_open_mode_app(url) if url else json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+                        qr_text = ""
+                    if not qr_text and url:
+                        qr_text = self._append_open_mode_app(url)
                 else:
-                    url = str(data.get("url") or "").strip()
-                    qr_text = url if url else json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-
-                img = self._build_qr_image(qr_text, size=QR_IMAGE_SIZE)
+                    qr_text = url
+                if not qr_text:
+                    qr_text = _dumps_compact(payload)
+
+                if (
+                    (not force)
+                    and qr_text == getattr(self, "_qr_last_text", None)
+                    and getattr(self, "_qr_tk_img", None) is not None
+                ):
+                    # Heartbeat with the same payload already on screen: skip render and UI swap.
+                    self._qr_schedule_next_fetch()
+                    return
+
+                ecc = self._qr_error_level_for_payload(qr_text, with_logo=bool(_load_qr_logo_bytes(self)))
+                img = self._build_qr_image(qr_text, size=QR_IMAGE_SIZE, ecc=ecc)
 
                 def _ui() -> None:
                     """Apply prepared QR image on UI thread."""
                     try:
-                        self._qr_tk_img = ImageTk.PhotoImage(img)
-                        self._qr_ctk_img = None
-                        self.lbl_qr.configure(image=self._qr_tk_img, text="")
+                        tk_img = getattr(self, "_qr_tk_img", None)
+                        if (
+                            tk_img is not None
+                            and getattr(self, "_qr_shown_label", None) is self.lbl_qr
+                            and (tk_img.width(), tk_img.height()) == img.size
+                        ):
+                            # Same-size render: update pixels in place, label binding stays valid.
+                            tk_img.paste(img)
+                        else:
+                            self._qr_tk_img = ImageTk.PhotoImage(img)
+                            self.lbl_qr.configure(image=self._qr_tk_img, text="")
+                            self._qr_shown_label = self.lbl_qr
+                        self._qr_last_text = qr_text
                     except Exception as tk_err:
                         self.append_log(f"[launcher] qr render error: {tk_err}\n")
                         fallback_text = str(data.get("url") or "").strip()
                         self.lbl_qr.configure(image=None, text=(fallback_text or self.tr("qr_error")))
 
                 self.ui_call(_ui)
-                self._qr_last_fetch_ts = time.time()
-                self._qr_next_fetch_ts = self._qr_last_fetch_ts + 30.0
+                self._qr_schedule_next_fetch()
             except Exception as e:
                 msg = self.api_client.describe_exception(e)
                 self.append_log(f"[launcher] qr error: {msg}\n")
@@ -362,16 +473,39 @@ class AppDevicesMixin:
             finally:
                 self._qr_fetch_inflight = False
 
-        threading.Thread(target=_bg, daemon=True).start()
+        def _released(job: Any) -> None:
+            """Clear the in-flight flag when the job was evicted or rejected before running."""
+            if job.cancelled() or job.exception() is not None:
+                self._qr_fetch_inflight = False
+
+        self.api_client.submit(_bg, priority=self.api_client.PRIORITY_BACKGROUND).add_done_callback(_released)
+
+    def _qr_schedule_next_fetch(self) -> None:
+        """Record a successful QR fetch and back off the next heartbeat while state is stable."""
+        cycles = int(getattr(self, "_qr_stable_cycles", 0) or 0)
+        self._qr_last_fetch_ts = time.time()
+        self._qr_next_fetch_ts = self._qr_last_fetch_ts + _qr_refresh_interval_s(cycles)
+        self._qr_stable_cycles = cycles + 1
+
+    def _device_index(self) -> dict[str, Any]:
+        """Return devices keyed by token, rebuilt whenever `devices_data` is replaced."""
+        data = self.devices_data
+        cached = getattr(self, "_devices_by_token", None)
+        if cached is None or cached[0] is not data:
+            index: dict[str, Any] = {}
+            for d in data or []:
+                token = d.get("token")
+                if token:
+                    index.setdefault(token, d)
+            cached = (data, index)
+            self._devices_by_token = cached
+        return cached[1]
 
     def _get_selected_device(self) -> Any:
         """Return selected device."""
         if not self.selected_token:
             return None
-        for d in self.devices_data:
-            if d.get("token") == self.selected_token:
-                return d
-        return None
+        return self._device_index().get(self.selected_token)
 
     def _translate_transfer_msg(self, msg: str) -> str:
         """Translate transfer msg."""
@@ -391,34 +525,33 @@ class AppDevicesMixin:
         self.selected_token = token
         self.selected_device_name = None
         loaded = False
-        for d in self.devices_data:
-            if d.get("token") == token:
-                self.selected_device_name = self._device_display_name(d)
-                settings = d.get("settings") or {}
-                self._suppress_device_setting_trace = True
-                self.var_transfer_preset.set(settings.get("transfer_preset", "balanced"))
-                self.var_device_alias.set((settings.get("alias") or "").strip())
-                self.var_device_note.set((settings.get("note") or "").strip())
-                try:
-                    chunk = settings.get("transfer_chunk")
-                    self.var_transfer_chunk_kb.set("" if chunk in (None, "", 0) else str(int(chunk) // 1024))
-                except Exception:
-                    self.var_transfer_chunk_kb.set("")
-                try:
-                    sleep = settings.get("transfer_sleep")
-                    self.var_transfer_sleep_ms.set("" if sleep in (None, "", 0) else str(int(float(sleep) * 1000)))
-                except Exception:
-                    self.var_transfer_sleep_ms.set("")
-
-                self.var_perm_mouse.set(bool(settings.get("perm_mouse", True)))
-                self.var_perm_keyboard.set(bool(settings.get("perm_keyboard", True)))
-                self.var_perm_upload.set(bool(settings.get("perm_upload", True)))
-                self.var_perm_file_send.set(bool(settings.get("perm_file_send", True)))
-                self.var_perm_stream.set(bool(settings.get("perm_stream", True)))
-                self.var_perm_power.set(bool(settings.get("perm_power", False)))
-                self._suppress_device_setting_trace = False
-                loaded = True
-                break
+        d = self._device_index().get(token) if token else None
+        if d is not None:
+            self.selected_device_name = self._device_display_name(d)
+            settings = d.get("settings") or {}
+            self._suppress_device_setting_trace = True
+            self.var_transfer_preset.set(settings.get("transfer_preset", "balanced"))
+            self.var_device_alias.set((settings.get("alias") or "").strip())
+            self.var_device_note.set((settings.get("note") or "").strip())
+            try:
+                chunk = settings.get("transfer_chunk")
+                self.var_transfer_chunk_kb.set("" if chunk in (None, "", 0) else str(int(chunk) // 1024))
+            except Exception:
+                self.var_transfer_chunk_kb.set("")
+            try:
+                sleep = settings.get("transfer_sleep")
+                self.var_transfer_sleep_ms.set("" if sleep in (None, "", 0) else str(int(float(sleep) * 1000)))
+            except Exception:
+                self.var_transfer_sleep_ms.set("")
+
+            self.var_perm_mouse.set(bool(settings.get("perm_mouse", True)))
+            self.var_perm_keyboard.set(bool(settings.get("perm_keyboard", True)))
+            self.var_perm_upload.set(bool(settings.get("perm_upload", True)))
+            self.var_perm_file_send.set(bool(settings.get("perm_file_send", True)))
+            self.var_perm_stream.set(bool(settings.get("perm_stream", True)))
+            self.var_perm_power.set(bool(settings.get("perm_power", False)))
+            self._suppress_device_setting_trace = False
+            loaded = True
         self._selected_device_form_state = self._capture_device_form_state() if loaded else None
         self._set_device_settings_dirty(False, status_text=self.tr("choose_device"), status_color=COLOR_ACCENT)
         self.update_gui_data()
@@ -426,13 +559,13 @@ class AppDevicesMixin:
     def refresh_selected_panel(self) -> Any:
         """Refresh selected panel."""
         if not self.selected_token:
-            self.lbl_target.configure(text=self.tr("none"))
-            self.lbl_target_status.configure(text=self.tr("target_not_selected"), text_color=COLOR_TEXT_DIM)
+            _configure_changed(self.lbl_target, text=self.tr("none"))
+            _configure_changed(self.lbl_target_status, text=self.tr("target_not_selected"), text_color=COLOR_TEXT_DIM)
             self._selected_device_form_state = None
             self._set_device_settings_dirty(False)
             try:
-                self.btn_disconnect_selected.configure(state="disabled", text_color=COLOR_TEXT_DIM)
-                self.btn_delete_selected.configure(state="disabled", text_color=COLOR_TEXT_DIM)
+                _configure_changed(self.btn_disconnect_selected, state="disabled", text_color=COLOR_TEXT_DIM)
+                _configure_changed(self.btn_delete_selected, state="disabled", text_color=COLOR_TEXT_DIM)
             except Exception:
                 pass
             return
@@ -448,17 +581,19 @@ class AppDevicesMixin:
         else:
             status = self.tr("status_online") if online else self.tr("status_offline")
 
-        self.lbl_target.configure(text=f"{name}\n{self.selected_token[:8]}...")
-        self.lbl_target_status.configure(
+        # Runs on every sync tick; skip Tk reconfiguration when nothing changed.
+        _configure_changed(self.lbl_target, text=f"{name}\n{self.selected_token[:8]}...")
+        _configure_changed(
+            self.lbl_target_status,
             text=f"{status} | {ip}",
             text_color=(COLOR_WARN if (not approved) else (COLOR_ACCENT if online else COLOR_TEXT_DIM)),
         )
         try:
-            self.btn_delete_selected.configure(state="normal", text_color=COLOR_FAIL)
+            _configure_changed(self.btn_delete_selected, state="normal", text_color=COLOR_FAIL)
             if online:
-                self.btn_disconnect_selected.configure(state="normal", text_color=COLOR_TEXT)
+                _configure_changed(self.btn_disconnect_selected, state="normal", text_color=COLOR_TEXT)
             else:
-                self.btn_disconnect_selected.configure(state="disabled", text_color=COLOR_TEXT_DIM)
+                _configure_changed(self.btn_disconnect_selected, state="disabled", text_color=COLOR_TEXT_DIM)
         except Exception:
             pass
 
@@ -494,7 +629,7 @@ class AppDevicesMixin:
             finally:
                 self.ui_call(lambda: self.request_sync(150))
 
-        threading.Thread(target=_bg, daemon=True).start()
+        self.api_client.submit(_bg, priority=self.api_client.PRIORITY_NORMAL)
 
     def delete_device(self, token: str, name: str = "") -> Any:
         """Delete device."""
@@ -526,7 +661,7 @@ class AppDevicesMixin:
             finally:
                 self.ui_call(lambda: self.request_sync(150))
 
-        threading.Thread(target=_bg, daemon=True).start()
+        self.api_client.submit(_bg, priority=self.api_client.PRIORITY_NORMAL)
 
     def _normalize_chunk_kb_text(self, value: str) -> str:
         """Normalize chunk KB text."""
@@ -599,14 +734,14 @@ class AppDevicesMixin:
             """Translate helper with current app locale context."""
             return _tr_any(self, k, **kw)
 
-        can_edit = bool(self.selected_token and dirty)
+        edit_state = "normal" if (self.selected_token and dirty) else "disabled"
         try:
-            self.btn_save_device_settings.configure(state="normal" if can_edit else "disabled")
-            self.btn_reset_device_settings.configure(state="normal" if can_edit else "disabled")
+            _configure_changed(self.btn_save_device_settings, state=edit_state)
+            _configure_changed(self.btn_reset_device_settings, state=edit_state)
         except Exception:
             pass
         try:
-            self.lbl_device_dirty.configure(text=tr("unsaved_changes") if dirty else "")
+            _configure_changed(self.lbl_device_dirty, text=tr("unsaved_changes") if dirty else "")
         except Exception:
             pass
         if status_text is not None:
@@ -686,7 +821,7 @@ class AppDevicesMixin:
             finally:
                 self.ui_call(lambda: self.request_sync(150))
 
-        threading.Thread(target=_bg, daemon=True).start()
+        self.api_client.submit(_bg, priority=self.api_client.PRIORITY_NORMAL)
 
     def _mark_device_settings_saved(self) -> Any:
         """Mark device settings saved."""
@@ -712,43 +847,68 @@ class AppDevicesMixin:
             status_color=COLOR_WARN if dirty else COLOR_TEXT_DIM,
         )
 
+    def _apply_status(self, text: str, color: str) -> None:
+        """Set the status line text and colour (UI thread)."""
+        self.lbl_status.configure(text=text, text_color=color)
+
     def send_file(self) -> Any:
         """Send file."""
         if not self.selected_token:
             self.lbl_status.configure(text=self.tr("device_not_selected"), text_color=COLOR_FAIL)
             return
 
-        path = filedialog.askopenfilename(title=self.tr("choose_file"))
+        # Open where the last successful send came from instead of the process cwd
+        # (often the install dir or a slow network drive).
+        initial_dir = getattr(self, "_last_send_dir", "")
+        if initial_dir:
+            path = filedialog.askopenfilename(title=self.tr("choose_file"), initialdir=initial_dir)
+        else:
+            path = filedialog.askopenfilename(title=self.tr("choose_file"))
         if not path:
             return
 
         def _bg_send() -> None:
             """Send file transfer trigger request."""
-            self.ui_call(lambda: self.lbl_status.configure(text=self.tr("transfer_request"), text_color=COLOR_WARN))
+            token = self.selected_token
+            # Catch missing files and accidental double sends here, before an API round trip.
             try:
-                payload = {"token": self.selected_token, "file_path": path}
+                st = os.stat(path)
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
+                _queue_send_outcome(self, self.tr("transfer_msg_file_missing"))
+                return
+            send_key = (token, path, st.st_mtime_ns, st.st_size)
+            recent = _recent_sends(self)
+            sent_at = recent.get(send_key)
+            if sent_at is not None and time.monotonic() - sent_at < SEND_DEDUP_WINDOW_S:
+                self.ui_call(functools.partial(self.show_toast, self.tr("toast_transfer_duplicate"), level="info"))
+                return
+
+            self.ui_call(functools.partial(self._apply_status, self.tr("transfer_request"), COLOR_WARN))
+            try:
+                payload = {"token": token, "file_path": path}
                 resp = self.api_client.trigger_file(payload, timeout=4)
 
                 if resp.status_code == 200:
                     data = self.api_client.json_dict(resp)
                     if data.get("ok"):
-                        self.ui_call(lambda: self.lbl_status.configure(text=self.tr("transfer_started"), text_color=COLOR_ACCENT))
-                        self.ui_call(lambda: self.show_toast(self.tr("toast_transfer_started"), level="success"))
-                    else:
-                        fallback = self.api_client.describe_api_error(resp, default=self.tr("api_error"))
-                        msg = self._translate_transfer_msg(data.get("msg") or fallback)
-                        self.ui_call(lambda: self.lbl_status.configure(text=self.tr("error_prefix", msg=msg), text_color=COLOR_FAIL))
-                        self.ui_call(lambda: self.show_toast(self.tr("toast_transfer_error", msg=msg), level="error"))
+                        self._last_send_dir = os.path.dirname(path)
+                        recent[send_key] = time.monotonic()
+                        recent.move_to_end(send_key)
+                        while len(recent) > SEND_DEDUP_MAX:
+                            recent.popitem(last=False)
+                        _queue_send_outcome(self)
+                        return
+                    fallback = self.api_client.describe_api_error(resp, default=self.tr("api_error"))
+                    msg = self._translate_transfer_msg(data.get("msg") or fallback)
                 else:
                     msg = self.api_client.describe_api_error(resp, default=self.tr("api_error"))
-                    self.ui_call(lambda msg=msg: self.lbl_status.configure(text=self.tr("error_prefix", msg=msg), text_color=COLOR_FAIL))
-                    self.ui_call(lambda msg=msg: self.show_toast(self.tr("toast_transfer_error", msg=msg), level="error"))
             except Exception as e:
                 msg = self.api_client.describe_exception(e)
-                self.ui_call(lambda msg=msg: self.lbl_status.configure(text=self.tr("error_prefix", msg=msg), text_color=COLOR_FAIL))
-                self.ui_call(lambda msg=msg: self.show_toast(self.tr("toast_transfer_error", msg=msg), level="error"))
+            _queue_send_outcome(self, msg)
 
-        threading.Thread(target=_bg_send, daemon=True).start()
+        self.api_client.submit(_bg_send, priority=self.api_client.PRIORITY_NORMAL)
 
     def regenerate_code_action(self) -> Any:
         """Regenerate code action."""
@@ -756,11 +916,11 @@ class AppDevicesMixin:
             """Request pairing code regeneration."""
             try:
                 self.api_client.regenerate_code(timeout=2)
-                self.ui_call(lambda: self.show_toast(self.tr("toast_code_refreshing"), level="info"))
+                self.ui_call(functools.partial(self.show_toast, self.tr("toast_code_refreshing"), level="info"))
             except Exception:
-                self.ui_call(lambda: self.show_toast(self.tr("toast_code_refresh_failed"), level="error"))
+                self.ui_call(functools.partial(self.show_toast, self.tr("toast_code_refresh_failed"), level="error"))
 
-        threading.Thread(target=_req, daemon=True).start()
+        self.api_client.submit(_req, priority=self.api_client.PRIORITY_NORMAL)
 
     def copy_pairing_code(self) -> Any:
         """Copy pairing code."""
@@ -774,6 +934,10 @@ class AppDevicesMixin:
 
     def toggle_remote_input_lock(self) -> Any:
         """Toggle remote input lock state via local API."""
+        # Until the reply lands security_state is stale, so a second click would resend the same target.
+        inflight = _claim_inflight(self, "_lock_inflight")
+        if inflight is None:
+            return
         locked = bool((getattr(self, "security_state", {}) or {}).get("locked", False))
         target = not locked
 
@@ -782,26 +946,26 @@ class AppDevicesMixin:
             try:
                 reason = "launcher_lock" if target else "launcher_unlock"
                 resp = self.api_client.set_input_lock(target, reason=reason, actor="launcher", timeout=2.0)
-                if int(getattr(resp, "status_code", 0) or 0) != 200:
-                    raise RuntimeError(self.api_client.describe_api_error(resp))
-                body = self.api_client.json_dict(resp)
-                sec = body.get("security") if isinstance(body, dict) else {}
-                if isinstance(sec, dict):
-                    self.security_state = {
-                        "locked": bool(sec.get("locked", target)),
-                        "reason": str(sec.get("reason", "") or ""),
-                        "actor": str(sec.get("actor", "launcher") or "launcher"),
-                        "updated_ts": float(sec.get("updated_ts", 0.0) or 0.0),
-                    }
+                _body, state = _parse_security_response(
+                    self.api_client, resp, locked=target, reason="", actor="launcher"
+                )
+                if state is not None:
+                    self.security_state = state
+                # Only the lock state changed and the reply carried it: redraw, skip the resync.
+                refresh = self.update_gui_data if state is not None else functools.partial(self.request_sync, 150)
                 msg = self.tr("input_locked") if target else self.tr("input_unlocked")
-                self.ui_call(lambda msg=msg: self.show_toast(msg, level="warning" if target else "success"))
+                toast = (msg, "warning" if target else "success")
             except Exception as e:
                 msg = self.api_client.describe_exception(e)
-                self.ui_call(lambda msg=msg: self.show_toast(self.tr("input_lock_error", msg=msg), level="error"))
-            finally:
-                self.ui_call(lambda: self.request_sync(150))
+                toast = (self.tr("input_lock_error", msg=msg), "error")
+                refresh = functools.partial(self.request_sync, 150)
+            self.ui_batch(
+                functools.partial(self.show_toast, toast[0], level=toast[1]),
+                refresh,
+            )
 
-        threading.Thread(target=_bg, daemon=True).start()
+        future = self.api_client.submit(_bg, priority=self.api_client.PRIORITY_URGENT)
+        future.add_done_callback(lambda _f: inflight.clear())
 
     def panic_mode_action(self) -> Any:
         """Revoke all sessions and lock remote input in one emergency action."""
@@ -816,33 +980,43 @@ class AppDevicesMixin:
             ok = False
         if not ok:
             return
+        inflight = _claim_inflight(self, "_panic_inflight")
+        if inflight is None:
+            return
 
         def _bg() -> None:
             """Execute panic-mode request and refresh launcher state."""
             try:
                 resp = self.api_client.panic_mode(keep_token="", lock_input=True, reason="launcher_panic", timeout=4.0)
-                if int(getattr(resp, "status_code", 0) or 0) != 200:
-                    raise RuntimeError(self.api_client.describe_api_error(resp))
-                body = self.api_client.json_dict(resp)
-                revoked = int((body or {}).get("revoked", 0) or 0)
-                sec = (body or {}).get("security") if isinstance((body or {}).get("security"), dict) else {}
-                if isinstance(sec, dict):
-                    self.security_state = {
-                        "locked": bool(sec.get("locked", True)),
-                        "reason": str(sec.get("reason", "panic_mode") or "panic_mode"),
-                        "actor": str(sec.get("actor", "panic_mode") or "panic_mode"),
-                        "updated_ts": float(sec.get("updated_ts", 0.0) or 0.0),
-                    }
-                self.ui_call(
-                    lambda revoked=revoked: self.show_toast(
-                        self.tr("panic_mode_revoked", count=revoked), level="warning"
-                    )
+                body, state = _parse_security_response(
+                    self.api_client, resp, locked=True, reason="panic_mode", actor="panic_mode"
                 )
+                revoked = int(body.get("revoked", 0) or 0)
+                # Panic always leaves input locked, even if the reply lacks a snapshot.
+                self.security_state = state or {
+                    "locked": True,
+                    "reason": "panic_mode",
+                    "actor": "panic_mode",
+                    "updated_ts": 0.0,
+                }
+                refresh = functools.partial(self.request_sync, 150)
+                devices = body.get("devices")
+                if isinstance(devices, list) and state is not None:
+                    self.devices_data = devices
+                    pending = body.get("pending_devices")
+                    if isinstance(pending, list):
+                        self.pending_devices = pending
+                    refresh = self.update_gui_data
+                toast = (self.tr("panic_mode_revoked", count=revoked), "warning")
             except Exception as e:
                 msg = self.api_client.describe_exception(e)
-                self.ui_call(lambda msg=msg: self.show_toast(self.tr("panic_mode_error", msg=msg), level="error"))
-            finally:
-                self.ui_call(lambda: self.request_sync(150))
+                toast = (self.tr("panic_mode_error", msg=msg), "error")
+                refresh = functools.partial(self.request_sync, 150)
+            self.ui_batch(
+                functools.partial(self.show_toast, toast[0], level=toast[1]),
+                refresh,
+            )
 
-        threading.Thread(target=_bg, daemon=True).start()
+        future = self.api_client.submit(_bg, priority=self.api_client.PRIORITY_URGENT)
+        future.add_done_callback(lambda _f: inflight.clear())
 
@@ -1,9 +1,135 @@
 ﻿from __future__ import annotations
 
+import functools
+import re
+import types
 from typing import Any
 
 from .shared import *
 
+_NAV_BTN_IDLE = {"text_color": COLOR_TEXT_DIM, "fg_color": "transparent", "border_width": 0, "border_color": COLOR_BORDER}
+_NAV_BTN_ACTIVE = {"text_color": COLOR_TEXT, "fg_color": COLOR_PANEL_ALT, "border_width": 1, "border_color": COLOR_ACCENT}
+
+# Built once: every value is a module constant, and the tab builders only read it.
+_UI_THEME = types.MappingProxyType(
+    {
+        "CyberBtn": CyberBtn,
+        "COLOR_BG": COLOR_BG,
+        "COLOR_PANEL": COLOR_PANEL,
+        "COLOR_PANEL_ALT": COLOR_PANEL_ALT,
+        "COLOR_BORDER": COLOR_BORDER,
+        "COLOR_ACCENT": COLOR_ACCENT,
+        "COLOR_ACCENT_HOVER": COLOR_ACCENT_HOVER,
+        "COLOR_WARN": COLOR_WARN,
+        "COLOR_FAIL": COLOR_FAIL,
+        "COLOR_TEXT": COLOR_TEXT,
+        "COLOR_TEXT_DIM": COLOR_TEXT_DIM,
+        "FONT_UI_BOLD": FONT_UI_BOLD,
+        "FONT_HEADER": FONT_HEADER,
+        "FONT_SMALL": FONT_SMALL,
+        "FONT_CODE": FONT_CODE,
+        "DEFAULT_PORT": DEFAULT_PORT,
+        "DEFAULT_SETTINGS": DEFAULT_SETTINGS,
+        "APP_CONFIG_FILE_NAME": APP_CONFIG_FILE_NAME,
+        "DEFAULT_DEVICE_PRESETS": DEFAULT_DEVICE_PRESETS,
+    }
+)
+
+_INT_ENTRY_RE = re.compile(r"\A\s*(-?\d+)(?:\.\d*)?\s*\Z")
+
+
+def _entry_int(entry: Any, default: int) -> int:
+    """Parse integer from entry with fallback."""
+    try:
+        raw = entry.get()
+        # Plain and decimal numbers take the regex path; anything else (exponents, junk) falls through.
+        m = _INT_ENTRY_RE.match(raw) if isinstance(raw, str) else None
+        if m is not None:
+            return int(m.group(1))
+        v = str(raw).strip()
+        if v == "":
+            return int(default)
+        return int(float(v))
+    except Exception:
+        return int(default)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_tray_icon(path: str, mtime_ns: int) -> Any:
+    """Decode the tray icon once per file version; `mtime_ns` only keys the cache."""
+    with Image.open(path) as img:
+        img.load()
+        return img.copy()
+
+
+# Keys snapshotted by save_settings_action: changes to the first two restart the server,
+# the last one asks for a launcher restart.
+_RESTART_KEYS = (
+    "debug",
+    "preferred_port",
+    "pairing_ttl_min",
+    "session_ttl_days",
+    "session_idle_ttl_min",
+    "max_sessions",
+    "pin_window_s",
+    "pin_max_fails",
+    "pin_block_s",
+    "tls_enabled",
+    "tls_cert_path",
+    "tls_key_path",
+    "tls_ca_path",
+    "qr_mode",
+)
+_APP_RESTART_KEYS = (
+    "pairing_single_use",
+    "ignore_vpn",
+    "upload_max_bytes",
+    "upload_allowed_ext",
+    "verbose_http_log",
+    "verbose_ws_log",
+    "verbose_stream_log",
+    "mdns_enabled",
+    "device_approval_required",
+)
+_LAUNCHER_RESTART_KEYS = ("hotkey_enabled",)
+
+# (settings key, switch widget) pairs read back as booleans on save.
+_SETTINGS_SWITCHES = (
+    ("start_in_tray", "sw_start_in_tray"),
+    ("show_on_start", "sw_show_on_start"),
+    ("close_to_tray", "sw_close_to_tray"),
+    ("always_on_top", "sw_topmost"),
+    ("autostart", "sw_autostart"),
+    ("hotkey_enabled", "sw_hotkey"),
+    ("debug", "sw_debug"),
+    ("tls_enabled", "sw_tls"),
+)
+_OPTIONAL_SETTINGS_SWITCHES = (("system_notifications", "sw_system_notifications"),)
+_APP_CONFIG_SWITCHES = (
+    ("pairing_single_use", "sw_pairing_single_use"),
+    ("ignore_vpn", "sw_ignore_vpn"),
+    ("verbose_http_log", "sw_verbose_http_log"),
+    ("verbose_ws_log", "sw_verbose_ws_log"),
+    ("verbose_stream_log", "sw_verbose_stream_log"),
+    ("mdns_enabled", "sw_mdns_enabled"),
+    ("device_approval_required", "sw_device_approval_required"),
+)
+
+# Settings widgets that only some builds of the Settings tab create.
+_OPTIONAL_SETTINGS_WIDGETS = (
+    "sw_system_notifications",
+    "opt_language",
+    "sw_pairing_single_use",
+    "sw_ignore_vpn",
+    "ent_upload_max_bytes",
+    "ent_upload_allowed_ext",
+    "sw_verbose_http_log",
+    "sw_verbose_ws_log",
+    "sw_verbose_stream_log",
+    "sw_mdns_enabled",
+    "sw_device_approval_required",
+)
+
 
 class AppNavigationMixin:
     """Navigation, settings save flow, tray/menu, and app shutdown methods."""
@@ -33,27 +159,7 @@ class AppNavigationMixin:
 
     def _ui_theme(self) -> Any:
         """Return color palette used by navigation controls."""
-        return {
-            "CyberBtn": CyberBtn,
-            "COLOR_BG": COLOR_BG,
-            "COLOR_PANEL": COLOR_PANEL,
-            "COLOR_PANEL_ALT": COLOR_PANEL_ALT,
-            "COLOR_BORDER": COLOR_BORDER,
-            "COLOR_ACCENT": COLOR_ACCENT,
-            "COLOR_ACCENT_HOVER": COLOR_ACCENT_HOVER,
-            "COLOR_WARN": COLOR_WARN,
-            "COLOR_FAIL": COLOR_FAIL,
-            "COLOR_TEXT": COLOR_TEXT,
-            "COLOR_TEXT_DIM": COLOR_TEXT_DIM,
-            "FONT_UI_BOLD": FONT_UI_BOLD,
-            "FONT_HEADER": FONT_HEADER,
-            "FONT_SMALL": FONT_SMALL,
-            "FONT_CODE": FONT_CODE,
-            "DEFAULT_PORT": DEFAULT_PORT,
-            "DEFAULT_SETTINGS": DEFAULT_SETTINGS,
-            "APP_CONFIG_FILE_NAME": APP_CONFIG_FILE_NAME,
-            "DEFAULT_DEVICE_PRESETS": DEFAULT_DEVICE_PRESETS,
-        }
+        return _UI_THEME
 
     def setup_home(self) -> Any:
         """Build and attach widgets for the Home tab."""
@@ -66,6 +172,16 @@ class AppNavigationMixin:
     def setup_settings(self) -> Any:
         """Build and attach widgets for the Settings tab."""
         setup_settings_ui(self, self._ui_theme())
+        self._present_settings_widgets = frozenset(
+            name for name in _OPTIONAL_SETTINGS_WIDGETS if hasattr(self, name)
+        )
+
+    def _settings_widgets_present(self) -> frozenset:
+        """Return optional settings widget names created by the last Settings tab build."""
+        present = getattr(self, "_present_settings_widgets", None)
+        if present is None:
+            present = frozenset(name for name in _OPTIONAL_SETTINGS_WIDGETS if hasattr(self, name))
+        return present
 
     def _inline_text(self, ru_text: str, en_text: str) -> str:
         """Return short inline text in active language without touching i18n payload."""
@@ -139,6 +255,11 @@ class AppNavigationMixin:
                 self.restart_server()
             finally:
                 self._server_restart_dirty = False
+            if bool(getattr(self, "_qr_refresh_after_restart", False)):
+                # Expire the QR heartbeat so the first sync against the new server fetches it.
+                self._qr_refresh_after_restart = False
+                self._qr_next_fetch_ts = 0.0
+                self._qr_stable_cycles = 0
             self._set_settings_status(
                 self._inline_text("Сервер перезапущен", "Server restarted"),
                 COLOR_ACCENT,
@@ -213,96 +334,47 @@ class AppNavigationMixin:
             except Exception:
                 pass
 
-        restart_keys = (
-            "debug",
-            "preferred_port",
-            "pairing_ttl_min",
-            "session_ttl_days",
-            "session_idle_ttl_min",
-            "max_sessions",
-            "pin_window_s",
-            "pin_max_fails",
-            "pin_block_s",
-            "tls_enabled",
-            "tls_cert_path",
-            "tls_key_path",
-            "tls_ca_path",
-            "qr_mode",
-        )
-        app_restart_keys = (
-            "pairing_single_use",
-            "ignore_vpn",
-            "upload_max_bytes",
-            "upload_allowed_ext",
-            "verbose_http_log",
-            "verbose_ws_log",
-            "verbose_stream_log",
-            "mdns_enabled",
-            "device_approval_required",
-        )
-        launcher_restart_keys = ("hotkey_enabled",)
-        old_language = str(self.settings.get("language", "ru"))
-        old_restart_values = {k: self.settings.get(k) for k in restart_keys}
-        old_app_restart_values = {k: self.app_config.get(k) for k in app_restart_keys}
-        old_launcher_values = {k: self.settings.get(k) for k in launcher_restart_keys}
-
-        def _get_int(entry: Any, default: int) -> int:
-            """Parse integer from entry with fallback."""
-            try:
-                v = str(entry.get()).strip()
-                if v == "":
-                    return int(default)
-                return int(float(v))
-            except Exception:
-                return int(default)
-
-        self.settings["start_in_tray"] = bool(self.sw_start_in_tray.get())
-        self.settings["show_on_start"] = bool(self.sw_show_on_start.get())
-        self.settings["close_to_tray"] = bool(self.sw_close_to_tray.get())
-        self.settings["always_on_top"] = bool(self.sw_topmost.get())
-        self.settings["autostart"] = bool(self.sw_autostart.get())
-        self.settings["hotkey_enabled"] = bool(self.sw_hotkey.get())
-        self.settings["debug"] = bool(self.sw_debug.get())
-        if hasattr(self, "sw_system_notifications"):
-            self.settings["system_notifications"] = bool(self.sw_system_notifications.get())
-
-        self.settings["preferred_port"] = max(1, _get_int(self.ent_preferred_port, DEFAULT_PORT))
-        self.settings["pairing_ttl_min"] = max(0, _get_int(self.ent_pairing_ttl, 0))
-        self.settings["session_ttl_days"] = max(0, _get_int(self.ent_session_ttl_days, 0))
-        self.settings["session_idle_ttl_min"] = max(0, _get_int(self.ent_session_idle_min, 0))
-        self.settings["max_sessions"] = max(0, _get_int(self.ent_max_sessions, 0))
-        self.settings["pin_window_s"] = max(1, _get_int(self.ent_pin_window_s, 60))
-        self.settings["pin_max_fails"] = max(1, _get_int(self.ent_pin_max_fails, 8))
-        self.settings["pin_block_s"] = max(1, _get_int(self.ent_pin_block_s, 300))
-
-        self.settings["tls_enabled"] = bool(self.sw_tls.get())
-        self.settings["tls_cert_path"] = str(self.ent_tls_cert.get()).strip()
-        self.settings["tls_key_path"] = str(self.ent_tls_key.get()).strip()
-        self.settings["tls_ca_path"] = str(self.ent_tls_ca.get()).strip()
-        self.settings["qr_mode"] = str(self.qr_mode_var.get() or DEFAULT_SETTINGS["qr_mode"]).strip().lower()
+        # self.settings is edited in place, so this bound get also serves the diff below;
+        # app_config is replaced by _normalize_app_config and is re-read there.
+        settings_get = self.settings.get
+        app_config_get = self.app_config.get
+        old_language = str(settings_get("language", "ru"))
+        old_restart_values = {k: settings_get(k) for k in _RESTART_KEYS}
+        old_app_restart_values = {k: app_config_get(k) for k in _APP_RESTART_KEYS}
+        old_launcher_values = {k: settings_get(k) for k in _LAUNCHER_RESTART_KEYS}
+
+        present = self._settings_widgets_present()
+        for key, attr in _SETTINGS_SWITCHES:
+            self.settings[key] = bool(getattr(self, attr).get())
+        for key, attr in _OPTIONAL_SETTINGS_SWITCHES:
+            if attr in present:
+                self.settings[key] = bool(getattr(self, attr).get())
+
+        self.settings["preferred_port"] = max(1, _entry_int(self.ent_preferred_port, DEFAULT_PORT))
+        self.settings["pairing_ttl_min"] = max(0, _entry_int(self.ent_pairing_ttl, 0))
+        self.settings["session_ttl_days"] = max(0, _entry_int(self.ent_session_ttl_days, 0))
+        self.settings["session_idle_ttl_min"] = max(0, _entry_int(self.ent_session_idle_min, 0))
+        self.settings["max_sessions"] = max(0, _entry_int(self.ent_max_sessions, 0))
+        self.settings["pin_window_s"] = max(1, _entry_int(self.ent_pin_window_s, 60))
+        self.settings["pin_max_fails"] = max(1, _entry_int(self.ent_pin_max_fails, 8))
+        self.settings["pin_block_s"] = max(1, _entry_int(self.ent_pin_block_s, 300))
+
+        self.settings["tls_cert_path"] = self.ent_tls_cert.get().strip()
+        self.settings["tls_key_path"] = self.ent_tls_key.get().strip()
+        self.settings["tls_ca_path"] = self.ent_tls_ca.get().strip()
+        self.settings["qr_mode"] = (self.qr_mode_var.get() or DEFAULT_SETTINGS["qr_mode"]).strip().lower()
         if self.settings["qr_mode"] not in ("site", "app"):
             self.settings["qr_mode"] = DEFAULT_SETTINGS["qr_mode"]
-        if hasattr(self, "opt_language"):
+        if "opt_language" in present:
             self.settings["language"] = normalize_language(self.language_code_from_label(self.opt_language.get()))
 
-        if hasattr(self, "sw_pairing_single_use"):
-            self.app_config["pairing_single_use"] = bool(self.sw_pairing_single_use.get())
-        if hasattr(self, "sw_ignore_vpn"):
-            self.app_config["ignore_vpn"] = bool(self.sw_ignore_vpn.get())
-        if hasattr(self, "ent_upload_max_bytes"):
-            self.app_config["upload_max_bytes"] = max(0, _get_int(self.ent_upload_max_bytes, 0))
-        if hasattr(self, "ent_upload_allowed_ext"):
+        for key, attr in _APP_CONFIG_SWITCHES:
+            if attr in present:
+                self.app_config[key] = bool(getattr(self, attr).get())
+        if "ent_upload_max_bytes" in present:
+            self.app_config["upload_max_bytes"] = max(0, _entry_int(self.ent_upload_max_bytes, 0))
+        if "ent_upload_allowed_ext" in present:
             self.app_config["upload_allowed_ext"] = self._normalize_ext_csv(self.ent_upload_allowed_ext.get())
-        if hasattr(self, "sw_verbose_http_log"):
-            self.app_config["verbose_http_log"] = bool(self.sw_verbose_http_log.get())
-        if hasattr(self, "sw_verbose_ws_log"):
-            self.app_config["verbose_ws_log"] = bool(self.sw_verbose_ws_log.get())
-        if hasattr(self, "sw_verbose_stream_log"):
-            self.app_config["verbose_stream_log"] = bool(self.sw_verbose_stream_log.get())
-        if hasattr(self, "sw_mdns_enabled"):
-            self.app_config["mdns_enabled"] = bool(self.sw_mdns_enabled.get())
-        if hasattr(self, "sw_device_approval_required"):
-            self.app_config["device_approval_required"] = bool(self.sw_device_approval_required.get())
         self._normalize_app_config()
 
         tls_auto_generated = False
@@ -397,7 +469,10 @@ class AppNavigationMixin:
             else:
                 self.requests_verify = True
         self.api_url = f"{self.api_scheme}://127.0.0.1:{self.port}/api/local"
-        self.api_client.configure(self.api_url, self.requests_verify)
+        # configure() drops pooled sockets; only pay that when the target moved.
+        client = self.api_client
+        if getattr(client, "base_url", None) != self.api_url or getattr(client, "verify", None) != self.requests_verify:
+            client.configure(self.api_url, self.requests_verify)
         self.apply_settings()
         self.append_log("[launcher] settings applied\n")
         language_changed = str(self.settings.get("language", "ru")) != str(old_language)
@@ -417,10 +492,10 @@ class AppNavigationMixin:
 
         restart_server_needed = False
         try:
-            if any(self.settings.get(k) != old_restart_values.get(k) for k in restart_keys):
-                restart_server_needed = True
-            if any(self.app_config.get(k) != old_app_restart_values.get(k) for k in app_restart_keys):
-                restart_server_needed = True
+            # Snapshots already hold the old values; one lookup per key, stop at the first change.
+            restart_server_needed = any(
+                settings_get(k) != v for k, v in old_restart_values.items()
+            ) or any(self.app_config.get(k) != v for k, v in old_app_restart_values.items())
         except Exception:
             pass
         if restart_server_needed:
@@ -430,7 +505,7 @@ class AppNavigationMixin:
 
         launcher_restart_needed = False
         try:
-            if any(self.settings.get(k) != old_launcher_values.get(k) for k in launcher_restart_keys):
+            if any(settings_get(k) != v for k, v in old_launcher_values.items()):
                 if (not bool(self.settings.get("hotkey_enabled"))) and bool(old_launcher_values.get("hotkey_enabled")):
                     launcher_restart_needed = True
         except Exception:
@@ -444,44 +519,48 @@ class AppNavigationMixin:
 
         try:
             if self.settings.get("qr_mode") != old_restart_values.get("qr_mode"):
-                self.refresh_qr_code(force=True)
+                if bool(getattr(self, "_server_restart_dirty", False)):
+                    # A fetch now would hit the server that is about to go down; refetch after the restart.
+                    self._qr_refresh_after_restart = True
+                else:
+                    self.refresh_qr_code(force=True)
         except Exception:
             pass
 
     def select_frame(self, name: str) -> Any:
         """Select frame."""
         self.current_frame_name = str(name or "home")
-        self.home_frame.grid_forget()
-        self.devices_frame.grid_forget()
-        self.settings_frame.grid_forget()
-
-        for btn in (self.btn_home, self.btn_devices, self.btn_settings):
-            btn.configure(text_color=COLOR_TEXT_DIM, fg_color="transparent", border_width=0, border_color=COLOR_BORDER)
-
         if name == "home":
-            self.home_frame.grid(row=0, column=1, sticky="nsew")
-            self.btn_home.configure(
-                text_color=COLOR_TEXT,
-                fg_color=COLOR_PANEL_ALT,
-                border_width=1,
-                border_color=COLOR_ACCENT,
-            )
+            frame, btn = self.home_frame, self.btn_home
         elif name == "devices":
-            self.devices_frame.grid(row=0, column=1, sticky="nsew")
-            self.btn_devices.configure(
-                text_color=COLOR_TEXT,
-                fg_color=COLOR_PANEL_ALT,
-                border_width=1,
-                border_color=COLOR_ACCENT,
-            )
+            frame, btn = self.devices_frame, self.btn_devices
         else:
-            self.settings_frame.grid(row=0, column=1, sticky="nsew")
-            self.btn_settings.configure(
-                text_color=COLOR_TEXT,
-                fg_color=COLOR_PANEL_ALT,
-                border_width=1,
-                border_color=COLOR_ACCENT,
-            )
+            frame, btn = self.settings_frame, self.btn_settings
+
+        # Only the outgoing and incoming tab change; widget identity (not the name)
+        # decides, so a language rebuild with fresh widgets re-grids as expected.
+        shown = getattr(self, "_shown_frame", None)
+        if shown is frame:
+            return
+        if shown is None:
+            for other in (self.home_frame, self.devices_frame, self.settings_frame):
+                other.grid_forget()
+        else:
+            try:
+                shown.grid_forget()
+            except Exception:
+                pass
+        prev_btn = getattr(self, "_selected_nav_btn", None)
+        if prev_btn is not None and prev_btn is not btn:
+            try:
+                prev_btn.configure(**_NAV_BTN_IDLE)
+            except Exception:
+                pass
+
+        frame.grid(row=0, column=1, sticky="nsew")
+        btn.configure(**_NAV_BTN_ACTIVE)
+        self._shown_frame = frame
+        self._selected_nav_btn = btn
 
     def setup_tray(self) -> Any:
         """Initialize system tray menu actions and icon behavior."""
@@ -491,8 +570,17 @@ class AppNavigationMixin:
             self.ui_call(self._ensure_window_visible)
             return
 
+        # Imported on first tray setup: pystray pulls in the platform tray backend
+        # (Xlib/AppIndicator/win32), which cold start does not need.
+        try:
+            import pystray
+        except Exception as e:
+            self.append_log(f"[launcher] tray unavailable: {e}\n")
+            self.ui_call(self._ensure_window_visible)
+            return
+
         try:
-            image = Image.open(self.icon_path_png)
+            image = _load_tray_icon(self.icon_path_png, os.stat(self.icon_path_png).st_mtime_ns)
         except Exception:
             image = Image.new("RGB", (64, 64), color="green")
 
@@ -696,7 +784,17 @@ class AppNavigationMixin:
                 pass
 
     def _close_help_window(self) -> Any:
-        """Close help window if it exists."""
+        """Hide help window; show_help re-shows it instead of rebuilding its widgets."""
+        win = getattr(self, "_help_window", None)
+        if not win:
+            return
+        try:
+            win.withdraw()
+        except Exception:
+            self._destroy_help_window()
+
+    def _destroy_help_window(self) -> Any:
+        """Destroy the cached help window so the next show_help rebuilds it (e.g. new language)."""
         win = getattr(self, "_help_window", None)
         self._help_window = None
         if not win:
@@ -714,7 +812,6 @@ class AppNavigationMixin:
         try:
             self.clipboard_clear()
             self.clipboard_append(payload)
-            self.update_idletasks()
             self.show_toast(self.tr("help_commands_copied"), level="success")
         except Exception:
             pass
@@ -738,6 +835,8 @@ class AppNavigationMixin:
     def open_support_page(self) -> Any:
         """Open or close resources required to open support page."""
         try:
+            import webbrowser
+
             urls = [str(SUPPORT_URL or "").strip(), *[str(x or "").strip() for x in SUPPORT_URLS]]
             opened = False
             seen: set[str] = set()
@@ -794,5 +893,14 @@ class AppNavigationMixin:
                 self.tray.stop()
         except Exception:
             pass
+        stream_stop = getattr(self, "_event_stream_stop", None)
+        if stream_stop is not None:
+            stream_stop.set()
+        api_client = getattr(self, "api_client", None)
+        if api_client is not None:
+            api_client.close()
+        sync_pool = getattr(self, "_sync_pool", None)
+        if sync_pool is not None:
+            sync_pool.shutdown(wait=False, cancel_futures=True)
         os._exit(0)
 
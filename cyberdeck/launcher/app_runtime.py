@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 
+import concurrent.futures
 from typing import Any
 
 from .shared import *
@@ -18,6 +19,34 @@ def _env_bool(name: str, default: bool) -> bool:
     return bool(default)
 
 
+def _wait_server_stopped(proc: Any, threads: Any, timeout_s: float) -> None:
+    """Block until the old server process and threads have exited, or `timeout_s` passes."""
+    deadline = time.monotonic() + timeout_s
+    if proc is not None:
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except Exception:
+            pass
+    for thread in threads:
+        if thread is None:
+            continue
+        try:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        except Exception:
+            pass
+
+
+def _remember(seen: OrderedDict, key: Any) -> bool:
+    """Add `key` to a bounded LRU set; return False when it was already present."""
+    if key in seen:
+        seen.move_to_end(key)
+        return False
+    seen[key] = None
+    if len(seen) > NOTIFIED_KEYS_MAX:
+        seen.popitem(last=False)
+    return True
+
+
 class AppRuntimeMixin:
     """Runtime/server synchronization and device list rendering methods."""
 
@@ -69,6 +98,15 @@ class AppRuntimeMixin:
 
             self.server_thread = threading.Thread(target=_run, daemon=True)
             self.server_thread.start()
+
+            from cyberdeck.server import serve_local_socket
+
+            socket_server = serve_local_socket(
+                str(getattr(self, "local_socket_path", "") or ""),
+                log_level=log_level,
+            )
+            if socket_server is not None:
+                self._uvicorn_socket_server, self._socket_server_thread = socket_server
         except Exception as e:
             self.append_log(f"[launcher] in-process server start error: {e}\n")
             self._show_server_start_error(str(e))
@@ -85,18 +123,48 @@ class AppRuntimeMixin:
         try:
             if self._uvicorn_server:
                 self._uvicorn_server.should_exit = True
+                # Streaming responses would keep uvicorn's graceful shutdown waiting forever.
+                from cyberdeck.context import local_events
+
+                local_events.close_streams()
         except Exception:
             pass
         self._uvicorn_server = None
+        try:
+            if self._uvicorn_socket_server:
+                self._uvicorn_socket_server.should_exit = True
+        except Exception:
+            pass
+        self._uvicorn_socket_server = None
+        self._socket_server_thread = None
         self.server_thread = None
+        try:
+            self.api_client.close_event_stream()
+        except Exception:
+            pass
 
     def restart_server(self) -> Any:
         """Manage lifecycle transition to restart server."""
         # Lifecycle transitions are centralized here to prevent partial-state bugs.
+        if bool(getattr(self, "_restart_pending", False)):
+            return
         self.append_log("[launcher] restarting server...\n")
+        proc = self.server_process
+        threads = (self.server_thread, getattr(self, "_socket_server_thread", None))
         self.stop_server_process()
-        time.sleep(0.2)
-        self.start_server_process()
+        self._restart_pending = True
+
+        def _start() -> None:
+            """Start the new server on the UI thread once the old one released its port."""
+            self._restart_pending = False
+            self.start_server_process()
+
+        def _wait_then_start() -> None:
+            """Wait off the UI thread for the old server to exit."""
+            _wait_server_stopped(proc, threads, SERVER_STOP_WAIT_S)
+            self.ui_call(_start)
+
+        threading.Thread(target=_wait_then_start, name="cd-server-restart", daemon=True).start()
 
     def server_stdout_loop(self) -> Any:
         """Read server stdout stream if subprocess writes into it."""
@@ -210,13 +278,25 @@ class AppRuntimeMixin:
             return None
 
     def _schedule_sync(self, delay_ms: int) -> Any:
-        """Schedule sync."""
+        """Schedule sync, keeping an already pending pass that fires no later."""
+        delay_ms = max(0, int(delay_ms))
+        target = time.monotonic() + delay_ms / 1000.0
+        if self._sync_job is not None and target >= float(getattr(self, "_sync_deadline_mono", 0.0)) - 0.005:
+            return
         try:
             if self._sync_job is not None:
                 self.after_cancel(self._sync_job)
         except Exception:
             pass
-        self._sync_job = self._safe_after(max(0, int(delay_ms)), self.sync_loop)
+        self._sync_job = self._safe_after(delay_ms, self.sync_loop)
+        self._sync_deadline_mono = target
+
+    def _sync_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the reusable worker that runs sync passes (one at a time by design)."""
+        pool = getattr(self, "_sync_pool", None)
+        if pool is None:
+            pool = self._sync_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="cd-sync")
+        return pool
 
     def request_sync(self, delay_ms: int = 0) -> Any:
         """Request a deferred GUI synchronization pass."""
@@ -229,6 +309,21 @@ class AppRuntimeMixin:
         except Exception:
             pass
 
+    def ui_batch(self, *fns: Any) -> Any:
+        """Queue several UI-thread callables as one item so they apply together, in order."""
+        def _run() -> None:
+            """Run batched callbacks; one failing does not skip the rest."""
+            for fn in fns:
+                try:
+                    fn()
+                except Exception as e:
+                    try:
+                        self.append_log(f"[launcher] ui callback error: {e}\n")
+                    except Exception:
+                        pass
+
+        self.ui_call(_run)
+
     def tr(self, key: str, **kwargs: Any) -> str:
         """Translate a localization key using the active language."""
         return i18n_tr(self.settings.get("language", "ru"), key, **kwargs)
@@ -286,59 +381,89 @@ class AppRuntimeMixin:
         et = str(event.get("type") or "").strip().lower()
         payload = event.get("payload") if isinstance(event.get("payload"), dict) else {}
         event_id = int(event.get("id") or 0)
-        if et == "device_connected":
-            token = str(payload.get("token") or "")
-            if token and token in self._notified_device_tokens:
-                return
-            if token:
-                self._notified_device_tokens.add(token)
-            name = str(payload.get("name") or payload.get("device_name") or self.tr("unknown_device"))
-            text = self.tr("notify_device_connected", name=name)
-            self.show_toast(text, level="success")
-            self._notify_system(self.tr("app_name"), text)
-            return
-        if et == "device_disconnected":
-            name = str(payload.get("name") or payload.get("device_name") or self.tr("unknown_device"))
-            self.show_toast(self.tr("notify_device_disconnected", name=name), level="info")
-            return
-        if et == "file_received":
-            if event_id in self._notified_upload_events:
-                return
-            self._notified_upload_events.add(event_id)
-            filename = str(payload.get("filename") or "file")
-            text = self.tr("notify_file_received", filename=filename)
-            self.show_toast(text, level="info")
-            self._notify_system(self.tr("app_name"), text)
+        handler = _LOCAL_EVENT_HANDLERS.get(et)
+        if handler is not None:
+            handler(self, event, payload, event_id)
+
+    def _on_device_connected_event(self, event: dict[str, Any], payload: dict[str, Any], event_id: int) -> None:
+        """Announce a newly connected device once per token."""
+        token = str(payload.get("token") or "")
+        if token and not _remember(self._notified_device_tokens, token):
             return
-        if et == "input_lock_changed":
-            sec = payload.get("security") if isinstance(payload.get("security"), dict) else {}
-            self.security_state = {
-                "locked": bool(sec.get("locked", False)),
-                "reason": str(sec.get("reason", "") or ""),
-                "actor": str(sec.get("actor", "system") or "system"),
-                "updated_ts": float(sec.get("updated_ts", 0.0) or 0.0),
-            }
-            self.show_toast(self.tr("notify_input_lock_changed"), level="info")
+        name = str(payload.get("name") or payload.get("device_name") or self.tr("unknown_device"))
+        text = self.tr("notify_device_connected", name=name)
+        self.show_toast(text, level="success")
+        self._notify_system(self.tr("app_name"), text)
+
+    def _on_device_disconnected_event(self, event: dict[str, Any], payload: dict[str, Any], event_id: int) -> None:
+        """Show a toast for a disconnected device."""
+        name = str(payload.get("name") or payload.get("device_name") or self.tr("unknown_device"))
+        self.show_toast(self.tr("notify_device_disconnected", name=name), level="info")
+
+    def _on_file_received_event(self, event: dict[str, Any], payload: dict[str, Any], event_id: int) -> None:
+        """Announce a received upload once per event id."""
+        if not _remember(self._notified_upload_events, event_id):
             return
-        if et == "panic_mode":
-            revoked = int(payload.get("revoked", 0) or 0)
-            sec = payload.get("security") if isinstance(payload.get("security"), dict) else {}
-            self.security_state = {
-                "locked": bool(sec.get("locked", True)),
-                "reason": str(sec.get("reason", "panic_mode") or "panic_mode"),
-                "actor": str(sec.get("actor", "panic_mode") or "panic_mode"),
-                "updated_ts": float(sec.get("updated_ts", 0.0) or 0.0),
-            }
-            msg = self.tr("notify_panic_mode_revoked", count=revoked)
-            self.show_toast(msg, level="warning")
-            self._notify_system(self.tr("app_name"), msg)
-            return
-        if et == "device_pending":
-            self._notify_system(
-                self.tr("app_name"),
-                str(event.get("message") or self.tr("notify_device_approval_required")),
+        filename = str(payload.get("filename") or "file")
+        text = self.tr("notify_file_received", filename=filename)
+        self.show_toast(text, level="info")
+        self._notify_system(self.tr("app_name"), text)
+
+    def _on_input_lock_changed_event(self, event: dict[str, Any], payload: dict[str, Any], event_id: int) -> None:
+        """Mirror the server's input-lock state."""
+        sec = payload.get("security") if isinstance(payload.get("security"), dict) else {}
+        self.security_state = {
+            "locked": bool(sec.get("locked", False)),
+            "reason": str(sec.get("reason", "") or ""),
+            "actor": str(sec.get("actor", "system") or "system"),
+            "updated_ts": float(sec.get("updated_ts", 0.0) or 0.0),
+        }
+        self.show_toast(self.tr("notify_input_lock_changed"), level="info")
+
+    def _on_panic_mode_event(self, event: dict[str, Any], payload: dict[str, Any], event_id: int) -> None:
+        """Mirror panic-mode lock state and report revoked sessions."""
+        revoked = int(payload.get("revoked", 0) or 0)
+        sec = payload.get("security") if isinstance(payload.get("security"), dict) else {}
+        self.security_state = {
+            "locked": bool(sec.get("locked", True)),
+            "reason": str(sec.get("reason", "panic_mode") or "panic_mode"),
+            "actor": str(sec.get("actor", "panic_mode") or "panic_mode"),
+            "updated_ts": float(sec.get("updated_ts", 0.0) or 0.0),
+        }
+        msg = self.tr("notify_panic_mode_revoked", count=revoked)
+        self.show_toast(msg, level="warning")
+        self._notify_system(self.tr("app_name"), msg)
+
+    def _on_device_pending_event(self, event: dict[str, Any], payload: dict[str, Any], event_id: int) -> None:
+        """Notify about a device waiting for approval and open the prompt."""
+        self._notify_system(
+            self.tr("app_name"),
+            str(event.get("message") or self.tr("notify_device_approval_required")),
+        )
+        self._prompt_pending_approval()
+
+    def event_stream_loop(self) -> Any:
+        """Receive local events over the SSE stream; sync_loop polling covers any gaps."""
+
+        def _on_event(evt: dict[str, Any]) -> None:
+            try:
+                event_id = int(evt.get("id") or 0)
+            except Exception:
+                event_id = 0
+            if event_id > self._last_local_event_id:
+                self._last_local_event_id = event_id
+            self.ui_call(lambda evt=evt: self._handle_local_event(evt))
+
+        try:
+            supported = self.api_client.stream_events(
+                _on_event,
+                since_id=self._last_local_event_id,
+                stop=self._event_stream_stop,
             )
-            self._prompt_pending_approval()
+        except Exception:
+            supported = False
+        if not supported:
+            self.append_log("[launcher] event stream unavailable, polling /events\n")
 
     def _approve_device_async(self, token: str, allow: bool) -> Any:
         """Call local approval API and refresh launcher state."""
@@ -352,14 +477,14 @@ class AppRuntimeMixin:
                 else:
                     self.ui_call(lambda: self.show_toast(self.tr("device_denied"), level="info"))
             except Exception as e:
-                self._pending_prompted_tokens.discard(str(token or ""))
+                self._pending_prompted_tokens.pop(str(token or ""), None)
                 self.ui_call(lambda e=e: self.show_toast(self.tr("approval_error", msg=e), level="error"))
             finally:
                 self._approval_dialog_active = False
                 self.ui_call(lambda: self.request_sync(150))
                 self.ui_call(self._prompt_pending_approval)
 
-        threading.Thread(target=_bg, daemon=True).start()
+        self.api_client.submit(_bg, priority=self.api_client.PRIORITY_URGENT)
 
     def _approval_button_labels(self) -> tuple[str, str]:
         """Return localized labels for approval dialog actions."""
@@ -575,9 +700,8 @@ class AppRuntimeMixin:
             token = str(row.get("token") or "").strip()
             if not token:
                 continue
-            if token in self._pending_prompted_tokens:
+            if not _remember(self._pending_prompted_tokens, token):
                 continue
-            self._pending_prompted_tokens.add(token)
             self._approval_dialog_active = True
             name = str(row.get("name") or row.get("device_id") or self.tr("unknown_device"))
             ip = str(row.get("ip") or "-")
@@ -602,6 +726,8 @@ class AppRuntimeMixin:
         if active not in ("home", "devices", "settings"):
             active = "home"
         saved_token = self.selected_token
+        # The hidden help window keeps old-language text; drop it so it is rebuilt on next open.
+        self._destroy_help_window()
         for name in ("sidebar", "home_frame", "devices_frame", "settings_frame"):
             w = getattr(self, name, None)
             if not w:
@@ -672,9 +798,14 @@ class AppRuntimeMixin:
 
     def _process_ui_queue(self) -> Any:
         """Execute pending UI-thread callbacks from the queue."""
+        q = self._ui_queue
+        budget = UI_QUEUE_DRAIN_MAX
         try:
-            while True:
-                fn = self._ui_queue.get_nowait()
+            # Only this tick consumes the queue, so a non-empty check guarantees the get;
+            # idle ticks return without raising queue.Empty.
+            while budget > 0 and not q.empty():
+                budget -= 1
+                fn = q.get_nowait()
                 try:
                     fn()
                 except Exception as e:
@@ -685,7 +816,8 @@ class AppRuntimeMixin:
         except Exception:
             pass
         try:
-            self.after(50, self._process_ui_queue)
+            # A burst left over after the budget resumes on the next loop turn, after input and redraws.
+            self.after(1 if budget == 0 else UI_QUEUE_POLL_MS, self._process_ui_queue)
         except Exception:
             pass
 
@@ -701,7 +833,23 @@ class AppRuntimeMixin:
             """Fetch launcher status snapshot from local API."""
             was_online = bool(getattr(self, "server_online", False))
             try:
-                resp = self.api_client.get_info(timeout=1)
+                now_mono = time.monotonic()
+                updates_due = now_mono >= float(getattr(self, "_next_update_pull_ts", 0.0) or 0.0)
+                # A live event stream already delivers events; poll only as fallback.
+                poll_events = not self.api_client.stream_connected
+                events_path = self.api_client.events_path(since_id=self._last_local_event_id, limit=80)
+                # Info, events and (periodically) updates are independent reads; one
+                # concurrent fan-out makes the tick cost the slowest call, not the sum.
+                fanout_timeouts = {"info": 1.0, events_path: 1.3, "updates": 2.5}
+                fanout_paths = ["info"]
+                if poll_events:
+                    fanout_paths.append(events_path)
+                if updates_due:
+                    fanout_paths.append("updates")
+                fanout = self.api_client.get_many(fanout_paths, timeouts=fanout_timeouts)
+                resp = fanout.get("info")
+                if isinstance(resp, BaseException):
+                    raise resp
                 if resp.status_code == 200:
                     data = self.api_client.json_dict(resp)
                     if not data:
@@ -753,10 +901,11 @@ class AppRuntimeMixin:
                         "actor": str(sec.get("actor", "system") or "system"),
                         "updated_ts": float(sec.get("updated_ts", 0.0) or 0.0),
                     }
-                    now_mono = time.monotonic()
-                    if now_mono >= float(getattr(self, "_next_update_pull_ts", 0.0) or 0.0):
+                    if updates_due:
                         try:
-                            updates_resp = self.api_client.get_updates(timeout=2.5, force_refresh=False)
+                            updates_resp = fanout.get("updates")
+                            if isinstance(updates_resp, BaseException):
+                                raise updates_resp
                             if updates_resp.status_code == 200:
                                 updates_payload = self.api_client.json_dict(updates_resp)
                                 if updates_payload:
@@ -767,24 +916,27 @@ class AppRuntimeMixin:
                         except Exception:
                             self._next_update_pull_ts = now_mono + 45.0
                     self._update_status_line = self._build_update_status_line()
-                    try:
-                        events_resp = self.api_client.get_events(since_id=self._last_local_event_id, limit=80, timeout=1.3)
-                        if events_resp.status_code == 200:
-                            payload = self.api_client.json_dict(events_resp)
-                            events = payload.get("events") if isinstance(payload.get("events"), list) else []
-                            try:
-                                latest_id = int(payload.get("latest_id") or self._last_local_event_id)
-                            except Exception:
-                                latest_id = self._last_local_event_id
-                            if self._last_local_event_id < 0:
-                                self._last_local_event_id = latest_id
-                                events = []
-                            for evt in events:
-                                self.ui_call(lambda evt=evt: self._handle_local_event(evt))
-                            if latest_id > self._last_local_event_id:
-                                self._last_local_event_id = latest_id
-                    except Exception:
-                        pass
+                    if poll_events:
+                        try:
+                            events_resp = fanout.get(events_path)
+                            if isinstance(events_resp, BaseException):
+                                raise events_resp
+                            if events_resp.status_code == 200:
+                                payload = self.api_client.json_dict(events_resp)
+                                events = payload.get("events") if isinstance(payload.get("events"), list) else []
+                                try:
+                                    latest_id = int(payload.get("latest_id") or self._last_local_event_id)
+                                except Exception:
+                                    latest_id = self._last_local_event_id
+                                if self._last_local_event_id < 0:
+                                    self._last_local_event_id = latest_id
+                                    events = []
+                                for evt in events:
+                                    self.ui_call(lambda evt=evt: self._handle_local_event(evt))
+                                if latest_id > self._last_local_event_id:
+                                    self._last_local_event_id = latest_id
+                        except Exception:
+                            pass
                     self.ui_call(self._maybe_show_update_popup)
                     self.ui_call(self._prompt_pending_approval)
                 else:
@@ -802,7 +954,7 @@ class AppRuntimeMixin:
                 self.ui_call(self.update_gui_data)
                 self.ui_call(lambda: self._schedule_sync(SYNC_INTERVAL_MS))
 
-        threading.Thread(target=_fetch, daemon=True).start()
+        self._sync_executor().submit(_fetch)
 
     def _device_display_name(self, d: dict) -> str:
         """Build the display name shown for a connected device."""
@@ -1235,3 +1387,13 @@ class AppRuntimeMixin:
 
         self.refresh_selected_panel()
 
+
+# Local event type -> handler, resolved once instead of walking an if-chain per event.
+_LOCAL_EVENT_HANDLERS = {
+    "device_connected": AppRuntimeMixin._on_device_connected_event,
+    "device_disconnected": AppRuntimeMixin._on_device_disconnected_event,
+    "file_received": AppRuntimeMixin._on_file_received_event,
+    "input_lock_changed": AppRuntimeMixin._on_input_lock_changed_event,
+    "panic_mode": AppRuntimeMixin._on_panic_mode_event,
+    "device_pending": AppRuntimeMixin._on_device_pending_event,
+}
@@ -119,6 +119,9 @@ class AppStartupMixin:
         self.server_process = None
         self.server_thread = None
         self._uvicorn_server = None
+        self._uvicorn_socket_server = None
+        self._socket_server_thread = None
+        self._restart_pending = False
         self._hotkey_thread_started = False
         self.tray = None
         self._server_log_ring = deque(maxlen=400)
@@ -126,8 +129,13 @@ class AppStartupMixin:
         self._qr_next_fetch_ts = 0.0
         self._qr_fetch_inflight = False
         self._qr_last_state_signature = None
-        self._qr_ctk_img = None
         self._qr_tk_img = None
+        self._qr_last_text = None
+        self._qr_shown_label = None
+        self._qr_stable_cycles = 0
+        self._qr_render_cache = {}
+        self._qr_logo_path = None
+        self._qr_logo_bytes = None
         self.devices_data = []
         self.show_offline = ctk.BooleanVar(value=False)
         self.selected_token = None
@@ -143,7 +151,12 @@ class AppStartupMixin:
         self.server_port = int(self.port)
         self._refresh_api_transport()
         self.api_url = f"{self.api_scheme}://127.0.0.1:{self.port}/api/local"
-        self.api_client = LauncherApiClient(self.api_url, verify=self.requests_verify)
+        self.local_socket_path = str(getattr(server_config, "LOCAL_SOCKET", "") or "")
+        self.api_client = LauncherApiClient(
+            self.api_url,
+            verify=self.requests_verify,
+            socket_path=self.local_socket_path,
+        )
         self.server_version = self.tr("unknown_value")
         self.status_text = self.tr("server_placeholder")
         self.server_online = False
@@ -155,12 +168,17 @@ class AppStartupMixin:
         }
         self.pending_devices = []
         self.security_state = {"locked": False, "reason": "", "actor": "system", "updated_ts": 0.0}
+        self._lock_inflight = threading.Event()
+        self._panic_inflight = threading.Event()
+        self._last_send_dir = ""
+        self._recent_sends = OrderedDict()
         self._last_local_event_id = -1
-        self._notified_device_tokens = set()
-        self._notified_upload_events = set()
+        self._event_stream_stop = threading.Event()
+        self._notified_device_tokens = OrderedDict()
+        self._notified_upload_events = OrderedDict()
         self._approval_dialog_active = False
         self._approval_dialog_window = None
-        self._pending_prompted_tokens = set()
+        self._pending_prompted_tokens = OrderedDict()
         self._seen_update_popup_keys = set()
         self._next_update_pull_ts = 0.0
         self._update_status_line = self.tr("updates_not_checked")
@@ -181,10 +199,12 @@ class AppStartupMixin:
 
         self._sync_inflight = False
         self._sync_job = None
+        self._sync_deadline_mono = 0.0
+        self._sync_pool = None
         self._device_rows = {}
         self._device_row_order = []
         self._device_empty_label = None
-        self._ui_queue = queue.Queue()
+        self._ui_queue = queue.SimpleQueue()
         self._device_settings_dirty = False
         self._selected_device_form_state = None
         self._suppress_device_setting_trace = False
@@ -238,8 +258,9 @@ class AppStartupMixin:
         )
         self.start_server_process()
 
-        self.after(50, self._process_ui_queue)
+        self.after(UI_QUEUE_POLL_MS, self._process_ui_queue)
         self._schedule_sync(0)
+        threading.Thread(target=self.event_stream_loop, daemon=True).start()
         tray_reason = str(getattr(self, "_tray_reason_cached", "") or "").strip()
         if self.settings.get("start_in_tray") or self.settings.get("close_to_tray"):
             if tray_reason:
@@ -634,6 +655,7 @@ class AppStartupMixin:
         env["CYBERDECK_MDNS"] = "1" if bool(self.app_config.get("mdns_enabled", True)) else "0"
         env["CYBERDECK_DEVICE_APPROVAL_REQUIRED"] = "1" if bool(self.app_config.get("device_approval_required", True)) else "0"
         env["CYBERDECK_LAUNCHER_PID"] = str(int(os.getpid()))
+        env["CYBERDECK_LOCAL_SOCKET"] = str(getattr(self, "local_socket_path", "") or "")
         env["CYBERDECK_HIDE_LAUNCHER_FROM_CAPTURE"] = (
             "1" if self._capture_exclusion_enabled() else "0"
         )
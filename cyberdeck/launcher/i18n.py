@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Dict
+import functools
 import json
 import os
 import re
@@ -123,13 +124,31 @@ def language_code(label: str) -> str:
     return "ru"
 
 
+def _lookup(lang: str, key: str) -> str:
+    """Return the raw template for a key, falling back to Russian, then the key."""
+    text = _T.get(lang, {}).get(key)
+    if text is None:
+        text = _T.get("ru", {}).get(key, key)
+    return str(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _tr_static(lang: str, key: str) -> str:
+    """Resolve a parameterless string once per language; the table is fixed after import."""
+    text = _lookup(lang, key)
+    try:
+        return text.format()
+    except Exception:
+        return text
+
+
 def tr(lang: str, key: str, **kwargs) -> str:
     """Translate a localization key using the active language."""
     c = normalize_language(lang)
-    text = _T.get(c, {}).get(key)
-    if text is None:
-        text = _T.get("ru", {}).get(key, key)
+    if not kwargs:
+        return _tr_static(c, str(key))
+    text = _lookup(c, key)
     try:
-        return str(text).format(**kwargs)
+        return text.format(**kwargs)
     except Exception:
-        return str(text)
+        return text
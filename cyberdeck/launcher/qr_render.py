@@ -0,0 +1,231 @@
+"""Launcher QR bitmap rendering.
+
+Kept free of Tk/launcher imports; callers pass theme colours in explicitly.
+"""
+
+from __future__ import annotations
+
+import functools
+import io
+from typing import Any, NamedTuple
+
+import qrcode
+from PIL import Image, ImageDraw
+
+try:
+    import segno as _segno
+except Exception:
+    _segno = None
+
+
+QR_MODULE_RGB = (8, 26, 18)
+QR_BG_RGB = (246, 255, 250)
+_QR_BG_RGBA = QR_BG_RGB + (255,)
+_PANEL_OUTLINE_RGBA = (205, 225, 214, 255)
+_SHADOW_RGBA = (0, 0, 0, 58)
+
+_QR_ERROR_LEVELS = {
+    "l": qrcode.constants.ERROR_CORRECT_L,
+    "m": qrcode.constants.ERROR_CORRECT_M,
+    "q": qrcode.constants.ERROR_CORRECT_Q,
+    "h": qrcode.constants.ERROR_CORRECT_H,
+}
+
+
+class _QrGeometry(NamedTuple):
+    """Pixel layout of a framed QR bitmap of one size."""
+
+    frame_pad: int
+    frame_radius: int
+    frame_width: int
+    qr_pad: int
+    qr_side: int
+    qr_radius: int
+    shadow_off: int
+    qr_inner_pad: int
+    qr_inner_side: int
+    logo_size: int
+    quiet_size: int
+
+
+@functools.lru_cache(maxsize=8)
+def _qr_geometry(size: int) -> _QrGeometry:
+    """Compute QR frame/panel/logo layout for a bitmap size."""
+    qr_pad = max(8, int(size * 0.036))
+    qr_side = max(1, size - qr_pad * 2)
+    qr_inner_pad = max(4, int(qr_side * 0.015))
+    logo_size = max(42, int(size * 0.18))
+    return _QrGeometry(
+        frame_pad=max(1, int(size * 0.005)),
+        frame_radius=max(6, int(size * 0.04)),
+        frame_width=max(1, int(size * 0.004)),
+        qr_pad=qr_pad,
+        qr_side=qr_side,
+        qr_radius=max(6, int(qr_side * 0.04)),
+        shadow_off=max(1, int(size * 0.006)),
+        qr_inner_pad=qr_inner_pad,
+        qr_inner_side=qr_side - qr_inner_pad * 2,
+        logo_size=logo_size,
+        quiet_size=int(max(logo_size + 12, logo_size * 1.34)),
+    )
+
+
+def hex_to_rgb(value: str, fallback: tuple[int, int, int]) -> tuple[int, int, int]:
+    """Parse #RRGGBB color to RGB tuple with fallback."""
+    text = str(value or "").strip()
+    if len(text) == 7 and text.startswith("#"):
+        try:
+            return (int(text[1:3], 16), int(text[3:5], 16), int(text[5:7], 16))
+        except Exception:
+            pass
+    return fallback
+
+
+def _matrix_image(rows: Any, side: int) -> Any:
+    """Turn QR module rows (truthy = dark) into a one-pixel-per-module RGBA bitmap."""
+    data = b"".join(bytes(bool(v) for v in row) for row in rows)
+    img = Image.frombytes("P", (side, side), data)
+    img.putpalette(QR_BG_RGB + QR_MODULE_RGB)
+    return img.convert("RGBA")
+
+
+def qr_modules_image(qr_text: str, error: str = "h") -> Any:
+    """Encode QR text into an RGBA module bitmap with a 4-module quiet border.
+
+    Uses segno when installed (much faster encoder), the qrcode package otherwise.
+    Either way the bitmap is built straight from the module matrix; callers scale
+    it with a single NEAREST resize.
+    """
+    if _segno is not None:
+        try:
+            code = _segno.make_qr(qr_text, error=error, boost_error=False)
+            side = code.symbol_size(scale=1, border=4)[0]
+            return _matrix_image(code.matrix_iter(scale=1, border=4), side)
+        except Exception:
+            pass
+
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=_QR_ERROR_LEVELS.get(error, qrcode.constants.ERROR_CORRECT_H),
+        box_size=1,
+        border=4,
+    )
+    qr.add_data(qr_text)
+    qr.make(fit=True)
+    matrix = qr.get_matrix()
+    return _matrix_image(matrix, len(matrix))
+
+
+@functools.lru_cache(maxsize=4)
+def qr_chrome(size: int, accent_rgb: tuple[int, int, int], panel_rgb: tuple[int, int, int]) -> tuple[Any, Any, Any]:
+    """Build static QR frame, shadow and empty panel layers for one bitmap size.
+
+    Callers must copy the frame and panel before compositing onto them.
+    """
+    geom = _qr_geometry(size)
+    frame_base = Image.new("RGBA", (size, size), panel_rgb + (255,))
+    draw = ImageDraw.Draw(frame_base)
+    frame_pad = geom.frame_pad
+    draw.rounded_rectangle(
+        [frame_pad, frame_pad, size - frame_pad - 1, size - frame_pad - 1],
+        radius=geom.frame_radius,
+        fill=panel_rgb + (255,),
+        outline=accent_rgb + (105,),
+        width=geom.frame_width,
+    )
+
+    qr_side = geom.qr_side
+
+    shadow = Image.new("RGBA", (qr_side, qr_side), (0, 0, 0, 0))
+    shadow_draw = ImageDraw.Draw(shadow)
+    shadow_draw.rounded_rectangle(
+        [0, 0, qr_side - 1, qr_side - 1],
+        radius=geom.qr_radius,
+        fill=_SHADOW_RGBA,
+    )
+
+    panel = Image.new("RGBA", (qr_side, qr_side), (0, 0, 0, 0))
+    panel_draw = ImageDraw.Draw(panel)
+    panel_draw.rounded_rectangle(
+        [0, 0, qr_side - 1, qr_side - 1],
+        radius=geom.qr_radius,
+        fill=_QR_BG_RGBA,
+        outline=_PANEL_OUTLINE_RGBA,
+        width=1,
+    )
+    return frame_base, shadow, panel
+
+
+@functools.lru_cache(maxsize=4)
+def _logo_overlay(logo_bytes: bytes, logo_size: int) -> Any:
+    """Decode, crop and resize the logo once per process and target size."""
+    logo = Image.open(io.BytesIO(logo_bytes)).convert("RGBA")
+    bbox = logo.getbbox()
+    if bbox:
+        logo = logo.crop(bbox)
+    return logo.resize((logo_size, logo_size), Image.LANCZOS)
+
+
+@functools.lru_cache(maxsize=4)
+def _logo_quiet_zone(quiet_size: int, accent_rgb: tuple[int, int, int]) -> Any:
+    """Build the rounded light backdrop drawn under the centre logo."""
+    quiet = Image.new("RGBA", (quiet_size, quiet_size), _QR_BG_RGBA)
+    qmask = Image.new("L", (quiet_size, quiet_size), 0)
+    qdraw = ImageDraw.Draw(qmask)
+    qdraw.rounded_rectangle(
+        [0, 0, quiet_size - 1, quiet_size - 1],
+        radius=max(5, int(quiet_size * 0.16)),
+        fill=255,
+    )
+    quiet.putalpha(qmask)
+    qdraw = ImageDraw.Draw(quiet)
+    qdraw.rounded_rectangle(
+        [0, 0, quiet_size - 1, quiet_size - 1],
+        radius=max(5, int(quiet_size * 0.16)),
+        outline=accent_rgb + (150,),
+        width=1,
+    )
+    return quiet
+
+
+def render_qr(
+    qr_text: str,
+    size: int,
+    ecc: str,
+    logo_bytes: bytes,
+    palette: tuple[tuple[int, int, int], tuple[int, int, int]],
+) -> Image.Image:
+    """Render framed QR bitmap as an RGB image.
+
+    `palette` is `(accent_rgb, panel_rgb)`. The logo is only drawn on ECC H codes.
+    """
+    accent_rgb, panel_rgb = palette
+    qr_img = qr_modules_image(qr_text, error=ecc)
+
+    geom = _qr_geometry(size)
+    frame_base, shadow, panel_empty = qr_chrome(size, accent_rgb, panel_rgb)
+    out = frame_base.copy()
+    qr_pad = geom.qr_pad
+    out.alpha_composite(shadow, (qr_pad + geom.shadow_off, qr_pad + geom.shadow_off))
+
+    panel = panel_empty.copy()
+    qr_img = qr_img.resize((geom.qr_inner_side, geom.qr_inner_side), Image.NEAREST)
+    panel.alpha_composite(qr_img, (geom.qr_inner_pad, geom.qr_inner_pad))
+    out.alpha_composite(panel, (qr_pad, qr_pad))
+
+    try:
+        if logo_bytes and ecc == "h":
+            logo_size = geom.logo_size
+            logo = _logo_overlay(logo_bytes, logo_size)
+            quiet_size = geom.quiet_size
+            quiet_x = (size - quiet_size) // 2
+            quiet_y = (size - quiet_size) // 2
+            out.alpha_composite(_logo_quiet_zone(quiet_size, accent_rgb), (quiet_x, quiet_y))
+
+            logo_x = (size - logo_size) // 2
+            logo_y = (size - logo_size) // 2
+            out.alpha_composite(logo, (logo_x, logo_y))
+    except Exception:
+        pass
+
+    return out.convert("RGB")
@@ -6,17 +6,15 @@ import ctypes
 import subprocess
 import socket
 import shlex
-import pystray
 import time
 import json
-import webbrowser
 import uvicorn
 import queue
 import urllib.parse
 from typing import Any
 from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageTk
 from tkinter import filedialog, messagebox
-from collections import deque
+from collections import OrderedDict, deque
 import qrcode
 from cyberdeck import config as server_config
 from cyberdeck.platform.wayland_setup import (
@@ -59,6 +57,8 @@ def _tr_any(owner: Any, key: str, **kwargs: Any) -> str:
 
 SERVER_SCRIPT_NAME = "main.py"
 SYNC_INTERVAL_MS = 1000
+UI_QUEUE_POLL_MS = 50
+UI_QUEUE_DRAIN_MAX = 32
 
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("dark-blue")
@@ -81,6 +81,13 @@ FONT_SMALL = ("Consolas", 10)
 FONT_MONO = ("Consolas", 12)
 FONT_CODE = ("Consolas", 44, "bold")
 QR_IMAGE_SIZE = 240
+QR_RENDER_CACHE_SIZE = 4
+QR_REFRESH_BASE_S = 30.0
+QR_REFRESH_MAX_S = 300.0
+SEND_DEDUP_WINDOW_S = 3.0
+SEND_DEDUP_MAX = 16
+NOTIFIED_KEYS_MAX = 4096
+SERVER_STOP_WAIT_S = 1.0
 PORT_PICK_SPAN = 40
 
 DEFAULT_DEVICE_PRESETS = ["fast", "balanced", "safe", "ultra_safe"]
@@ -294,17 +301,26 @@ def load_json(path: str, default: dict[str, Any]) -> dict[str, Any]:
     return fallback
 
 
+# Last JSON text this process wrote per absolute path; lets autosave skip no-op rewrites.
+_saved_json_text: dict[str, str] = {}
+
+
 def save_json(path: str, data: dict[str, Any]) -> None:
-    """Persist dictionary to JSON file."""
+    """Persist dictionary to JSON file (skipped when content is unchanged since last save)."""
     # Write-path helpers should keep side effects minimal and well-scoped.
     try:
-        parent = os.path.dirname(os.path.abspath(path))
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+        abs_path = os.path.abspath(path)
+        if _saved_json_text.get(abs_path) == text and os.path.exists(abs_path):
+            return
+        parent = os.path.dirname(abs_path)
         if parent:
             os.makedirs(parent, exist_ok=True)
         tmp = f"{path}.tmp"
         with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write(text)
         os.replace(tmp, path)
+        _saved_json_text[abs_path] = text
     except Exception:
         pass
 
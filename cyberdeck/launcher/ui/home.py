@@ -158,7 +158,8 @@ def setup_home_ui(app, ui: dict):
     CyberBtn(
         info_card,
         text=app.tr("restart_server"),
-        command=app.restart_server,
+        # Let the click redraw before the restart's stop/start work runs on the Tk thread.
+        command=lambda: app.after_idle(app.restart_server),
         fg_color=COLOR_ACCENT,
         text_color="#04110A",
         hover_color=COLOR_ACCENT_HOVER,
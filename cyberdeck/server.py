@@ -1,8 +1,10 @@
 ﻿import asyncio
 import os
 import socket
+import threading
 import time
 from contextlib import asynccontextmanager
+from typing import Optional
 from urllib.parse import parse_qsl, urlencode, urlsplit
 
 import uvicorn
@@ -51,6 +53,7 @@ async def lifespan(app: FastAPI):
     import cyberdeck.context as ctx
 
     ctx.running_loop = asyncio.get_running_loop()
+    ctx.local_events.open_streams()
     yield
 
 
@@ -179,6 +182,84 @@ def _port_available(port: int) -> bool:
         return False
 
 
+async def _local_socket_app(scope, receive, send):
+    """ASGI shim for the Unix socket listener: its peers are local by construction."""
+    if scope.get("type") in ("http", "websocket") and str(scope.get("path") or "").startswith("/api/local/"):
+        # Owner-only socket permissions give the same guarantee as a loopback peer,
+        # but only the launcher's local API should see that trust.
+        scope = dict(scope, client=("127.0.0.1", 0))
+    await app(scope, receive, send)
+
+
+def _bind_local_socket(path: str) -> Optional[socket.socket]:
+    """Bind an owner-only Unix socket at `path`; None when unsupported or owned by a live server."""
+    if not path or not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        if os.path.exists(path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(path)
+                return None
+            except OSError:
+                os.unlink(path)
+            finally:
+                probe.close()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Create the socket file owner-only; a chmod after bind leaves a window for other users.
+        old_umask = os.umask(0o177)
+        try:
+            sock.bind(path)
+        finally:
+            os.umask(old_umask)
+        os.chmod(path, 0o600)
+        return sock
+    except Exception as e:
+        log.warning("Local socket listener disabled (%s): %s", path, e)
+        return None
+
+
+def serve_local_socket(
+    path: str, *, log_level: str = "critical"
+) -> Optional[tuple[uvicorn.Server, threading.Thread]]:
+    """Serve the app on a Unix socket in a daemon thread; return the server and thread to stop and join."""
+    sock = _bind_local_socket(path)
+    if sock is None:
+        return None
+    server = uvicorn.Server(
+        uvicorn.Config(
+            _local_socket_app,
+            lifespan="off",
+            proxy_headers=False,
+            log_level=log_level,
+            access_log=False,
+        )
+    )
+    thread = threading.Thread(
+        target=server.run,
+        kwargs={"sockets": [sock]},
+        name="cyberdeck-local-socket",
+        daemon=True,
+    )
+    thread.start()
+    return server, thread
+
+
+def _stop_local_socket(served: tuple[uvicorn.Server, threading.Thread], path: str, timeout_s: float = 2.0) -> None:
+    """Stop the Unix socket server, wait for its thread and remove the socket file."""
+    import cyberdeck.context as ctx
+
+    server, thread = served
+    server.should_exit = True
+    ctx.local_events.close_streams()
+    thread.join(timeout=timeout_s)
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
 def run() -> None:
     """Start FastAPI server with optional Wayland bootstrap, mdns, and TLS settings."""
     if is_linux_wayland_session():
@@ -230,6 +311,12 @@ def run() -> None:
     if getattr(config, "TLS_ENABLED", False):
         ssl_kwargs = {"ssl_certfile": config.TLS_CERT, "ssl_keyfile": config.TLS_KEY}
 
-    uvicorn.run(app, host=config.HOST, port=port, log_level=log_level, access_log=access_log, **ssl_kwargs)
+    socket_path = str(getattr(config, "LOCAL_SOCKET", "") or "")
+    served = serve_local_socket(socket_path, log_level=log_level)
+    try:
+        uvicorn.run(app, host=config.HOST, port=port, log_level=log_level, access_log=access_log, **ssl_kwargs)
+    finally:
+        if served is not None:
+            _stop_local_socket(served, socket_path)
 
 
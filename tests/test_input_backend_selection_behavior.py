@@ -1,7 +1,9 @@
-﻿import unittest
+﻿import os
+import unittest
 from unittest.mock import patch
 
 import cyberdeck.input.backend as input_backend
+from cyberdeck.input.backends.base import _session_kind
 
 
 class InputBackendSelectionBehaviorTests(unittest.TestCase):
@@ -154,6 +156,18 @@ class InputBackendSelectionBehaviorTests(unittest.TestCase):
         self.assertIsInstance(backend, FakeNullBackend)
         self.assertTrue(backend.configured)
 
+    def test_session_kind_is_cached_after_first_detection(self):
+        """Validate scenario: session detection should not re-read env vars once resolved."""
+        _session_kind.cache_clear()
+        self.addCleanup(_session_kind.cache_clear)
+        with (
+            patch.object(os, "name", "posix"),
+            patch.dict(os.environ, {"XDG_SESSION_TYPE": "wayland"}, clear=True),
+        ):
+            self.assertEqual(_session_kind(), "wayland")
+            os.environ["XDG_SESSION_TYPE"] = "x11"
+            self.assertEqual(_session_kind(), "wayland")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,15 @@
+import json
+import queue
+import socket
+import threading
 import unittest
+from concurrent.futures import Future
 from unittest.mock import patch
 
 import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
 
-from cyberdeck.launcher.api_client import LauncherApiClient
+from cyberdeck.launcher.api_client import LauncherApiClient, _ApiWorker
 
 
 class LauncherApiClientBehaviorTests(unittest.TestCase):
@@ -20,71 +26,313 @@ class LauncherApiClientBehaviorTests(unittest.TestCase):
         """Validate scenario: test get info calls requests get with expected args."""
         # Test body is intentionally explicit so regressions are easy to diagnose.
         c = LauncherApiClient("http://127.0.0.1:8080/api/local", verify=False)
-        with patch("cyberdeck.launcher.api_client.requests.get") as mget:
+        with patch.object(c._session, "get") as mget:
             c.get_info(timeout=1.25)
         mget.assert_called_once_with(
             "http://127.0.0.1:8080/api/local/info",
             timeout=1.25,
-            verify=False,
         )
+        self.assertFalse(c._session.verify)
 
     def test_device_settings_posts_payload(self):
         """Validate scenario: test device settings posts payload."""
         # Test body is intentionally explicit so regressions are easy to diagnose.
         c = LauncherApiClient("http://127.0.0.1:8080/api/local", verify=True)
         payload = {"token": "abc", "settings": {"perm_stream": True}}
-        with patch("cyberdeck.launcher.api_client.requests.post") as mpost:
+        with patch.object(c._session, "post") as mpost:
             c.device_settings(payload, timeout=2.5)
         mpost.assert_called_once_with(
             "http://127.0.0.1:8080/api/local/device_settings",
-            json=payload,
+            data=b'{"token":"abc","settings":{"perm_stream":true}}',
+            headers={"Content-Type": "application/json"},
             timeout=2.5,
-            verify=True,
         )
 
     def test_regenerate_code_posts_without_payload(self):
         """Validate scenario: test regenerate code posts without payload."""
         # Test body is intentionally explicit so regressions are easy to diagnose.
         c = LauncherApiClient("http://127.0.0.1:8080/api/local")
-        with patch("cyberdeck.launcher.api_client.requests.post") as mpost:
+        with patch.object(c._session, "post") as mpost:
             c.regenerate_code(timeout=3.0)
         mpost.assert_called_once_with(
             "http://127.0.0.1:8080/api/local/regenerate_code",
-            json=None,
             timeout=3.0,
-            verify=True,
         )
 
     def test_set_input_lock_posts_payload(self):
         """Validate scenario: input lock client call should post lock payload."""
         c = LauncherApiClient("http://127.0.0.1:8080/api/local")
-        with patch("cyberdeck.launcher.api_client.requests.post") as mpost:
+        with patch.object(c._session, "post") as mpost:
             c.set_input_lock(True, reason="test", actor="launcher", timeout=2.0)
         mpost.assert_called_once_with(
             "http://127.0.0.1:8080/api/local/input_lock",
-            json={"locked": True, "reason": "test", "actor": "launcher"},
+            data=b'{"locked":true,"reason":"test","actor":"launcher"}',
+            headers={"Content-Type": "application/json"},
             timeout=2.0,
-            verify=True,
         )
 
+    def test_repeated_input_lock_reuses_serialized_body(self):
+        """Validate scenario: identical lock toggles should resend the same pre-serialized bytes."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        with patch.object(c._session, "post") as mpost:
+            c.set_input_lock(False)
+            c.set_input_lock(False)
+        first, second = (call.kwargs["data"] for call in mpost.call_args_list)
+        self.assertIs(first, second)
+        self.assertEqual(json.loads(first), {"locked": False, "reason": "", "actor": "launcher"})
+
     def test_panic_mode_posts_payload(self):
         """Validate scenario: panic mode client call should post revoke/lock payload."""
         c = LauncherApiClient("http://127.0.0.1:8080/api/local")
-        with patch("cyberdeck.launcher.api_client.requests.post") as mpost:
+        with patch.object(c._session, "post") as mpost:
             c.panic_mode(keep_token="tok", lock_input=True, reason="panic", timeout=4.0)
         mpost.assert_called_once_with(
             "http://127.0.0.1:8080/api/local/panic_mode",
-            json={"keep_token": "tok", "lock_input": True, "reason": "panic"},
+            data=b'{"keep_token":"tok","lock_input":true,"reason":"panic"}',
+            headers={"Content-Type": "application/json"},
             timeout=4.0,
-            verify=True,
         )
 
+    def test_endpoint_table_supplies_default_timeouts(self):
+        """Validate scenario: helpers called without timeout should use the endpoint table defaults."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        with patch.object(c._session, "post") as mpost, patch.object(c._session, "get") as mget:
+            c.device_delete("tok")
+            c.get_updates(force_refresh=True)
+        mpost.assert_called_once_with(
+            "http://127.0.0.1:8080/api/local/device_delete",
+            data=b'{"token":"tok"}',
+            headers={"Content-Type": "application/json"},
+            timeout=3.0,
+        )
+        mget.assert_called_once_with("http://127.0.0.1:8080/api/local/updates?force_refresh=1", timeout=2.5)
+
+    def test_configure_updates_shared_session_verify(self):
+        """Validate scenario: reconfiguring TLS mode should reuse the pooled session."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        session = c._session
+        c.configure("https://127.0.0.1:8443/api/local", verify="/tmp/ca.pem")
+        self.assertIs(c._session, session)
+        self.assertEqual(session.verify, "/tmp/ca.pem")
+
+    def test_session_mounts_pooled_adapter_without_retries(self):
+        """Validate scenario: client session should pool connections and never retry local calls."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        adapter = c._session.get_adapter("http://127.0.0.1:8080/api/local/info")
+        self.assertEqual(adapter._pool_maxsize, 16)
+        self.assertEqual(adapter.max_retries.total, 0)
+        self.assertFalse(adapter.max_retries.status_forcelist)
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        """Validate scenario: duplicate in-flight GETs should wait for the leader instead of re-sending."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_get(url, timeout):
+            calls.append(url)
+            started.set()
+            release.wait(2.0)
+            return "shared"
+
+        results = []
+        with patch.object(c._session, "get", side_effect=slow_get):
+            leader = threading.Thread(target=lambda: results.append(c.get_pending_devices()))
+            leader.start()
+            self.assertTrue(started.wait(2.0))
+            follower = threading.Thread(target=lambda: results.append(c.get_pending_devices()))
+            follower.start()
+            while "pending_devices" in c._inflight and not c._inflight["pending_devices"]._condition._waiters:
+                threading.Event().wait(0.005)
+            release.set()
+            leader.join(2.0)
+            follower.join(2.0)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["shared", "shared"])
+
+    def test_in_flight_follower_timeout_raises_requests_timeout(self):
+        """Validate scenario: a follower giving up on the leader should see a requests Timeout."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        c._inflight["pending_devices"] = Future()
+
+        with patch.object(c._session, "get") as mget:
+            with self.assertRaises(requests.exceptions.Timeout):
+                c.get_pending_devices(timeout=0.01)
+        mget.assert_not_called()
+
+    def test_get_many_fans_out_and_captures_errors(self):
+        """Validate scenario: concurrent GETs should map each path to its response or raised error."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        self.addCleanup(c.close)
+
+        def fake_get(url, timeout):
+            if url.endswith("/updates"):
+                raise requests.Timeout()
+            return url
+
+        with patch.object(c._session, "get", side_effect=fake_get):
+            out = c.get_many(["info", "updates", c.events_path(5, 10)], timeout=2.0)
+
+        self.assertEqual(out["info"], "http://127.0.0.1:8080/api/local/info")
+        self.assertIsInstance(out["updates"], requests.Timeout)
+        self.assertEqual(out["events?since_id=5&limit=10"], "http://127.0.0.1:8080/api/local/events?since_id=5&limit=10")
+
+    def test_stream_events_parses_sse_frames_and_stops(self):
+        """Validate scenario: SSE data frames should be decoded and delivered in order."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        stop = threading.Event()
+        seen = []
+
+        class _Resp:
+            status_code = 200
+
+            def iter_lines(self, decode_unicode=False):
+                yield ": connected"
+                yield ""
+                yield "id: 7"
+                yield 'data: {"id": 7, "type": "device_connected"}'
+                yield ""
+                yield "id: 8"
+                yield 'data: {"id": 8, "type": "file_received"}'
+                yield ""
+
+            def close(self):
+                pass
+
+        def _on_event(evt):
+            seen.append(evt["type"])
+            if len(seen) == 2:
+                stop.set()
+
+        with patch.object(c._session, "get", return_value=_Resp()) as mget:
+            self.assertTrue(c.stream_events(_on_event, since_id=5, stop=stop))
+
+        self.assertEqual(seen, ["device_connected", "file_received"])
+        mget.assert_called_once_with(
+            "http://127.0.0.1:8080/api/local/events/stream?since_id=5",
+            stream=True,
+            timeout=(5.0, 30.0),
+        )
+        self.assertFalse(c.stream_connected)
+
+    def test_close_event_stream_shuts_down_live_response_socket(self):
+        """Validate scenario: closing the stream should wake the reader through its socket."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        c.close_event_stream()
+        calls = []
+        sock = type("_Sock", (), {"shutdown": lambda self, how: calls.append(("shutdown", how))})()
+        raw = type("_Raw", (), {"connection": type("_Conn", (), {"sock": sock})()})()
+        c._stream_resp = type("_Resp", (), {"raw": raw, "close": lambda self: calls.append("close")})()
+
+        c.close_event_stream()
+
+        self.assertEqual(calls, [("shutdown", socket.SHUT_RDWR)])
+
+    def test_stream_events_reports_missing_endpoint(self):
+        """Validate scenario: 404 from the stream endpoint should tell callers to keep polling."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        resp = type("_Resp", (), {"status_code": 404, "close": lambda self: None})()
+        with patch.object(c._session, "get", return_value=resp):
+            self.assertFalse(c.stream_events(lambda evt: None))
+
+    def test_unreachable_socket_falls_back_to_tcp(self):
+        """Validate scenario: requests should retry over TCP when the Unix socket cannot be dialed."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local", socket_path="/nonexistent/api.sock")
+        ok = type("R", (), {"status_code": 200})()
+        refused = requests.exceptions.ConnectionError(
+            MaxRetryError(None, "/api/local/pending_devices", reason=NewConnectionError(None, "refused"))
+        )
+        with patch.object(c._session, "get", side_effect=[refused, ok]) as mget:
+            self.assertIs(c.get_pending_devices(), ok)
+        urls = [call.args[0] for call in mget.call_args_list]
+        self.assertEqual(
+            urls,
+            [
+                "http://cyberdeck-local-socket/api/local/pending_devices",
+                "http://127.0.0.1:8080/api/local/pending_devices",
+            ],
+        )
+        with patch.object(c._session, "get", return_value=ok) as mget:
+            c.get_pending_devices()
+        mget.assert_called_once_with("http://127.0.0.1:8080/api/local/pending_devices", timeout=1.5)
+
+    def test_socket_drop_after_send_is_not_replayed_over_tcp(self):
+        """Validate scenario: a post-send failure on the socket should surface instead of repeating the action."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local", socket_path="/nonexistent/api.sock")
+        dropped = requests.exceptions.ConnectionError(
+            ProtocolError("Connection aborted.", ConnectionResetError("Remote end closed connection"))
+        )
+        with patch.object(c._session, "post", side_effect=dropped) as mpost:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                c.panic_mode()
+        mpost.assert_called_once()
+        self.assertEqual(mpost.call_args.args[0], "http://cyberdeck-local-socket/api/local/panic_mode")
+
+    def test_worker_runs_queued_jobs_most_urgent_first(self):
+        """Validate scenario: jobs queued on one worker lane should run most urgent first."""
+        worker = _ApiWorker()
+        gate = threading.Event()
+        order = []
+        blocker = worker.submit(LauncherApiClient.PRIORITY_NORMAL, gate.wait, (5.0,), {})
+        jobs = [
+            worker.submit(LauncherApiClient.PRIORITY_BACKGROUND, order.append, ("qr",), {}),
+            worker.submit(LauncherApiClient.PRIORITY_NORMAL, order.append, ("delete",), {}),
+            worker.submit(LauncherApiClient.PRIORITY_URGENT, order.append, ("panic",), {}),
+        ]
+        worker.start()
+        self.addCleanup(worker.stop)
+        gate.set()
+        self.assertTrue(blocker.result(timeout=5.0))
+        for job in jobs:
+            job.result(timeout=5.0)
+        self.assertEqual(order, ["panic", "delete", "qr"])
+
+    def test_urgent_jobs_do_not_wait_behind_running_background_or_normal_jobs(self):
+        """Validate scenario: a panic job should run while a QR render and a file trigger are still busy."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        self.addCleanup(c.close)
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        qr = c.submit(gate.wait, 5.0, priority=c.PRIORITY_BACKGROUND)
+        trigger = c.submit(gate.wait, 5.0)
+
+        panic = c.submit(lambda: "panic", priority=c.PRIORITY_URGENT)
+
+        self.assertEqual(panic.result(timeout=2.0), "panic")
+        self.assertFalse(qr.done())
+        self.assertFalse(trigger.done())
+
+    def test_full_worker_queue_evicts_oldest_background_job(self):
+        """Validate scenario: overflow should cancel the oldest background job, never user actions."""
+        worker = _ApiWorker(maxsize=2, evict_at=LauncherApiClient.PRIORITY_BACKGROUND)
+        old_bg = worker.submit(LauncherApiClient.PRIORITY_BACKGROUND, print, (), {})
+        action = worker.submit(LauncherApiClient.PRIORITY_NORMAL, print, (), {})
+        urgent = worker.submit(LauncherApiClient.PRIORITY_URGENT, print, (), {})
+        rejected = worker.submit(LauncherApiClient.PRIORITY_URGENT, print, (), {})
+
+        self.assertTrue(old_bg.cancelled())
+        self.assertFalse(action.done())
+        self.assertFalse(urgent.done())
+        self.assertIsInstance(rejected.exception(timeout=0), queue.Full)
+
     def test_json_dict_returns_fallback_for_invalid_payload(self):
         """Validate scenario: json dict helper should return fallback on invalid payload."""
         c = LauncherApiClient("http://127.0.0.1:8080/api/local")
         resp = type("R", (), {"json": lambda self: ["not", "a", "dict"]})()
         self.assertEqual(c.json_dict(resp, default={"x": 1}), {"x": 1})
 
+    def test_json_dict_decodes_raw_body_with_fast_parser(self):
+        """Validate scenario: json dict helper should parse response bytes via the module decoder."""
+        c = LauncherApiClient("http://127.0.0.1:8080/api/local")
+        resp = type("R", (), {"content": b'{"events": [], "latest_id": 4}', "json": lambda self: {}})()
+        fake_orjson = type("FakeOrjson", (), {"loads": staticmethod(json.loads)})
+        with patch("cyberdeck.launcher.api_client._orjson", fake_orjson):
+            self.assertEqual(c.json_dict(resp), {"events": [], "latest_id": 4})
+        with patch("cyberdeck.launcher.api_client._orjson", None):
+            self.assertEqual(c.json_dict(resp), {"events": [], "latest_id": 4})
+
     def test_describe_api_error_prefers_structured_error_fields(self):
         """Validate scenario: structured API payload should produce readable error string."""
         c = LauncherApiClient("http://127.0.0.1:8080/api/local")
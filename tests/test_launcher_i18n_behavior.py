@@ -18,6 +18,20 @@ class LauncherI18nBehaviorTests(unittest.TestCase):
         """Validate scenario: language label should be a readable Russian word."""
         self.assertEqual(i18n.language_label("ru"), "Русский")
 
+    def test_static_lookups_are_cached_per_language(self):
+        """Validate scenario: parameterless keys should resolve once per language and still follow the active language."""
+        i18n._tr_static.cache_clear()
+        en = i18n.tr("en", "api_error")
+        self.assertEqual(i18n.tr("EN", "api_error"), en)
+        self.assertEqual(i18n._tr_static.cache_info().hits, 1)
+        self.assertNotEqual(i18n.tr("ru", "api_error"), en)
+        self.assertEqual(i18n.tr("en", "missing_key_xyz"), "missing_key_xyz")
+
+    def test_parameterized_lookups_still_format_each_call(self):
+        """Validate scenario: keys with arguments should be formatted with the given values."""
+        self.assertIn("boom", i18n.tr("en", "error_prefix", msg="boom"))
+        self.assertIn("oops", i18n.tr("en", "error_prefix", msg="oops"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,85 @@
+import types
+import unittest
+from unittest.mock import patch
+
+import qrcode
+from PIL import Image
+
+from cyberdeck.launcher import qr_render
+
+_DARK = (8, 26, 18, 255)
+_LIGHT = (246, 255, 250, 255)
+_PALETTE = ((60, 255, 145), (10, 18, 13))
+
+
+class LauncherQrRenderBehaviorTests(unittest.TestCase):
+    def test_qr_chrome_layers_are_built_once_per_size(self):
+        """Validate scenario: static QR frame layers should be shared across renders of the same size."""
+        qr_render.qr_chrome.cache_clear()
+        qr_render.render_qr("chrome-a", 200, "l", b"", _PALETTE)
+        qr_render.render_qr("chrome-b", 200, "l", b"", _PALETTE)
+        frame, _shadow, panel = qr_render.qr_chrome(200, *_PALETTE)
+
+        info = qr_render.qr_chrome.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+        self.assertEqual(frame.size, (200, 200))
+        self.assertEqual(panel.getpixel((panel.width // 2, panel.height // 2)), _LIGHT)
+
+    def test_render_qr_returns_rgb_image_of_requested_size(self):
+        """Validate scenario: inline render should hand back a ready RGB image for the PhotoImage step."""
+        img = qr_render.render_qr("http://10.0.0.2:8080/?code=1", 160, "m", b"", _PALETTE)
+
+        self.assertIsInstance(img, Image.Image)
+        self.assertEqual((img.mode, img.size), ("RGB", (160, 160)))
+
+    def test_qr_geometry_is_computed_once_per_size(self):
+        """Validate scenario: QR layout for a size should be cached and match the frame/logo proportions."""
+        qr_render._qr_geometry.cache_clear()
+
+        geom = qr_render._qr_geometry(240)
+        self.assertIs(qr_render._qr_geometry(240), geom)
+        self.assertEqual((geom.qr_pad, geom.qr_side, geom.qr_inner_pad, geom.qr_inner_side), (8, 224, 4, 216))
+        self.assertEqual((geom.logo_size, geom.quiet_size), (43, 57))
+        self.assertEqual(qr_render._qr_geometry.cache_info().misses, 1)
+
+    def test_qr_modules_image_uses_segno_matrix_when_available(self):
+        """Validate scenario: segno encoder should produce one RGBA pixel per module with launcher colors."""
+        calls = []
+
+        class _FakeCode:
+            def symbol_size(self, scale=1, border=4):
+                return (3, 3)
+
+            def matrix_iter(self, scale=1, border=4):
+                return iter([(True, False, True), (False, True, False), (True, False, True)])
+
+        def _make_qr(text, **kwargs):
+            calls.append((text, kwargs))
+            return _FakeCode()
+
+        with patch.object(qr_render, "_segno", types.SimpleNamespace(make_qr=_make_qr)):
+            img = qr_render.qr_modules_image("payload")
+
+        self.assertEqual(calls, [("payload", {"error": "h", "boost_error": False})])
+        self.assertEqual(img.mode, "RGBA")
+        self.assertEqual(img.size, (3, 3))
+        self.assertEqual(img.getpixel((0, 0)), _DARK)
+        self.assertEqual(img.getpixel((1, 0)), _LIGHT)
+
+    def test_qr_modules_image_fallback_maps_qrcode_matrix_one_pixel_per_module(self):
+        """Validate scenario: qrcode fallback should build the bitmap from the matrix without scaled rendering."""
+        with patch.object(qr_render, "_segno", None):
+            img = qr_render.qr_modules_image("cyberdeck://pair?code=1", error="m")
+
+        qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M, box_size=1, border=4)
+        qr.add_data("cyberdeck://pair?code=1")
+        qr.make(fit=True)
+        matrix = qr.get_matrix()
+        self.assertEqual(img.size, (len(matrix), len(matrix)))
+        for y in (0, 4, 5, len(matrix) // 2):
+            for x in range(len(matrix)):
+                self.assertEqual(img.getpixel((x, y)), _DARK if matrix[y][x] else _LIGHT)
+
+
+if __name__ == "__main__":
+    unittest.main()
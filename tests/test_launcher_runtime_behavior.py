@@ -1,7 +1,9 @@
 ﻿import os
+import queue
 import sys
 import types
 import unittest
+from collections import OrderedDict
 from unittest.mock import patch
 
 if "pystray" not in sys.modules:
@@ -171,6 +173,171 @@ class LauncherRuntimeBehaviorTests(unittest.TestCase):
         self.assertIsNone(kwargs["ssl_certfile"])
         self.assertIsNone(kwargs["ssl_keyfile"])
 
+    def test_sync_loop_reuses_single_sync_worker(self):
+        """Validate scenario: periodic sync passes should be submitted to one reusable worker instead of new threads."""
+        dummy = _DummyRuntime()
+        dummy._sync_inflight = False
+        submitted = []
+        dummy._sync_pool = types.SimpleNamespace(submit=submitted.append)
+
+        with patch("cyberdeck.launcher.app_runtime.threading.Thread", side_effect=AssertionError("no raw threads")):
+            dummy.sync_loop()
+            dummy._sync_inflight = False
+            dummy.sync_loop()
+
+        self.assertEqual(len(submitted), 2)
+        self.assertTrue(all(callable(fn) for fn in submitted))
+
+        fresh = _DummyRuntime()
+        pool = fresh._sync_executor()
+        self.addCleanup(pool.shutdown, wait=False)
+        self.assertIs(fresh._sync_executor(), pool)
+        self.assertEqual(pool._max_workers, 1)
+
+    def test_request_sync_bursts_keep_the_earliest_pending_pass(self):
+        """Validate scenario: repeated sync requests should reuse the pending job unless they need an earlier one."""
+        dummy = _DummyRuntime()
+        dummy._sync_job = None
+        jobs, cancelled = [], []
+        dummy.winfo_exists = lambda: True
+        dummy.after = lambda delay, cb: jobs.append((delay, cb)) or f"job-{len(jobs)}"
+        dummy.after_cancel = cancelled.append
+
+        dummy.request_sync(150)
+        dummy.request_sync(150)
+        dummy.request_sync(150)
+
+        self.assertEqual(cancelled, [])
+        self.assertEqual(jobs, [(150, dummy.sync_loop)])
+        self.assertEqual(dummy._sync_job, "job-1")
+
+        dummy.request_sync(0)
+        self.assertEqual(cancelled, ["job-1"])
+        self.assertEqual(dummy._sync_job, "job-2")
+        self.assertEqual(jobs[-1], (0, dummy.sync_loop))
+
+    def test_ui_batch_queues_one_item_and_runs_every_callback(self):
+        """Validate scenario: batched UI callbacks should share one queue item and survive a failing member."""
+        dummy = _DummyRuntime()
+        dummy._ui_queue = queue.SimpleQueue()
+        ran = []
+
+        def _boom():
+            raise RuntimeError("boom")
+
+        dummy.ui_batch(lambda: ran.append("status"), _boom, lambda: ran.append("toast"))
+
+        self.assertEqual(dummy._ui_queue.qsize(), 1)
+        dummy._ui_queue.get_nowait()()
+        self.assertEqual(ran, ["status", "toast"])
+        self.assertTrue(any("boom" in line for line in dummy.logs))
+
+    def test_local_events_route_through_handler_table(self):
+        """Validate scenario: local events should reach their handler once and unknown types should be ignored."""
+        dummy = _DummyRuntime()
+        dummy._notified_device_tokens = OrderedDict()
+        dummy._notified_upload_events = OrderedDict()
+        toasts, notes = [], []
+        dummy.tr = lambda key, **kw: f"{key}:{kw.get('name') or kw.get('filename') or ''}"
+        dummy.show_toast = lambda text, level="info": toasts.append((text, level))
+        dummy._notify_system = lambda title, text: notes.append(text)
+
+        event = {"id": 3, "type": " Device_Connected ", "payload": {"token": "t1", "name": "Phone"}}
+        dummy._handle_local_event(event)
+        dummy._handle_local_event(event)
+        dummy._handle_local_event({"id": 4, "type": "file_received", "payload": {"filename": "a.txt"}})
+        dummy._handle_local_event({"id": 5, "type": "mystery", "payload": {}})
+        dummy._handle_local_event({"id": 6, "type": "input_lock_changed", "payload": {"security": {"locked": True}}})
+
+        self.assertEqual(
+            toasts,
+            [
+                ("notify_device_connected:Phone", "success"),
+                ("notify_file_received:a.txt", "info"),
+                ("notify_input_lock_changed:", "info"),
+            ],
+        )
+        self.assertEqual(notes, ["notify_device_connected:Phone", "notify_file_received:a.txt"])
+        self.assertTrue(dummy.security_state["locked"])
+
+    def test_notified_keys_are_bounded_lru(self):
+        """Validate scenario: notification dedup sets should stay capped and evict the oldest key first."""
+        from cyberdeck.launcher.app_runtime import _remember
+        from cyberdeck.launcher.shared import NOTIFIED_KEYS_MAX
+
+        seen = OrderedDict()
+        self.assertTrue(_remember(seen, "first"))
+        self.assertFalse(_remember(seen, "first"))
+        for i in range(NOTIFIED_KEYS_MAX):
+            _remember(seen, i)
+
+        self.assertEqual(len(seen), NOTIFIED_KEYS_MAX)
+        self.assertNotIn("first", seen)
+        self.assertTrue(_remember(seen, "first"))
+
+    def test_restart_server_waits_for_old_server_off_the_ui_thread(self):
+        """Validate scenario: restart should start the new server only after the old thread exits, via the UI queue."""
+        import threading
+
+        dummy = _DummyRuntime()
+        dummy._ui_queue = queue.SimpleQueue()
+        release = threading.Event()
+        old = threading.Thread(target=release.wait, daemon=True)
+        old.start()
+        dummy.server_process = None
+        dummy.server_thread = old
+        dummy._uvicorn_socket_server = None
+        started = []
+        dummy.start_server_process = lambda: started.append(True)
+
+        dummy.restart_server()
+        dummy.restart_server()
+        self.assertTrue(dummy._restart_pending)
+        self.assertTrue(dummy._ui_queue.empty())
+
+        release.set()
+        start_cb = dummy._ui_queue.get(timeout=2.0)
+        start_cb()
+
+        self.assertEqual(started, [True])
+        self.assertFalse(dummy._restart_pending)
+        self.assertEqual(sum("restarting server" in line for line in dummy.logs), 1)
+
+    def test_process_ui_queue_drains_and_reschedules(self):
+        """Validate scenario: the UI tick should run every queued callback, then poll again."""
+        dummy = _DummyRuntime()
+        dummy._ui_queue = queue.SimpleQueue()
+        jobs, ran = [], []
+        dummy.after = lambda delay, cb: jobs.append((delay, cb))
+        dummy.ui_call(lambda: ran.append(1))
+        dummy.ui_call(lambda: ran.append(2))
+
+        dummy._process_ui_queue()
+        dummy._process_ui_queue()
+
+        self.assertEqual(ran, [1, 2])
+        self.assertTrue(dummy._ui_queue.empty())
+        self.assertEqual([delay for delay, _cb in jobs], [50, 50])
+
+    def test_process_ui_queue_yields_after_drain_budget(self):
+        """Validate scenario: a callback burst should be split across ticks so input and redraws interleave."""
+        from cyberdeck.launcher.shared import UI_QUEUE_DRAIN_MAX
+
+        dummy = _DummyRuntime()
+        dummy._ui_queue = queue.SimpleQueue()
+        jobs, ran = [], []
+        dummy.after = lambda delay, cb: jobs.append(delay)
+        for i in range(UI_QUEUE_DRAIN_MAX + 3):
+            dummy.ui_call(lambda i=i: ran.append(i))
+
+        dummy._process_ui_queue()
+        self.assertEqual(len(ran), UI_QUEUE_DRAIN_MAX)
+        self.assertEqual(jobs, [1])
+
+        dummy._process_ui_queue()
+        self.assertEqual(ran, list(range(UI_QUEUE_DRAIN_MAX + 3)))
+        self.assertEqual(jobs, [1, 50])
+
 
 if __name__ == "__main__":
     unittest.main()
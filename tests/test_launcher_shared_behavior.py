@@ -82,6 +82,23 @@ class LauncherSharedBehaviorTests(unittest.TestCase):
                 data = json.load(f)
             self.assertEqual(data, {"x": 1})
 
+    def test_save_json_skips_rewrite_when_content_unchanged(self):
+        """Validate scenario: repeated autosaves with identical data should not touch the disk again."""
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "out.json")
+            ls.save_json(path, {"x": 1})
+            with patch("cyberdeck.launcher.shared.os.replace") as mreplace:
+                ls.save_json(path, {"x": 1})
+            mreplace.assert_not_called()
+
+            ls.save_json(path, {"x": 2})
+            with open(path, "r", encoding="utf-8") as f:
+                self.assertEqual(json.load(f), {"x": 2})
+
+            os.remove(path)
+            ls.save_json(path, {"x": 2})
+            self.assertTrue(os.path.exists(path))
+
     def test_set_autostart_linux_creates_and_removes_desktop_file(self):
         """Validate scenario: test set autostart linux creates and removes desktop file."""
         # Test body is intentionally explicit so regressions are easy to diagnose.
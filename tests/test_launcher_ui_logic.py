@@ -1,7 +1,11 @@
+import functools
+import os
 import sys
+import tempfile
 import types
 import unittest
 import urllib.parse
+from unittest.mock import patch
 
 
 if "pystray" not in sys.modules:
@@ -88,6 +92,111 @@ class _SplitWidget:
         self.columns[idx] = kwargs
 
 
+def _run_future(fn):
+    """Run a submitted job inline and return its completed Future."""
+    from concurrent.futures import Future
+
+    fut = Future()
+    fut.set_result(fn())
+    return fut
+
+
+def _make_qr_owner(data, rendered):
+    """Build a minimal launcher stand-in whose API client answers the QR payload inline."""
+    from concurrent.futures import Future
+
+    class _Resp:
+        status_code = 200
+
+    class _Client:
+        PRIORITY_BACKGROUND = 20
+
+        def get_qr_payload(self, timeout=None):
+            return _Resp()
+
+        def json_dict(self, _resp):
+            return data
+
+        def submit(self, fn, priority=None):
+            fut = Future()
+            fut.set_result(fn())
+            return fut
+
+    owner = types.SimpleNamespace(
+        lbl_qr=_CfgWidget(),
+        server_online=True,
+        settings={"qr_mode": "app"},
+        api_client=_Client(),
+        icon_path_qr_png="",
+        icon_path_png="",
+        _build_app_fallback_url=launcher.App._build_app_fallback_url,
+        _build_app_qr_deep_link=launcher.App._build_app_qr_deep_link,
+        _append_open_mode_app=launcher.App._append_open_mode_app,
+        _qr_error_level_for_payload=launcher.App._qr_error_level_for_payload,
+        _build_qr_image=lambda text, **kwargs: rendered.append(text),
+        ui_call=lambda fn: None,
+        append_log=lambda _msg: None,
+    )
+    owner._qr_schedule_next_fetch = lambda: launcher.App._qr_schedule_next_fetch(owner)
+    return owner
+
+
+def _make_settings_owner(calls):
+    """Build a launcher stand-in with every Settings widget `save_settings_action` reads."""
+
+    def value(v):
+        return types.SimpleNamespace(get=lambda: v)
+
+    class _Client:
+        base_url = "http://127.0.0.1:8080/api/local"
+        verify = True
+
+        def configure(self, base_url, verify):
+            calls.append(("configure", base_url, verify))
+            self.base_url = base_url
+            self.verify = verify
+
+    owner = types.SimpleNamespace(
+        settings={"language": "en", "qr_mode": "site", "preferred_port": 8080, "debug": False},
+        app_config={},
+        port=8080,
+        tls_enabled=False,
+        api_client=_Client(),
+        lbl_settings_status=_CfgWidget(),
+        _present_settings_widgets=frozenset(),
+        sw_start_in_tray=value(0),
+        sw_show_on_start=value(1),
+        sw_close_to_tray=value(0),
+        sw_topmost=value(0),
+        sw_autostart=value(0),
+        sw_hotkey=value(0),
+        sw_debug=value(0),
+        sw_tls=value(0),
+        ent_preferred_port=value("8080"),
+        ent_pairing_ttl=value("0"),
+        ent_session_ttl_days=value("0"),
+        ent_session_idle_min=value("0"),
+        ent_max_sessions=value("0"),
+        ent_pin_window_s=value("60"),
+        ent_pin_max_fails=value("8"),
+        ent_pin_block_s=value("300"),
+        ent_tls_cert=value(""),
+        ent_tls_key=value(""),
+        ent_tls_ca=value(""),
+        qr_mode_var=value("site"),
+        _normalize_app_config=lambda: None,
+        apply_settings=lambda: calls.append("apply_settings"),
+        append_log=lambda _msg: None,
+        tr=lambda key, **_kw: key,
+        queue_server_restart=lambda delay_ms=0: calls.append("restart"),
+        refresh_qr_code=lambda force=False: calls.append("qr"),
+    )
+    owner._settings_widgets_present = lambda: launcher.App._settings_widgets_present(owner)
+    owner._refresh_api_transport = lambda: launcher.App._refresh_api_transport(owner)
+    owner._inline_text = lambda ru, en: en
+    return owner
+
+
 class LauncherUiLogicTests(unittest.TestCase):
     def test_build_app_qr_deep_link_prefers_custom_scheme(self):
         """Validate scenario: app-mode QR payload should use cyberdeck:// deep link."""
@@ -136,6 +245,17 @@ class LauncherUiLogicTests(unittest.TestCase):
         self.assertEqual(parsed.netloc, "10.0.0.2:8080")
         self.assertEqual(query.get("open", [""])[0], "app")
 
+    def test_build_android_intent_qr_link_parses_deep_link_parts(self):
+        """Validate scenario: intent builder should keep authority/path/query and pass through foreign schemes."""
+        build = launcher.App._build_android_intent_qr_link
+        tail = "#Intent;scheme=cyberdeck;action=android.intent.action.VIEW;end"
+
+        self.assertEqual(build("CyberDeck://pair?ip=1&code=2"), "intent://pair?ip=1&code=2" + tail)
+        self.assertEqual(build("cyberdeck:///open/x?q=1#frag"), "intent://pair/open/x?q=1" + tail)
+        self.assertEqual(build("cyberdeck://pair"), "intent://pair" + tail)
+        self.assertEqual(build("https://example.com/?a=1"), "https://example.com/?a=1")
+        self.assertEqual(build("  "), "")
+
     def test_build_app_fallback_url_is_compact_and_contains_required_fields(self):
         """Validate scenario: fallback URL should remain compact and preserve pairing essentials."""
         payload = {
@@ -160,12 +280,395 @@ class LauncherUiLogicTests(unittest.TestCase):
         self.assertEqual(query.get("open", [""])[0], "app")
         self.assertEqual(query.get("exp", [""])[0], "1772135660")
 
+    def test_qr_links_drop_empty_params_and_keep_order(self):
+        """Validate scenario: QR link builders should skip blank values and keep a stable parameter order."""
+        payload = {"ip": "1.2.3.4", "port": 8080, "pairing_code": "12", "scheme": " ", "qr_token": "t", "pairing_expires_at": 5.5}
+
+        deep = launcher.App._build_app_qr_deep_link(payload)
+        fallback = launcher.App._build_app_fallback_url(payload)
+
+        self.assertEqual(deep, "cyberdeck://pair?type=cyberdeck_qr_v1&ip=1.2.3.4&port=8080&code=12&qr_token=t&exp=5")
+        self.assertEqual(
+            fallback,
+            "http://1.2.3.4:8080/?type=cyberdeck_qr_v1&ip=1.2.3.4&port=8080&code=12&scheme=http&qr_token=t&open=app&exp=5",
+        )
+
+    def test_append_open_mode_app_replaces_existing_open_and_reuses_result(self):
+        """Validate scenario: open=app rewrite should normalize the query once per distinct URL."""
+        from cyberdeck.launcher import app_devices
+
+        app_devices._append_open_mode_app_cached.cache_clear()
+        url = "http://10.0.0.2:8080/?code=1&open=web&open=site#top"
+
+        first = launcher.App._append_open_mode_app(f"  {url} ")
+        second = launcher.App._append_open_mode_app(url)
+
+        self.assertEqual(first, "http://10.0.0.2:8080/?code=1&open=app&open=app#top")
+        self.assertEqual(second, first)
+        self.assertEqual(launcher.App._append_open_mode_app("http://h/?a=1"), "http://h/?a=1&open=app")
+        self.assertEqual(launcher.App._append_open_mode_app("  "), "")
+        info = app_devices._append_open_mode_app_cached.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
     def test_qr_render_size_scales_for_long_payloads(self):
         """Validate scenario: larger payloads should request larger QR bitmap size."""
         self.assertEqual(launcher.App._qr_render_size_for_payload("x" * 120), 240)
         self.assertEqual(launcher.App._qr_render_size_for_payload("x" * 200), 280)
         self.assertEqual(launcher.App._qr_render_size_for_payload("x" * 300), 320)
         self.assertEqual(launcher.App._qr_render_size_for_payload("x" * 420), 360)
+        self.assertEqual(launcher.App._qr_render_size_for_payload("x" * 179), 240)
+        self.assertEqual(launcher.App._qr_render_size_for_payload("x" * 180), 280)
+        self.assertEqual(launcher.App._qr_render_size_for_payload("x" * 380), 360)
+        self.assertEqual(launcher.App._qr_render_size_for_payload(None), 240)
+
+    def test_build_qr_image_reuses_render_for_same_payload(self):
+        """Validate scenario: repeated QR payloads should return the cached render and evict oldest entries."""
+        owner = types.SimpleNamespace(icon_path_qr_png="")
+
+        first = launcher.App._build_qr_image(owner, "http://10.0.0.2:8080/?code=1", size=120)
+        second = launcher.App._build_qr_image(owner, "http://10.0.0.2:8080/?code=1", size=120)
+        self.assertIs(first, second)
+        self.assertIsNot(first, launcher.App._build_qr_image(owner, "http://10.0.0.2:8080/?code=1", size=160))
+
+        for idx in range(4):
+            launcher.App._build_qr_image(owner, f"payload-{idx}", size=120)
+        self.assertEqual(len(owner._qr_render_cache), 4)
+        self.assertNotIn(("http://10.0.0.2:8080/?code=1", 120, "m"), owner._qr_render_cache)
+        self.assertIn(("payload-3", 120, "l"), owner._qr_render_cache)
+
+    def test_build_qr_image_prepares_logo_once_per_size(self):
+        """Validate scenario: logo file should be read once and the overlay resized once across QR renders."""
+        from PIL import Image
+
+        from cyberdeck.launcher import qr_render
+
+        qr_render._logo_overlay.cache_clear()
+        with tempfile.TemporaryDirectory() as tmp:
+            logo_path = os.path.join(tmp, "icon.png")
+            Image.new("RGBA", (64, 64), (255, 0, 0, 255)).save(logo_path)
+            owner = types.SimpleNamespace(icon_path_qr_png=os.path.join(tmp, "missing.png"), icon_path_png=logo_path)
+
+            with patch.object(Image, "open", wraps=Image.open) as mopen, patch("os.path.exists", wraps=os.path.exists) as mexists:
+                launcher.App._build_qr_image(owner, "payload-a", size=240)
+                launcher.App._build_qr_image(owner, "payload-b", size=240)
+
+        mopen.assert_called_once()
+        self.assertEqual(mexists.call_count, 2)
+        self.assertEqual(owner._qr_logo_path, logo_path)
+        self.assertTrue(owner._qr_logo_bytes.startswith(b"\x89PNG"))
+        self.assertEqual(qr_render._logo_overlay.cache_info().currsize, 1)
+
+    def test_refresh_qr_code_app_mode_falls_back_to_compact_json(self):
+        """Validate scenario: app-mode QR without usable links should encode the payload as compact JSON."""
+        rendered = []
+        owner = _make_qr_owner({"payload": {"type": "cyberdeck_qr_v1", "name": "ПК"}, "url": ""}, rendered)
+
+        launcher.App.refresh_qr_code(owner, force=True)
+
+        self.assertEqual(rendered, ['{"type":"cyberdeck_qr_v1","name":"ПК"}'])
+        self.assertFalse(owner._qr_fetch_inflight)
+
+    def test_refresh_qr_code_skips_render_for_unchanged_heartbeat(self):
+        """Validate scenario: periodic QR refresh with the same payload should skip rendering unless forced."""
+        rendered = []
+        owner = _make_qr_owner({"payload": {}, "url": "http://10.0.0.2:8080/"}, rendered)
+        owner.settings = {"qr_mode": "site"}
+        owner._qr_last_state_signature = ("", "", "", "")
+        owner._qr_last_text = "http://10.0.0.2:8080/"
+        owner._qr_tk_img = object()
+        owner._qr_shown_label = owner.lbl_qr
+
+        launcher.App.refresh_qr_code(owner)
+        self.assertEqual(rendered, [])
+        self.assertGreater(owner._qr_next_fetch_ts, 0.0)
+
+        launcher.App.refresh_qr_code(owner, force=True)
+        self.assertEqual(rendered, ["http://10.0.0.2:8080/"])
+
+    def test_qr_heartbeat_backs_off_while_stable_and_resets_on_force(self):
+        """Validate scenario: QR heartbeat should double while state is stable, stay under token TTL and reset on force."""
+        from cyberdeck.launcher import app_devices
+
+        with patch.object(app_devices.server_config, "QR_TOKEN_TTL_S", 600):
+            self.assertEqual([app_devices._qr_refresh_interval_s(n) for n in range(5)], [30.0, 60.0, 120.0, 240.0, 300.0])
+        with patch.object(app_devices.server_config, "QR_TOKEN_TTL_S", 120):
+            self.assertEqual([app_devices._qr_refresh_interval_s(n) for n in range(3)], [30.0, 60.0, 60.0])
+
+        owner = _make_qr_owner({"payload": {}, "url": "http://10.0.0.2:8080/"}, [])
+        owner.settings = {"qr_mode": "site"}
+        with patch.object(app_devices.server_config, "QR_TOKEN_TTL_S", 600):
+            launcher.App.refresh_qr_code(owner, force=True)
+            first = owner._qr_next_fetch_ts - owner._qr_last_fetch_ts
+            owner._qr_next_fetch_ts = 0.0
+            launcher.App.refresh_qr_code(owner)
+            second = owner._qr_next_fetch_ts - owner._qr_last_fetch_ts
+            launcher.App.refresh_qr_code(owner, force=True)
+            reset = owner._qr_next_fetch_ts - owner._qr_last_fetch_ts
+
+        self.assertAlmostEqual(first, 30.0, places=3)
+        self.assertAlmostEqual(second, 60.0, places=3)
+        self.assertAlmostEqual(reset, 30.0, places=3)
+
+    def test_refresh_qr_code_pastes_into_existing_photo_image(self):
+        """Validate scenario: same-size QR renders should reuse the bound PhotoImage instead of creating a new one."""
+        from PIL import Image
+
+        from cyberdeck.launcher import app_devices
+
+        created = []
+
+        class _FakePhoto:
+            def __init__(self, img):
+                self.size = img.size
+                self.pasted = []
+                created.append(self)
+
+            def width(self):
+                return self.size[0]
+
+            def height(self):
+                return self.size[1]
+
+            def paste(self, img):
+                self.pasted.append(img)
+
+        owner = _make_qr_owner({"payload": {}, "url": "http://10.0.0.2:8080/?t=1"}, [])
+        owner.settings = {"qr_mode": "site"}
+        owner._build_qr_image = lambda text, **kwargs: Image.new("RGB", (240, 240))
+        owner.ui_call = lambda fn: fn()
+
+        with patch.object(app_devices, "ImageTk", types.SimpleNamespace(PhotoImage=_FakePhoto)):
+            launcher.App.refresh_qr_code(owner, force=True)
+            owner.api_client.json_dict = lambda _resp: {"payload": {}, "url": "http://10.0.0.2:8080/?t=2"}
+            launcher.App.refresh_qr_code(owner, force=True)
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(len(created[0].pasted), 1)
+        self.assertIs(owner.lbl_qr.last_config["image"], created[0])
+        self.assertEqual(owner._qr_last_text, "http://10.0.0.2:8080/?t=2")
+
+    def test_refresh_qr_code_reattaches_image_to_rebuilt_label(self):
+        """Validate scenario: recreated QR label should get the current image without waiting for a new payload."""
+        owner = _make_qr_owner({"payload": {}, "url": ""}, [])
+        owner._qr_tk_img = "photo"
+        owner._qr_shown_label = _CfgWidget()
+        owner._qr_next_fetch_ts = float("inf")
+        owner._qr_last_state_signature = ("", "", "", "")
+
+        launcher.App.refresh_qr_code(owner)
+
+        self.assertEqual(owner.lbl_qr.last_config, {"image": "photo", "text": ""})
+        self.assertIs(owner._qr_shown_label, owner.lbl_qr)
+
+    def test_selected_device_lookup_uses_token_index_rebuilt_on_new_list(self):
+        """Validate scenario: device lookup should use a token index that follows devices_data replacement."""
+        first = {"token": "tok-a", "name": "A"}
+        owner = types.SimpleNamespace(
+            devices_data=[first, {"token": "tok-a", "name": "dup"}, {"name": "no-token"}],
+            selected_token="tok-a",
+        )
+        owner._device_index = lambda: launcher.App._device_index(owner)
+
+        self.assertIs(launcher.App._get_selected_device(owner), first)
+        index = owner._devices_by_token[1]
+        self.assertIs(launcher.App._get_selected_device(owner), first)
+        self.assertIs(owner._devices_by_token[1], index)
+
+        owner.devices_data = [{"token": "tok-b"}]
+        self.assertIsNone(launcher.App._get_selected_device(owner))
+        owner.selected_token = "tok-b"
+        self.assertEqual(launcher.App._get_selected_device(owner), {"token": "tok-b"})
+
+    def test_input_lock_toggle_batches_bound_callbacks(self):
+        """Validate scenario: lock toggle should queue toast and resync as one batch of partials."""
+        resp = types.SimpleNamespace(status_code=200)
+        client = types.SimpleNamespace(
+            PRIORITY_URGENT=0,
+            submit=lambda fn, priority=None: _run_future(fn),
+            set_input_lock=lambda *args, **kwargs: resp,
+            json_dict=lambda r: {"security": {"locked": True, "reason": "launcher_lock"}},
+        )
+        toasts, syncs, redraws, batches = [], [], [], []
+        fake = types.SimpleNamespace(
+            security_state={"locked": False},
+            api_client=client,
+            settings={"language": "en"},
+            show_toast=lambda msg, level="info": toasts.append((msg, level)),
+            request_sync=syncs.append,
+            update_gui_data=lambda: redraws.append(True),
+            ui_batch=lambda *fns: batches.append(fns),
+        )
+        fake.tr = lambda key, **kw: launcher.App.tr(fake, key, **kw)
+
+        launcher.App.toggle_remote_input_lock(fake)
+
+        self.assertEqual(len(batches), 1)
+        self.assertIsInstance(batches[0][0], functools.partial)
+        for fn in batches[0]:
+            fn()
+        self.assertEqual(toasts, [(fake.tr("input_locked"), "warning")])
+        # The reply already carried the new lock state, so no follow-up sync is needed.
+        self.assertEqual(syncs, [])
+        self.assertEqual(redraws, [True])
+        self.assertTrue(fake.security_state["locked"])
+        self.assertFalse(fake._lock_inflight.is_set())
+
+    def test_panic_mode_applies_device_lists_from_reply_without_resync(self):
+        """Validate scenario: panic reply carrying device lists should redraw directly instead of resyncing."""
+        body = {
+            "revoked": 2,
+            "security": {"locked": True, "reason": "panic_mode"},
+            "devices": [{"token": "keep"}],
+            "pending_devices": [],
+        }
+        client = types.SimpleNamespace(
+            PRIORITY_URGENT=0,
+            submit=lambda fn, priority=None: _run_future(fn),
+            panic_mode=lambda **kwargs: types.SimpleNamespace(status_code=200),
+            json_dict=lambda r: body,
+        )
+        syncs, redraws, batches = [], [], []
+        fake = types.SimpleNamespace(
+            security_state={"locked": False},
+            devices_data=[{"token": "a"}, {"token": "b"}],
+            pending_devices=[{"token": "p"}],
+            api_client=client,
+            tr=lambda key, **kw: key,
+            show_toast=lambda msg, level="info": None,
+            request_sync=syncs.append,
+            update_gui_data=lambda: redraws.append(True),
+            ui_batch=lambda *fns: batches.append(fns),
+        )
+
+        with patch("cyberdeck.launcher.app_devices.messagebox.askyesno", return_value=True):
+            launcher.App.panic_mode_action(fake)
+        for fn in batches[0]:
+            fn()
+
+        self.assertEqual(fake.devices_data, [{"token": "keep"}])
+        self.assertEqual(fake.pending_devices, [])
+        self.assertTrue(fake.security_state["locked"])
+        self.assertEqual((syncs, redraws), ([], [True]))
+
+        del body["devices"]
+        batches.clear()
+        with patch("cyberdeck.launcher.app_devices.messagebox.askyesno", return_value=True):
+            launcher.App.panic_mode_action(fake)
+        for fn in batches[0]:
+            fn()
+        self.assertEqual(syncs, [150])
+
+    def test_send_file_reopens_dialog_in_last_successful_directory(self):
+        """Validate scenario: file picker should start in the folder of the last file that was sent."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        sent_path = os.path.join(tmp.name, "clip.bin")
+        with open(sent_path, "wb") as fh:
+            fh.write(b"x")
+        client = types.SimpleNamespace(
+            PRIORITY_NORMAL=10,
+            submit=lambda fn, priority=None: _run_future(fn),
+            trigger_file=lambda payload, timeout=None: types.SimpleNamespace(status_code=200),
+            json_dict=lambda r: {"ok": True},
+        )
+        fake = types.SimpleNamespace(
+            selected_token="tok",
+            api_client=client,
+            tr=lambda key, **kw: key,
+            ui_call=lambda fn: None,
+            ui_batch=lambda *fns: None,
+            _apply_status=lambda text, color: None,
+            show_toast=lambda msg, level="info": None,
+        )
+
+        with patch("cyberdeck.launcher.app_devices.filedialog.askopenfilename", return_value=sent_path) as mdlg:
+            launcher.App.send_file(fake)
+            launcher.App.send_file(fake)
+
+        self.assertNotIn("initialdir", mdlg.call_args_list[0].kwargs)
+        self.assertEqual(mdlg.call_args_list[1].kwargs.get("initialdir"), os.path.dirname(sent_path))
+
+    def test_send_file_checks_path_and_skips_duplicate_before_api_call(self):
+        """Validate scenario: missing files and an immediate resend should not reach the transfer API."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "photo.jpg")
+        with open(path, "wb") as fh:
+            fh.write(b"jpeg")
+        calls, toasts = [], []
+        client = types.SimpleNamespace(
+            PRIORITY_NORMAL=10,
+            submit=lambda fn, priority=None: _run_future(fn),
+            trigger_file=lambda payload, timeout=None: calls.append(payload) or types.SimpleNamespace(status_code=200),
+            json_dict=lambda r: {"ok": True},
+        )
+        fake = types.SimpleNamespace(
+            selected_token="tok",
+            api_client=client,
+            tr=lambda key, **kw: key,
+            ui_call=lambda fn: fn(),
+            ui_batch=lambda *fns: [fn() for fn in fns],
+            _apply_status=lambda text, color: None,
+            show_toast=lambda msg, level="info": toasts.append(msg),
+        )
+
+        dialog = "cyberdeck.launcher.app_devices.filedialog.askopenfilename"
+        with patch(dialog, return_value=os.path.join(tmp.name, "gone.jpg")):
+            launcher.App.send_file(fake)
+        self.assertEqual((calls, toasts), ([], ["toast_transfer_error"]))
+
+        with patch(dialog, return_value=path):
+            launcher.App.send_file(fake)
+            launcher.App.send_file(fake)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(toasts[-1], "toast_transfer_duplicate")
+
+        fake.selected_token = "other"
+        with patch(dialog, return_value=path):
+            launcher.App.send_file(fake)
+        self.assertEqual(len(calls), 2)
+
+    def test_input_lock_toggle_ignores_clicks_while_request_in_flight(self):
+        """Validate scenario: repeated lock clicks should not queue another request until the first finishes."""
+        from concurrent.futures import Future
+
+        queued = []
+
+        def _submit(fn, priority=None):
+            queued.append(fn)
+            return Future()
+
+        fake = types.SimpleNamespace(
+            security_state={"locked": False},
+            api_client=types.SimpleNamespace(PRIORITY_URGENT=0, submit=_submit),
+        )
+
+        launcher.App.toggle_remote_input_lock(fake)
+        launcher.App.toggle_remote_input_lock(fake)
+        self.assertEqual(len(queued), 1)
+
+        fake._lock_inflight.clear()
+        launcher.App.toggle_remote_input_lock(fake)
+        self.assertEqual(len(queued), 2)
+
+    def test_parse_security_response_normalizes_state_and_rejects_errors(self):
+        """Validate scenario: security replies should map to launcher state; non-200 should raise."""
+        from cyberdeck.launcher.app_devices import _parse_security_response
+
+        client = types.SimpleNamespace(
+            json_dict=lambda r: r.body,
+            describe_api_error=lambda r: "denied",
+        )
+        ok = types.SimpleNamespace(status_code=200, body={"revoked": 2, "security": {"locked": 1, "reason": None}})
+        body, state = _parse_security_response(client, ok, locked=False, reason="panic_mode", actor="launcher")
+        self.assertEqual(body["revoked"], 2)
+        self.assertEqual(state, {"locked": True, "reason": "panic_mode", "actor": "launcher", "updated_ts": 0.0})
+
+        bare = types.SimpleNamespace(status_code=200, body={"ok": True})
+        self.assertEqual(_parse_security_response(client, bare, locked=True, reason="", actor="x"), ({"ok": True}, None))
+
+        with self.assertRaisesRegex(RuntimeError, "denied"):
+            _parse_security_response(client, types.SimpleNamespace(status_code=403), locked=True, reason="", actor="x")
 
     def test_set_device_settings_dirty_controls_buttons_and_status(self):
         """Validate scenario: test set device settings dirty controls buttons and status."""
@@ -197,6 +700,26 @@ class LauncherUiLogicTests(unittest.TestCase):
         self.assertEqual(fake.btn_save_device_settings.last_config.get("state"), "disabled")
         self.assertEqual(fake.btn_reset_device_settings.last_config.get("state"), "disabled")
 
+    def test_set_device_settings_dirty_skips_unchanged_configure(self):
+        """Validate scenario: repeating the same dirty state should not reconfigure the widgets."""
+        fake = types.SimpleNamespace(
+            selected_token="token-1",
+            _device_settings_dirty=False,
+            btn_save_device_settings=_CfgWidget(),
+            btn_reset_device_settings=_CfgWidget(),
+            lbl_device_dirty=_CfgWidget(),
+            lbl_status=_CfgWidget(),
+        )
+        calls = []
+        fake.btn_save_device_settings.configure = lambda **kw: calls.append(kw)
+
+        launcher.App._set_device_settings_dirty(fake, True)
+        launcher.App._set_device_settings_dirty(fake, True)
+        self.assertEqual(calls, [{"state": "normal"}])
+
+        launcher.App._set_device_settings_dirty(fake, False)
+        self.assertEqual(calls, [{"state": "normal"}, {"state": "disabled"}])
+
     def test_sync_device_list_updates_only_changed_rows(self):
         """Validate scenario: test sync device list updates only changed rows."""
         # Test body is intentionally explicit so regressions are easy to diagnose.
@@ -259,6 +782,184 @@ class LauncherUiLogicTests(unittest.TestCase):
         self.assertEqual(rows["a"]["row"].destroy_calls, 1)
         self.assertEqual(fake._device_row_order, ["b"])
 
+    def test_select_frame_touches_only_outgoing_and_incoming_tabs(self):
+        """Validate scenario: tab switch should re-grid and restyle just the two affected tabs."""
+
+        class _Frame(_GridWidget):
+            def grid_forget(self):
+                """Count grid_forget() calls."""
+                self.grid_remove_calls += 1
+
+        fake = types.SimpleNamespace(
+            home_frame=_Frame(),
+            devices_frame=_Frame(),
+            settings_frame=_Frame(),
+            btn_home=_GridWidget(),
+            btn_devices=_GridWidget(),
+            btn_settings=_GridWidget(),
+        )
+
+        launcher.App.select_frame(fake, "home")
+        launcher.App.select_frame(fake, "devices")
+        launcher.App.select_frame(fake, "devices")
+
+        self.assertEqual(fake.current_frame_name, "devices")
+        self.assertEqual(fake.devices_frame.grid_calls, 1)
+        self.assertEqual(fake.home_frame.grid_remove_calls, 2)
+        self.assertEqual(fake.settings_frame.grid_remove_calls, 1)
+        self.assertEqual(fake.btn_home.last_config.get("border_width"), 0)
+        self.assertEqual(fake.btn_devices.last_config.get("border_width"), 1)
+        self.assertEqual(fake.btn_settings.last_config, {})
+
+        # A language rebuild swaps in new widgets under the same tab name.
+        fake.devices_frame = _Frame()
+        launcher.App.select_frame(fake, "devices")
+        self.assertEqual(fake.devices_frame.grid_calls, 1)
+
+    def test_help_window_is_hidden_on_close_and_reused(self):
+        """Validate scenario: closing help should hide the window so reopening skips the widget rebuild."""
+        calls = []
+        win = types.SimpleNamespace(
+            withdraw=lambda: calls.append("withdraw"),
+            destroy=lambda: calls.append("destroy"),
+            winfo_exists=lambda: True,
+            deiconify=lambda: calls.append("deiconify"),
+            lift=lambda: None,
+            focus_force=lambda: None,
+        )
+        fake = types.SimpleNamespace(_help_window=win, _schedule_capture_exclusion_refresh=lambda _ms: None)
+        fake._destroy_help_window = lambda: launcher.App._destroy_help_window(fake)
+
+        launcher.App._close_help_window(fake)
+        self.assertIs(fake._help_window, win)
+        launcher.App.show_help(fake)
+        self.assertEqual(calls, ["withdraw", "deiconify"])
+
+        launcher.App._destroy_help_window(fake)
+        self.assertIsNone(fake._help_window)
+        self.assertEqual(calls[-1], "destroy")
+
+    def test_copy_help_commands_sets_clipboard_without_forced_redraw(self):
+        """Validate scenario: copying help commands should only touch the clipboard and toast."""
+        calls = []
+        fake = types.SimpleNamespace(
+            tr=lambda key, **_kw: " diag --all " if key == "help_commands" else key,
+            clipboard_clear=lambda: calls.append("clear"),
+            clipboard_append=lambda text: calls.append(("append", text)),
+            update_idletasks=lambda: self.fail("clipboard copy should not force an idle redraw"),
+            show_toast=lambda msg, level="info": calls.append(("toast", msg, level)),
+        )
+
+        launcher.App._copy_help_commands(fake)
+
+        self.assertEqual(calls, ["clear", ("append", "diag --all"), ("toast", "help_commands_copied", "success")])
+
+    def test_ui_theme_is_shared_read_only_mapping(self):
+        """Validate scenario: tab builders should get one prebuilt, immutable theme mapping."""
+        theme = launcher.App._ui_theme(types.SimpleNamespace())
+        self.assertIs(theme, launcher.App._ui_theme(types.SimpleNamespace()))
+        self.assertIn("CyberBtn", theme)
+        with self.assertRaises(TypeError):
+            theme["COLOR_ACCENT"] = "#000000"
+
+    def test_save_settings_keeps_api_client_when_transport_unchanged(self):
+        """Validate scenario: saving unrelated settings should not reset the API client's pooled state."""
+        calls = []
+        fake = _make_settings_owner(calls)
+
+        launcher.App.save_settings_action(fake, auto=True)
+        self.assertNotIn("configure", [c[0] for c in calls if isinstance(c, tuple)])
+        self.assertIn("apply_settings", calls)
+
+        fake.port = 9090
+        launcher.App.save_settings_action(fake, auto=True)
+        self.assertIn(("configure", "http://127.0.0.1:9090/api/local", True), calls)
+
+    def test_save_settings_reads_switch_tables(self):
+        """Validate scenario: switch values should land in settings/app config, skipping widgets the tab did not build."""
+        calls = []
+        fake = _make_settings_owner(calls)
+        fake.sw_topmost = types.SimpleNamespace(get=lambda: 1)
+        fake.sw_ignore_vpn = types.SimpleNamespace(get=lambda: 1)
+        fake.sw_mdns_enabled = types.SimpleNamespace(get=lambda: self.fail("absent widget must not be read"))
+        fake._present_settings_widgets = frozenset({"sw_ignore_vpn"})
+
+        launcher.App.save_settings_action(fake, auto=True)
+
+        self.assertIs(fake.settings["always_on_top"], True)
+        self.assertIs(fake.settings["show_on_start"], True)
+        self.assertIs(fake.settings["tls_enabled"], False)
+        self.assertNotIn("system_notifications", fake.settings)
+        self.assertEqual(fake.app_config, {"ignore_vpn": True})
+
+    def test_qr_mode_change_refetches_after_server_restart(self):
+        """Validate scenario: a QR mode change that restarts the server should refetch QR once, after the restart."""
+        calls = []
+        fake = _make_settings_owner(calls)
+        fake.qr_mode_var = types.SimpleNamespace(get=lambda: "app")
+
+        launcher.App.save_settings_action(fake, auto=True)
+        self.assertIn("restart", calls)
+        self.assertNotIn("qr", calls)
+        self.assertTrue(fake._qr_refresh_after_restart)
+
+        fake.after = lambda _ms, fn: fn()
+        fake.after_cancel = lambda _job: None
+        fake.restart_server = lambda: calls.append("restarted")
+        fake._set_settings_status = lambda *_args: None
+        fake._qr_next_fetch_ts = 1e12
+        launcher.App.queue_server_restart(fake, delay_ms=0)
+
+        self.assertIn("restarted", calls)
+        self.assertFalse(fake._qr_refresh_after_restart)
+        self.assertEqual(fake._qr_next_fetch_ts, 0.0)
+
+    def test_tray_icon_is_decoded_once_per_file_version(self):
+        """Validate scenario: tray setup should reuse the decoded icon until the file changes."""
+        from PIL import Image
+
+        from cyberdeck.launcher.app_navigation import _load_tray_icon
+
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "icon.png")
+            Image.new("RGBA", (8, 8), (0, 255, 0, 255)).save(path)
+            first = _load_tray_icon(path, 1)
+            self.assertIs(_load_tray_icon(path, 1), first)
+            self.assertEqual(first.size, (8, 8))
+            Image.new("RGBA", (16, 16), (0, 255, 0, 255)).save(path)
+            self.assertEqual(_load_tray_icon(path, 2).size, (16, 16))
+
+    def test_entry_int_parses_common_inputs_and_falls_back(self):
+        """Validate scenario: integer entries should truncate decimals and fall back to default on junk."""
+        from cyberdeck.launcher.app_navigation import _entry_int
+
+        def entry(value):
+            return types.SimpleNamespace(get=lambda: value)
+
+        self.assertEqual(_entry_int(entry(" 8080 "), 1), 8080)
+        self.assertEqual(_entry_int(entry("-3.7"), 1), -3)
+        self.assertEqual(_entry_int(entry("12."), 1), 12)
+        self.assertEqual(_entry_int(entry("1e3"), 1), 1000)
+        self.assertEqual(_entry_int(entry(""), 7), 7)
+        self.assertEqual(_entry_int(entry("abc"), 7), 7)
+        self.assertEqual(_entry_int(types.SimpleNamespace(), 9), 9)
+
+    def test_setup_settings_records_optional_widget_presence(self):
+        """Validate scenario: settings build should record which optional widgets exist for the save path."""
+        fake = types.SimpleNamespace(_ui_theme=lambda: {})
+
+        def _build(app, _theme):
+            app.sw_ignore_vpn = object()
+            app.opt_language = object()
+
+        with patch("cyberdeck.launcher.app_navigation.setup_settings_ui", _build):
+            launcher.App.setup_settings(fake)
+
+        self.assertEqual(fake._present_settings_widgets, frozenset({"sw_ignore_vpn", "opt_language"}))
+        self.assertIs(launcher.App._settings_widgets_present(fake), fake._present_settings_widgets)
+        bare = types.SimpleNamespace(sw_mdns_enabled=object())
+        self.assertEqual(launcher.App._settings_widgets_present(bare), frozenset({"sw_mdns_enabled"}))
+
     def test_apply_devices_panel_layout_and_toggle(self):
         """Validate scenario: test apply devices panel layout and toggle."""
         # Test body is intentionally explicit so regressions are easy to diagnose.
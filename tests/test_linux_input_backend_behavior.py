@@ -0,0 +1,129 @@
+import os
+import types
+import unittest
+from unittest.mock import patch
+
+from cyberdeck.input.backends.linux import _EVENT_STRUCT, _WaylandBackend, _X11Backend
+
+
+class _FakeUInput:
+    def __init__(self) -> None:
+        self.events = []
+
+    def write(self, etype, code, value):
+        self.events.append((etype, code, value))
+
+    def syn(self):
+        self.events.append(("syn",))
+
+
+_FAKE_ECODES = types.SimpleNamespace(
+    EV_SYN=0,
+    SYN_REPORT=0,
+    EV_KEY=1,
+    EV_REL=2,
+    REL_X=0,
+    REL_Y=1,
+    REL_WHEEL=8,
+    BTN_LEFT=272,
+    BTN_RIGHT=273,
+)
+
+
+class WaylandInputBackendBehaviorTests(unittest.TestCase):
+    def _backend(self, *, worker: bool) -> _WaylandBackend:
+        backend = _WaylandBackend()
+        backend._loaded = True
+        backend._e = _FAKE_ECODES
+        backend._ui_mouse = _FakeUInput()
+        backend._ui_keyboard = _FakeUInput()
+        if worker:
+            backend._start_move_worker()
+        return backend
+
+    def test_rapid_moves_are_coalesced_before_click(self):
+        """Validate scenario: queued deltas should flush as one REL burst ahead of the click."""
+        backend = self._backend(worker=True)
+        backend._MOVE_COALESCE_S = 5.0
+
+        for _ in range(10):
+            self.assertTrue(backend.move_rel(2, -1))
+        self.assertTrue(backend.click("left"))
+
+        events = backend._ui_mouse.events
+        self.assertEqual(events[:3], [(2, 0, 20), (2, 1, -10), ("syn",)])
+        self.assertEqual(events[3:], [(1, 272, 1), (1, 272, 0), ("syn",)])
+
+    def test_flush_emits_pending_motion_synchronously(self):
+        """Validate scenario: explicit flush should write accumulated deltas without waiting for the timer."""
+        backend = self._backend(worker=True)
+        backend._MOVE_COALESCE_S = 5.0
+
+        backend.move_rel(4, 0)
+        backend.move_rel(-1, 2)
+        self.assertEqual(backend._ui_mouse.events, [])
+        backend.flush()
+
+        self.assertEqual(backend._ui_mouse.events, [(2, 0, 3), (2, 1, 2), ("syn",)])
+
+    def test_move_rel_writes_directly_without_worker(self):
+        """Validate scenario: backend should keep synchronous writes when coalescer is not running."""
+        backend = self._backend(worker=False)
+
+        self.assertTrue(backend.move_rel(3, 0))
+
+        self.assertEqual(backend._ui_mouse.events, [(2, 0, 3), ("syn",)])
+
+    def test_loaded_fast_paths_shadow_guarded_methods(self):
+        """Validate scenario: binding fast paths should route pointer calls past the load guard."""
+        backend = self._backend(worker=False)
+        backend._ensure = lambda: self.fail("guard should be skipped once bound")
+
+        backend._bind_loaded_fast_paths()
+
+        self.assertTrue(backend.move_rel(1, 1))
+        self.assertTrue(backend.scroll(-2))
+        self.assertEqual(backend._ui_mouse.events, [(2, 0, 1), (2, 1, 1), ("syn",), (2, 8, -2), ("syn",)])
+
+    def test_hotkey_writes_whole_burst_with_single_syscall(self):
+        """Validate scenario: press/release burst should be packed into one write on the uinput fd."""
+        backend = self._backend(worker=False)
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        backend._ui_keyboard.fd = write_fd
+        backend._key_code = lambda key: {"ctrl": 29, "v": 47}.get(key)
+
+        self.assertTrue(backend.hotkey("ctrl", "v"))
+
+        raw = os.read(read_fd, 4096)
+        events = [item[2:] for item in _EVENT_STRUCT.iter_unpack(raw)]
+        self.assertEqual(events, [(1, 29, 1), (1, 47, 1), (0, 0, 0), (1, 47, 0), (1, 29, 0), (0, 0, 0)])
+        self.assertEqual(backend._ui_keyboard.events, [])
+
+
+class X11InputBackendBehaviorTests(unittest.TestCase):
+    def test_screen_size_is_cached_and_skips_xrandr_when_xlib_answers(self):
+        """Validate scenario: repeated screen size polls should not fork xrandr."""
+        backend = _X11Backend()
+        with (
+            patch.object(_X11Backend, "_screen_size_xlib", return_value=(2560, 1440)) as mxlib,
+            patch.object(_X11Backend, "_screen_size_xrandr") as mxrandr,
+        ):
+            self.assertEqual(backend.screen_size(), (2560, 1440))
+            self.assertEqual(backend.screen_size(), (2560, 1440))
+        mxlib.assert_called_once()
+        mxrandr.assert_not_called()
+
+    def test_key_obj_uses_aliases_resolved_at_load(self):
+        """Validate scenario: named keys should map through the table resolved once at load."""
+        backend = _X11Backend()
+        backend._resolved_keys = {"enter": "KEY_ENTER", "pagedown": "KEY_PAGE_DOWN"}
+
+        self.assertEqual(backend._key_obj(" Enter "), "KEY_ENTER")
+        self.assertEqual(backend._key_obj("PAGEDOWN"), "KEY_PAGE_DOWN")
+        self.assertEqual(backend._key_obj("q"), "q")
+
+
+if __name__ == "__main__":
+    unittest.main()
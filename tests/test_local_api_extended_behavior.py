@@ -1,3 +1,6 @@
+import asyncio
+import json
+import threading
 import unittest
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -5,6 +8,7 @@ from unittest.mock import MagicMock, patch
 from fastapi import HTTPException
 
 import cyberdeck.api.local as api_local
+from cyberdeck.context import LocalEventStore
 
 
 class _Client:
@@ -14,9 +18,14 @@ class _Client:
 
 
 class _Req:
-    def __init__(self, host: str):
+    def __init__(self, host: str, disconnected: bool = False):
         """Initialize _Req state and collaborator references."""
         self.client = _Client(host)
+        self.disconnected = disconnected
+
+    async def is_disconnected(self) -> bool:
+        """Report whether the fake client has gone away."""
+        return self.disconnected
 
 
 class LocalApiExtendedBehaviorTests(unittest.TestCase):
@@ -348,6 +357,67 @@ class LocalApiExtendedBehaviorTests(unittest.TestCase):
                 api_local.local_device_disconnect(req, _Req("127.0.0.1"))
         self.assertEqual(cm.exception.status_code, 404)
 
+    def test_event_store_wait_after_wakes_on_emit(self):
+        """Validate scenario: blocked stream waiter should wake as soon as a new event is emitted."""
+        store = LocalEventStore()
+        store.emit("first")
+        cursor = store.latest_id()
+        timer = threading.Timer(0.05, lambda: store.emit("second", message="hello"))
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        out = store.wait_after(cursor, timeout=5.0)
+
+        self.assertEqual([e["type"] for e in out["events"]], ["second"])
+        self.assertEqual(out["latest_id"], cursor + 1)
+        self.assertEqual(store.wait_after(out["latest_id"], timeout=0.01)["events"], [])
+
+    def test_local_events_stream_yields_sse_frames(self):
+        """Validate scenario: stream endpoint should emit SSE frames for events after the cursor."""
+        store = LocalEventStore()
+        store.emit("old")
+        store.emit("device_connected", payload={"name": "Phone"})
+
+        async def _take(gen, n):
+            return [await gen.__anext__() for _ in range(n)]
+
+        with patch.object(api_local, "local_events", store):
+            resp = api_local.local_events_stream(_Req("127.0.0.1"), since_id=1)
+            hello, frame = asyncio.run(_take(resp.body_iterator, 2))
+        self.assertEqual(resp.media_type, "text/event-stream")
+        self.assertEqual(hello, b": connected\n\n")
+        self.assertTrue(frame.startswith(b"id: 2\ndata: "))
+        self.assertEqual(json.loads(frame.split(b"data: ", 1)[1])["payload"], {"name": "Phone"})
+
+    def test_event_store_close_streams_wakes_waiters(self):
+        """Validate scenario: closing streams should release blocked waiters until reopened."""
+        store = LocalEventStore()
+        timer = threading.Timer(0.05, store.close_streams)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        out = store.wait_after(store.latest_id(), timeout=5.0)
+
+        self.assertEqual(out["events"], [])
+        self.assertFalse(store.streams_open())
+        store.open_streams()
+        self.assertTrue(store.streams_open())
+
+    def test_local_events_stream_ends_on_disconnect_or_close(self):
+        """Validate scenario: stream generator should finish when the client leaves or streams are closed."""
+
+        async def _drain(gen):
+            return [frame async for frame in gen]
+
+        store = LocalEventStore()
+        with patch.object(api_local, "local_events", store):
+            gone = api_local.local_events_stream(_Req("127.0.0.1", disconnected=True), since_id=0)
+            self.assertEqual(asyncio.run(_drain(gone.body_iterator)), [b": connected\n\n"])
+
+            store.close_streams()
+            closed = api_local.local_events_stream(_Req("127.0.0.1"), since_id=0)
+            self.assertEqual(asyncio.run(_drain(closed.body_iterator)), [b": connected\n\n"])
+
     def test_local_device_disconnect_closes_online_socket(self):
         """Validate scenario: test local device disconnect closes online socket."""
         # Test body is intentionally explicit so regressions are easy to diagnose.
@@ -520,6 +590,8 @@ class LocalApiExtendedBehaviorTests(unittest.TestCase):
         self.assertEqual(out["ok"], True)
         self.assertEqual(out["revoked"], 3)
         self.assertEqual(out["kept"], "tok-keep")
+        self.assertIsInstance(out["devices"], list)
+        self.assertIsInstance(out["pending_devices"], list)
         mrev.assert_called_once_with(keep_token="tok-keep")
         mlock.assert_called_once()
 
@@ -1,4 +1,7 @@
 import importlib
+import os
+import subprocess
+import sys
 import unittest
 
 
@@ -38,6 +41,23 @@ class PackageLayoutImportsBehaviorTests(unittest.TestCase):
                 module = importlib.import_module(module_name)
                 self.assertIsNotNone(module)
 
+    def test_launcher_shared_defers_tray_and_browser_imports(self):
+        """Validate scenario: launcher import should not load pystray/webbrowser until they are used."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = (
+            "import sys, cyberdeck.launcher.app\n"
+            "print(','.join(m for m in ('pystray', 'webbrowser') if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        self.assertEqual(out.returncode, 0, out.stderr)
+        self.assertEqual(out.stdout.strip(), "")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,9 @@
 import importlib
 import os
+import socket
 import sys
+import tempfile
+import time
 import unittest
 from unittest.mock import patch
 
@@ -78,6 +81,74 @@ class ServerBehaviorTests(unittest.TestCase):
             ok = self.server._port_available(8080)
         self.assertFalse(ok)
 
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are unavailable")
+    def test_local_socket_listener_serves_localhost_only_routes(self):
+        """Validate scenario: Unix socket peers should pass localhost checks and the socket stays owner-only."""
+        from cyberdeck.launcher.api_client import LauncherApiClient
+
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "api.sock")
+            served = self.server.serve_local_socket(path)
+            self.assertIsNotNone(served)
+            srv, thread = served
+            self.addCleanup(thread.join, 5.0)
+            self.addCleanup(setattr, srv, "should_exit", True)
+            deadline = time.monotonic() + 5.0
+            while not srv.started and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+            self.assertIsNone(self.server._bind_local_socket(path))
+
+            client = LauncherApiClient("http://127.0.0.1:9/api/local", socket_path=path)
+            self.addCleanup(client.close)
+            resp = client.get_security_state()
+            self.assertEqual(resp.status_code, 200)
+            self.assertIn("security", resp.json())
+
+    def test_local_socket_app_trusts_only_local_api_paths(self):
+        """Validate scenario: socket peers should be rewritten to loopback only for /api/local routes."""
+        import asyncio
+
+        seen = []
+
+        async def _app(scope, receive, send):
+            seen.append((scope["path"], scope.get("client")))
+
+        with patch.object(self.server, "app", _app):
+            for path in ("/api/local/info", "/api/handshake"):
+                asyncio.run(self.server._local_socket_app({"type": "http", "path": path, "client": None}, None, None))
+
+        self.assertEqual(seen, [("/api/local/info", ("127.0.0.1", 0)), ("/api/handshake", None)])
+
+    def test_run_stops_local_socket_and_removes_file_on_exit(self):
+        """Validate scenario: run should stop the socket server and unlink its path when uvicorn returns."""
+        from cyberdeck.context import local_events
+
+        self.addCleanup(local_events.open_streams)
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "api.sock")
+            open(path, "w").close()
+            srv = type("_Srv", (), {"should_exit": False})()
+            joined = []
+            thread = type("_Thread", (), {"join": lambda self, timeout=None: joined.append(timeout)})()
+            with patch.object(self.server, "is_linux_wayland_session", return_value=False), patch.object(
+                self.server.config, "PORT_AUTO", False
+            ), patch.object(
+                self.server.config, "MDNS_ENABLED", False
+            ), patch.object(
+                self.server.config, "LOCAL_SOCKET", path
+            ), patch.object(
+                self.server, "serve_local_socket", return_value=(srv, thread)
+            ), patch.object(
+                self.server.uvicorn, "run", return_value=None
+            ):
+                self.server.run()
+
+            self.assertTrue(srv.should_exit)
+            self.assertEqual(len(joined), 1)
+            self.assertFalse(os.path.exists(path))
+
     def test_run_parses_wayland_auto_setup_boolean_words(self):
         """Validate scenario: run should parse CYBERDECK_WAYLAND_AUTO_SETUP using bool-like words."""
         with patch.dict(os.environ, {"CYBERDECK_WAYLAND_AUTO_SETUP": "off"}, clear=False), patch.object(
@@ -92,6 +163,8 @@ class ServerBehaviorTests(unittest.TestCase):
             self.server.config, "PORT_AUTO", False
         ), patch.object(
             self.server.config, "MDNS_ENABLED", False
+        ), patch.object(
+            self.server.config, "LOCAL_SOCKET", ""
         ), patch.object(
             self.server.uvicorn, "run", return_value=None
         ):
@@ -116,6 +189,8 @@ class ServerBehaviorTests(unittest.TestCase):
             self.server.config, "PORT_AUTO", False
         ), patch.object(
             self.server.config, "MDNS_ENABLED", False
+        ), patch.object(
+            self.server.config, "LOCAL_SOCKET", ""
         ), patch.object(
             self.server.uvicorn, "run", return_value=None
         ):
@@ -68,6 +68,37 @@ class WindowsInputBackendBehaviorTests(unittest.TestCase):
         args = backend._user32.mouse_event.call_args.args
         self.assertEqual(args[3], 240)
 
+    def test_click_sends_down_up_pairs_in_one_send_input_call(self):
+        """Validate scenario: WinAPI click should batch all button events into a single SendInput."""
+        backend = self._backend_with_winapi_fallback()
+        backend._user32.SendInput = MagicMock(side_effect=lambda count, batch, size: count)
+
+        ok = backend.click("left", double=True)
+
+        self.assertTrue(ok)
+        backend._user32.SendInput.assert_called_once()
+        count, batch, _ = backend._user32.SendInput.call_args.args
+        self.assertEqual(count, 4)
+        self.assertEqual([item.u.mi.dwFlags for item in batch], [0x0002, 0x0004, 0x0002, 0x0004])
+        backend._user32.mouse_event.assert_not_called()
+
+    def test_pyautogui_platform_primitives_bypass_public_wrappers(self):
+        """Validate scenario: without WinAPI, pointer calls should use pyautogui platform primitives."""
+        backend = _PyAutoGuiBackend()
+        backend._loaded = True
+        backend._pg = _FailingPyAutoGui()
+        backend._win_loaded = True
+        backend._user32 = None
+        impl = MagicMock()
+        impl._position.return_value = (10, 20)
+        backend._pg_impl = impl
+
+        self.assertTrue(backend.move_rel(3, -4))
+        self.assertTrue(backend.mouse_down("right"))
+
+        impl._moveTo.assert_called_once_with(13, 16)
+        impl._mouseDown.assert_called_once_with(10, 20, "right")
+
 
 if __name__ == "__main__":
     unittest.main()